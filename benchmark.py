@@ -0,0 +1,305 @@
+import sys
+import time
+import types
+
+from PySide6.QtWidgets import QApplication
+
+from package.resources import register_resources
+
+
+def report(name: str, iterations: int, elapsed: float) -> None:
+	"""Print the per-iteration cost of a benchmark."""
+	print(f'{name}: {elapsed / iterations * 1_000_000:.3f}us per iteration ({iterations} iterations)')
+
+
+def benchmark_tuner(iterations: int = 20000) -> None:
+	"""Measure the cost of a tuner update, cycling through notes and accuracy levels like a decaying string."""
+	from package.tuner_dialog import TunerDialog
+
+	dialog = TunerDialog(None)
+	notes = ['E2', 'A2', 'D3']
+
+	start = time.perf_counter()
+	for i in range(iterations):
+		dialog.draw_tuner(notes[(i // 50) % len(notes)], i % 5)
+	report('TunerDialog.draw_tuner', iterations, time.perf_counter() - start)
+
+
+def benchmark_tuner_history(iterations: int = 200000) -> None:
+	"""Measure the cost of recording a tuner reading in the history ring buffer."""
+	from package.tuner_history import TunerHistory
+
+	history = TunerHistory()
+
+	start = time.perf_counter()
+	for i in range(iterations):
+		history.append(start, 40, i % 5)
+	report('TunerHistory.append', iterations, time.perf_counter() - start)
+
+
+def benchmark_midi_to_note(iterations: int = 1000000) -> None:
+	"""Measure the cost of converting a MIDI note number to its name."""
+	from package.amp_midi_interface import midi_to_note
+
+	start = time.perf_counter()
+	for i in range(iterations):
+		midi_to_note(i & 127)
+	report('midi_to_note', iterations, time.perf_counter() - start)
+
+
+def benchmark_bank_decode(presets: int = 10000) -> None:
+	"""Compare decoding every field of a library one preset at a time with decoding it as one bank."""
+	import random
+
+	from package.amp_config import FIELDS, AmpConfig, decode_bank, pack_bank
+
+	payloads = [tuple(random.randrange(128) for _ in range(67)) for _ in range(presets)]
+
+	start = time.perf_counter()
+	for payload in payloads:
+		config = AmpConfig(payload)
+		tuple(getattr(config, field) for field in FIELDS)
+	report('Per-preset decode', presets, time.perf_counter() - start)
+
+	start = time.perf_counter()
+	decode_bank(pack_bank(payloads))
+	report('Bulk bank decode', presets, time.perf_counter() - start)
+
+
+def benchmark_preset_search(presets: int = 50000) -> None:
+	"""Measure a ranked fuzzy search of a large library as a query is typed one character at a time."""
+	import random
+
+	from package.amp_config import AmpConfig
+	from package.preset_search import PresetSearchIndex
+
+	words = ['Clean', 'Crunch', 'Lead', 'Solo', 'Rhythm', 'Blues', 'Metal', 'Ambient', 'Jazz', 'Funk', 'Heavy', 'Warm']
+	index = PresetSearchIndex()
+	for i in range(presets):
+		config = AmpConfig()
+		config.PRESET_NAME = f'{random.choice(words)} {random.choice(words)} {i}'
+		config.AMP_TYPE = random.randrange(15)
+		config.CABINET_TYPE = random.randrange(8)
+		config.DELAY_STATE = random.random() < 0.5
+		config.DELAY_TYPE = random.randrange(4)
+		index.add(config)
+
+	query = 'crnch delay'
+	start = time.perf_counter()
+	for length in range(1, len(query) + 1):
+		index.search(query[:length])
+	report(f'PresetSearchIndex.search over {presets} presets', len(query), time.perf_counter() - start)
+
+	# A pasted token holding every letter, which can match a word while missing the most characters
+	start = time.perf_counter()
+	index.search('thequickbrownfoxjumpsoverthelazydog')
+	report('PresetSearchIndex.search for a pasted token', 1, time.perf_counter() - start)
+
+
+def benchmark_similar_presets(presets: int = 50000, iterations: int = 1000) -> None:
+	"""Measure finding the ten presets closest to a preset in a large library."""
+	import random
+
+	from package.amp_config import AmpConfig
+	from package.preset_similarity import PresetSimilarityIndex
+
+	index = PresetSimilarityIndex()
+	for _ in range(presets):
+		index.add(AmpConfig(bytes(random.randrange(101) for _ in range(67))))
+
+	start = time.perf_counter()
+	for i in range(iterations):
+		index.nearest(i % presets, 10)
+	report(f'PresetSimilarityIndex.nearest over {presets} presets', iterations, time.perf_counter() - start)
+
+
+def benchmark_midi_bridge(iterations: int = 100000) -> None:
+	"""Measure the latency the foot controller bridge adds to each message, sending to a port that discards it."""
+	import threading
+
+	import mido
+
+	from package.midi_bridge import MIDIBridge
+
+	class NullPort:
+		def send(self, msg) -> None:
+			pass
+
+	class NullInterface:
+		def __init__(self):
+			self.port = NullPort()
+			self.send_lock = threading.RLock()
+
+		def send_message(self, msg) -> bool:
+			with self.send_lock:
+				self.port.send(msg)
+			return True
+
+		def send_messages(self, messages) -> bool:
+			with self.send_lock:
+				return all(self.send_message(msg) for msg in messages)
+
+	# Messages are handed to the bridge directly rather than through a controller port
+	bridge = MIDIBridge(NullInterface(), [
+		{'control': 20, 'program': None},
+		{'control': 21, 'field': 'GAIN', 'minimum': 0, 'maximum': 100},
+		{'control': 22, 'field': 'DELAY_P1', 'minimum': 0, 'maximum': 4000}
+	])
+
+	messages = [mido.Message('control_change', control=20 + i % 4, value=i % 128) for i in range(512)]
+	for i in range(iterations):
+		bridge.handle_message(messages[i % len(messages)])
+
+	count, mean_latency, maximum_latency = bridge.latency_stats()
+	print(f'MIDIBridge.handle_message: {mean_latency * 1_000_000:.3f}us mean, {maximum_latency * 1_000_000:.3f}us worst '
+		f'({count} messages)')
+
+
+def benchmark_automation_playback(events: int = 500, spacing: float = 0.002) -> None:
+	"""Measure how late automation events are sent, idle and while the main thread keeps running Python code."""
+	from package.automation import AutomationPlayer
+
+	recording = [(i * spacing, 1 + i % 8, i % 128) for i in range(events)]
+
+	for load in (False, True):
+		player = AutomationPlayer(recording, lambda control_id, value: None)
+		player.start()
+		while load and player.is_alive():
+			sum(range(1000))
+		player.join()
+
+		count, mean_error, maximum_error = player.timing_stats()
+		print(f'AutomationPlayer ({"main thread busy" if load else "idle"}): {mean_error * 1_000_000:.3f}us mean, '
+			f'{maximum_error * 1_000_000:.3f}us worst ({count} events)')
+
+
+def benchmark_preset_morph(duration: float = 0.25) -> None:
+	"""Measure the messages a quick morph sends, against sending every interpolated change without a budget."""
+	import random
+
+	from package.amp_config import AmpConfig
+	from package.amp_patch import compile_patch
+	from package.preset_morph import MORPH_STEP, PresetMorph, morph_config
+
+	old = AmpConfig(bytes(random.randrange(101) for _ in range(67)))
+	new = AmpConfig(bytes(old.data))
+	for field in ('GAIN', 'BASS', 'MIDDLE', 'TREBLE', 'VOLUME', 'PRESENCE', 'RESONANCE', 'GATE_THRESHOLD',
+			'MODULATION_P2', 'MODULATION_P3', 'REVERB_P1', 'REVERB_P2', 'REVERB_P3', 'REVERB_P4'):
+		setattr(new, field, random.randrange(101))
+	new.DELAY_P1 = random.randrange(4001)
+	new.PEDAL_TYPE = (old.PEDAL_TYPE + 1) % 4
+
+	sent_times = []
+	morph = PresetMorph(old, new, duration, lambda control_id, value: sent_times.append(time.perf_counter()))
+	morph.run()
+
+	unbudgeted = 0
+	unbudgeted_peak = 0
+	previous = old
+	for step in range(1, int(duration / MORPH_STEP) + 1):
+		config = morph_config(old, new, step * MORPH_STEP / duration)
+		patch = compile_patch(previous, config)
+		unbudgeted += len(patch)
+		unbudgeted_peak = max(unbudgeted_peak, len(patch))
+		previous = config
+
+	# The most messages sent within any millisecond, counted from each message in turn
+	peak = 0
+	first = 0
+	for last, sent_time in enumerate(sent_times):
+		while sent_time - sent_times[first] >= 0.001:
+			first += 1
+		peak = max(peak, last - first + 1)
+
+	print(f'PresetMorph: {morph.message_count} messages over {morph.step_count} steps in {morph.elapsed:.3f}s, '
+		f'at most {peak} in any millisecond ({unbudgeted} messages and at most {unbudgeted_peak} per step without a budget)')
+
+
+def benchmark_tempo_sync(beats: int = 1000, jitter: float = 0.002) -> None:
+	"""Measure the delay time updates sent while following a jittery 120 BPM MIDI clock, and the cost of each tick."""
+	import random
+
+	from package.amp_config import AmpConfig
+	from package.tempo import CLOCK_TICKS_PER_BEAT, ClockTempo, DelayTempoSync, delay_time
+
+	class NullInterface:
+		def __init__(self):
+			self.main = types.SimpleNamespace(amp_config=AmpConfig())
+
+		def send_messages(self, messages) -> bool:
+			return True
+
+	tick_interval = 0.5 / CLOCK_TICKS_PER_BEAT
+	ticks = [i * tick_interval + random.uniform(-jitter, jitter) for i in range(beats * CLOCK_TICKS_PER_BEAT)]
+
+	sync = DelayTempoSync(NullInterface())
+	clock = ClockTempo()
+	sent_delay_times = []
+	start = time.perf_counter()
+	for tick in ticks:
+		beat = clock.tick(tick)
+		if beat is not None and sync.update(beat):
+			sent_delay_times.append(sync.delay_time)
+	report('ClockTempo.tick and DelayTempoSync.update', len(ticks), time.perf_counter() - start)
+
+	# Without filtering, every tick would give a tempo from its own interval
+	unfiltered = {delay_time((later - earlier) * CLOCK_TICKS_PER_BEAT) for earlier, later in zip(ticks, ticks[1:])}
+	print(f'DelayTempoSync: {len(sent_delay_times)} updates sent over {beats} beats, delay times {min(sent_delay_times)}-'
+		f'{max(sent_delay_times)}ms (tick to tick estimates range {min(unfiltered)}-{max(unfiltered)}ms)')
+
+
+def benchmark_edit_history(edits: int = 50000) -> None:
+	"""Measure committing undo entries for dial drags, and the memory the history holds as a session goes on."""
+	import random
+	import tracemalloc
+
+	from package.amp_config import AmpConfig
+	from package.edit_history import EditHistory
+
+	config = AmpConfig(bytes(random.randrange(101) for _ in range(67)))
+	history = EditHistory()
+	history.commit(config)
+	dials = ('GAIN', 'BASS', 'MIDDLE', 'TREBLE', 'VOLUME', 'PRESENCE', 'RESONANCE', 'REVERB_P1')
+
+	def drag(edit: int) -> None:
+		# Each edit is a drag of one dial through 20 values, committed once it is released
+		dial = dials[edit % len(dials)]
+		for _ in range(20):
+			setattr(config, dial, random.randrange(101))
+
+	elapsed = 0.0
+	for i in range(edits):
+		drag(i)
+		start = time.perf_counter()
+		history.commit(config)
+		elapsed += time.perf_counter() - start
+	report('EditHistory.commit', edits, elapsed)
+
+	tracemalloc.start()
+	memory = []
+	for i in range(edits):
+		drag(i)
+		history.commit(config)
+		if i + 1 in (edits // 10, edits):
+			memory.append(tracemalloc.get_traced_memory()[0])
+	tracemalloc.stop()
+
+	print(f'EditHistory: {len(history.undo_entries)} entries kept, {memory[0] / 1024:.1f}KiB allocated after '
+		f'{edits // 10} more edits and {memory[1] / 1024:.1f}KiB after {edits}')
+
+
+if __name__ == '__main__':
+	app = QApplication(sys.argv)
+	register_resources()
+
+	benchmark_tuner()
+	benchmark_tuner_history()
+	benchmark_midi_to_note()
+	benchmark_bank_decode()
+	benchmark_preset_search()
+	benchmark_similar_presets()
+	benchmark_midi_bridge()
+	benchmark_automation_playback()
+	benchmark_preset_morph()
+	benchmark_tempo_sync()
+	benchmark_edit_history()
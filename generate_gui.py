@@ -1,29 +1,100 @@
-import fileinput
+import glob
+import hashlib
+import json
 import os
 import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ThreadPoolExecutor
 
-# Generate the UI files
-cwd = os.getcwd()
-generate_ui_command = f"pyside6-uic {cwd}\\designer\\main_window.ui > {cwd}\\package\\ui\\main_window_ui.py"
-subprocess.run(generate_ui_command, shell=True)
-generate_ui_command = f"pyside6-uic {cwd}\\designer\\about_dialog.ui > {cwd}\\package\\ui\\about_dialog_ui.py"
-subprocess.run(generate_ui_command, shell=True)
-generate_ui_command = f"pyside6-uic {cwd}\\designer\\tuner_dialog.ui > {cwd}\\package\\ui\\tuner_dialog_ui.py"
-subprocess.run(generate_ui_command, shell=True)
-
-# Generate the resources file
-generate_resources_command = f"pyside6-rcc {cwd}\\resources.qrc -o {cwd}\\package\\ui\\resources_rc.py"
-subprocess.run(generate_resources_command, shell=True)
-
-# Replace the import statement in the generated UI files to respect package location
-with fileinput.FileInput(f"{cwd}\\package\\ui\\main_window_ui.py", inplace=True) as file:
-	for line in file:
-		print(line.replace("import resources_rc", "import package.ui.resources_rc"), end='')
-
-with fileinput.FileInput(f"{cwd}\\package\\ui\\about_dialog_ui.py", inplace=True) as file:
-	for line in file:
-		print(line.replace("import resources_rc", "import package.ui.resources_rc"), end='')
-
-with fileinput.FileInput(f"{cwd}\\package\\ui\\tuner_dialog_ui.py", inplace=True) as file:
-	for line in file:
-		print(line.replace("import resources_rc", "import package.ui.resources_rc"), end='')
+SOURCE_QRC = 'resources.qrc'
+BUILD_DIRECTORY = 'build'
+MANIFEST_FILE = os.path.join(BUILD_DIRECTORY, 'generate_gui.json')
+RESOURCES_OUTPUT = os.path.join('package', 'ui', 'resources.rcc')
+
+
+def hash_files(paths: list) -> str:
+	"""Hash the contents of a list of files together."""
+	content_hash = hashlib.sha256()
+	for path in paths:
+		content_hash.update(path.replace(os.sep, '/').encode())
+		with open(path, 'rb') as file:
+			content_hash.update(file.read())
+
+	return content_hash.hexdigest()
+
+
+def generate_ui(source: str, output: str) -> None:
+	"""Compile a designer file and fix up its resources import in the same pass."""
+	result = subprocess.run(['pyside6-uic', source], check=True, capture_output=True, text=True)
+
+	# The resources are registered at runtime by package.resources, they are no longer a Python module
+	lines = [line for line in result.stdout.splitlines(keepends=True) if line.strip() != 'import resources_rc']
+	with open(output, 'w', newline='\n') as file:
+		file.writelines(lines)
+
+
+def generate_resources(output: str) -> None:
+	"""Compile the resources into a binary resources file."""
+	subprocess.run(['pyside6-rcc', '--binary', SOURCE_QRC, '-o', output], check=True)
+
+
+def find_build_steps() -> list:
+	"""List every build step as its output, its inputs and the function that produces it."""
+	designer_files = sorted(glob.glob(os.path.join('designer', '*.ui')))
+
+	steps = []
+	for source in designer_files:
+		name = os.path.splitext(os.path.basename(source))[0]
+		output = os.path.join('package', 'ui', f'{name}_ui.py')
+		steps.append((output, [source], lambda source=source, output=output: generate_ui(source, output)))
+
+	resource_files = [file.text for file in ElementTree.parse(SOURCE_QRC).getroot().iter('file')]
+	resource_inputs = [SOURCE_QRC, *resource_files]
+	steps.append((RESOURCES_OUTPUT, resource_inputs, lambda: generate_resources(RESOURCES_OUTPUT)))
+
+	return steps
+
+
+def generate_gui() -> None:
+	"""Regenerate every output whose inputs changed since the last build, running the steps concurrently."""
+	start = time.perf_counter()
+
+	manifest = {}
+	if os.path.exists(MANIFEST_FILE):
+		with open(MANIFEST_FILE, 'r') as file:
+			manifest = json.load(file)
+
+	steps = find_build_steps()
+	stale_steps = []
+	for output, inputs, build in steps:
+		key = output.replace(os.sep, '/')
+		input_hash = hash_files(inputs)
+		if manifest.get(key) != input_hash or not os.path.exists(output):
+			stale_steps.append((key, input_hash, build))
+
+	failed = False
+	with ThreadPoolExecutor() as executor:
+		futures = [(key, input_hash, executor.submit(build)) for key, input_hash, build in stale_steps]
+		for key, input_hash, future in futures:
+			try:
+				future.result()
+				manifest[key] = input_hash
+				print(f'Generated {key}')
+			except (subprocess.CalledProcessError, OSError, ValueError) as e:
+				failed = True
+				manifest.pop(key, None)
+				print(f'Failed to generate {key}: {e}', file=sys.stderr)
+
+	os.makedirs(BUILD_DIRECTORY, exist_ok=True)
+	with open(MANIFEST_FILE, 'w') as file:
+		json.dump(manifest, file, indent=4, sort_keys=True)
+
+	print(f'{len(stale_steps)} of {len(steps)} outputs regenerated in {(time.perf_counter() - start) * 1000:.0f}ms')
+	if failed:
+		sys.exit(1)
+
+
+if __name__ == '__main__':
+	generate_gui()
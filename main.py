@@ -3,9 +3,11 @@ import sys
 from PySide6.QtWidgets import QApplication
 
 from package.app import AmpInterfaceWindow
+from package.resources import register_resources
 
 if __name__ == "__main__":
 	app = QApplication(sys.argv)
+	register_resources()
 	window = AmpInterfaceWindow()
 	window.show()
 	sys.exit(app.exec())
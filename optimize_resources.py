@@ -1,20 +1,93 @@
+import hashlib
+import json
 import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 
-png_file_locations = []
-for root, dirs, files in os.walk('resources'):
-	for file in files:
-		if file.endswith('.png'):
-			png_file_locations.append(os.path.join(root, file))
+SCRIPT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_FILE = os.path.join(SCRIPT_DIRECTORY, '.optimize_manifest.json')
+OPTIMIZER_ARGUMENTS = ['-q', '-o7', '-zm1-9', '-strip', 'all']
 
-total_bytes = 0
-for image in png_file_locations:
-	old_file_size = os.path.getsize(f'{image}')
-	total_bytes += old_file_size
 
-	os.system(f'optipng.exe -q -o7 -zm1-9 -strip all {image}')
+def find_optimizer() -> str:
+	"""Find the optipng binary on the PATH or next to this script."""
+	optimizer = shutil.which('optipng') or shutil.which('optipng', path=SCRIPT_DIRECTORY)
+	if optimizer is None:
+		raise FileNotFoundError('Unable to find optipng. Install it or place it next to this script.')
 
-	new_file_size = os.path.getsize(f'{image}')
-	if old_file_size > new_file_size:
-		print(f'Reduced {image} from {old_file_size} bytes to {new_file_size} bytes.')
+	return optimizer
 
-print(f'Total bytes saved: {total_bytes - sum([os.path.getsize(f"{image}") for image in png_file_locations])}')
+
+def hash_file(path: str) -> str:
+	"""Hash the contents of a file."""
+	with open(path, 'rb') as file:
+		return hashlib.sha256(file.read()).hexdigest()
+
+
+def optimize_image(optimizer: str, image: str) -> tuple:
+	"""Optimize a single image, returning its path, old size, new size, time taken and new content hash."""
+	start = time.perf_counter()
+	old_file_size = os.path.getsize(image)
+
+	subprocess.run([optimizer, *OPTIMIZER_ARGUMENTS, image], check=True)
+
+	return image, old_file_size, os.path.getsize(image), time.perf_counter() - start, hash_file(image)
+
+
+def optimize_resources(directories: list) -> None:
+	"""Optimize every changed PNG in the given directories across all cores."""
+	start = time.perf_counter()
+	optimizer = find_optimizer()
+
+	manifest = {}
+	if os.path.exists(MANIFEST_FILE):
+		with open(MANIFEST_FILE, 'r') as file:
+			manifest = json.load(file)
+
+	png_file_locations = []
+	for directory in directories:
+		for root, dirs, files in os.walk(directory):
+			for file in files:
+				if file.endswith('.png'):
+					png_file_locations.append(os.path.join(root, file))
+
+	# Images whose content matches the hash recorded after their last optimization are already done. The manifest is
+	# keyed by paths relative to this script, so it holds wherever the script is run from
+	def manifest_key(image: str) -> str:
+		return os.path.relpath(image, SCRIPT_DIRECTORY).replace(os.sep, '/')
+
+	stale_images = [image for image in png_file_locations if manifest.get(manifest_key(image)) != hash_file(image)]
+	print(f'Optimizing {len(stale_images)} of {len(png_file_locations)} images.')
+
+	total_bytes_saved = 0
+	failed = False
+	with ProcessPoolExecutor() as executor:
+		futures = [(image, executor.submit(optimize_image, optimizer, image)) for image in stale_images]
+		for image, future in futures:
+			# A failed image is left out of the manifest so it is retried, without losing the images that succeeded
+			try:
+				image, old_file_size, new_file_size, elapsed, content_hash = future.result()
+			except (subprocess.CalledProcessError, OSError) as e:
+				failed = True
+				manifest.pop(manifest_key(image), None)
+				print(f'Failed to optimize {image}: {e}', file=sys.stderr)
+				continue
+
+			manifest[manifest_key(image)] = content_hash
+			total_bytes_saved += old_file_size - new_file_size
+			print(f'{image}: {old_file_size} -> {new_file_size} bytes '
+				f'({old_file_size - new_file_size} saved) in {elapsed:.2f}s')
+
+	with open(MANIFEST_FILE, 'w') as file:
+		json.dump(manifest, file, indent=4, sort_keys=True)
+
+	print(f'Total bytes saved: {total_bytes_saved} in {time.perf_counter() - start:.2f}s')
+	if failed:
+		sys.exit(1)
+
+
+if __name__ == '__main__':
+	optimize_resources(sys.argv[1:] or [os.path.join(SCRIPT_DIRECTORY, 'resources')])
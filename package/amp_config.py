@@ -1,176 +1,264 @@
+import hashlib
+import struct
+from collections import namedtuple
+from typing import Iterable, List
+
+# A preset SysEx message holds the slot number at 8, the name at 9-26 and the settings from 28 onwards
+SYSEX_LENGTH = 67
+NAME_OFFSET = 9
+NAME_LENGTH = 18
+SETTINGS_OFFSET = 28
+
+# The full-scale value of the dials and effect parameters, and of the delay time in milliseconds
+DIAL_MAXIMUM = 100
+DELAY_TIME_MAXIMUM = 4000
+
+# The layout of a preset record: slot number, name, then one byte per setting with DELAY_P1 as an MSB and LSB pair
+RECORD_STRUCT = struct.Struct(f'8xB{NAME_LENGTH}sx{SYSEX_LENGTH - SETTINGS_OFFSET}B')
+
+
+def decode_name(name: bytes) -> str:
+	"""Decode the name bytes of a preset."""
+	return name.decode('latin-1').rstrip('\x00').strip()
+
+
+def byte_field(offset: int) -> property:
+	"""Create a property reading and writing a single byte of the SysEx data."""
+	def getter(self) -> int:
+		return self.data[offset]
+
+	def setter(self, value: int) -> None:
+		# Lists report a row of -1 when nothing is selected, which is not a setting to store
+		if value == -1:
+			return
+		self.writable_data()[offset] = value
+
+	return property(getter, setter)
+
+
+def bool_field(offset: int) -> property:
+	"""Create a property reading and writing a single byte of the SysEx data as a boolean."""
+	def getter(self) -> bool:
+		return self.data[offset] == 1
+
+	def setter(self, value: bool) -> None:
+		self.writable_data()[offset] = 1 if value else 0
+
+	return property(getter, setter)
+
+
+def msb_lsb_field(offset: int) -> property:
+	"""Create a property reading and writing a value split into an MSB and LSB byte of the SysEx data."""
+	def getter(self) -> int:
+		return (self.data[offset] * 128) + self.data[offset + 1]
+
+	def setter(self, value: int) -> None:
+		data = self.writable_data()
+		data[offset], data[offset + 1] = divmod(value, 128)
+
+	return property(getter, setter)
+
+
 class AmpConfig:
+	"""
+	An amp configuration, stored as the raw SysEx data of a preset.
+
+	The fields are views over the data, so loading a preset does not copy or decode anything. Data loaded from an
+	immutable buffer is only copied the first time a field is modified.
+	"""
+
+	__slots__ = ('data',)
+
+	PRESET_NUMBER = byte_field(8)
+	GAIN = byte_field(28)
+	BASS = byte_field(29)
+	MIDDLE = byte_field(30)
+	TREBLE = byte_field(31)
+	VOLUME = byte_field(32)
+	PEDAL_STATE = byte_field(33)
+	PEDAL_TYPE = byte_field(34)
+	PEDAL_P1 = byte_field(35)
+	PEDAL_P2 = byte_field(36)
+	PEDAL_P3 = byte_field(37)
+	PEDAL_P4 = byte_field(38)
+	AMP_STATE = bool_field(39)
+	AMP_TYPE = byte_field(40)
+	GATE_THRESHOLD = byte_field(41)
+	MODULATION_STATE = bool_field(42)
+	MODULATION_TYPE = byte_field(43)
+	MODULATION_P1 = byte_field(44)
+	MODULATION_P2 = byte_field(45)
+	MODULATION_P3 = byte_field(46)
+	MODULATION_P4 = byte_field(47)
+	DELAY_STATE = bool_field(48)
+	DELAY_TYPE = byte_field(49)
+	DELAY_P1 = msb_lsb_field(50)   # Time in MS, requires MSB/LSB to be set
+	DELAY_P2 = byte_field(52)
+	DELAY_P3 = byte_field(53)
+	DELAY_P4 = byte_field(54)
+	REVERB_STATE = bool_field(55)
+	REVERB_TYPE = byte_field(56)
+	REVERB_P1 = byte_field(57)
+	REVERB_P2 = byte_field(58)
+	REVERB_P3 = byte_field(59)
+	REVERB_P4 = byte_field(60)
+	POWER_AMP_STATE = bool_field(61)
+	POWER_AMP_TYPE = byte_field(62)
+	CABINET_STATE = bool_field(63)
+	CABINET_TYPE = byte_field(64)
+	RESONANCE = byte_field(65)
+	PRESENCE = byte_field(66)
+
+	def __init__(self, data=None):
+		if data is None:
+			self.data = bytearray(SYSEX_LENGTH)
+		else:
+			self.load_from_sysex(data)
 
-	PRESET_NAME: str = ""
-	PRESET_NUMBER: int = 0
-	GAIN: int = 0
-	BASS: int = 0
-	MIDDLE: int = 0
-	TREBLE: int = 0
-	VOLUME: int = 0
-	PEDAL_STATE: int = 0
-	PEDAL_TYPE: int = 0
-	PEDAL_P1: int = 0
-	PEDAL_P2: int = 0
-	PEDAL_P3: int = 0
-	PEDAL_P4: int = 0
-	AMP_STATE: bool = False
-	AMP_TYPE: int = 0
-	GATE_THRESHOLD: int = 0
-	MODULATION_STATE: bool = False
-	MODULATION_TYPE: int = 0
-	MODULATION_P1: int = 0
-	MODULATION_P2: int = 0
-	MODULATION_P3: int = 0
-	MODULATION_P4: int = 0
-	DELAY_STATE: bool = False
-	DELAY_TYPE: int = 0
-	DELAY_P1: int = 0   # Time in MS, requires MSB/LSB to be set
-	DELAY_P2: int = 0
-	DELAY_P3: int = 0
-	DELAY_P4: int = 0
-	REVERB_STATE: bool = False
-	REVERB_TYPE: int = 0
-	REVERB_P1: int = 0
-	REVERB_P2: int = 0
-	REVERB_P3: int = 0
-	REVERB_P4: int = 0
-	POWER_AMP_STATE: bool = False
-	POWER_AMP_TYPE: int = 0
-	CABINET_STATE: bool = False
-	CABINET_TYPE: int = 0
-	RESONANCE: int = 0
-	PRESENCE: int = 0
-
-	def __init__(self):
-		pass
-
-	def load_from_sysex(self, data: list) -> None:
-		"""Load the configuration from a SysEx message."""
-		self.PRESET_NAME = ''.join([chr(byte) for byte in data[9:27]]).strip()
-		self.PRESET_NUMBER = data[8]
-		self.GAIN = data[28]
-		self.BASS = data[29]
-		self.MIDDLE = data[30]
-		self.TREBLE = data[31]
-		self.VOLUME = data[32]
-		self.PEDAL_STATE = data[33]
-		self.PEDAL_TYPE = data[34]
-		self.PEDAL_P1 = data[35]
-		self.PEDAL_P2 = data[36]
-		self.PEDAL_P3 = data[37]
-		self.PEDAL_P4 = data[38]
-		self.AMP_STATE = data[39] == 1
-		self.AMP_TYPE = data[40]
-		self.GATE_THRESHOLD = data[41]
-		self.MODULATION_STATE = data[42] == 1
-		self.MODULATION_TYPE = data[43]
-		self.MODULATION_P1 = data[44]
-		self.MODULATION_P2 = data[45]
-		self.MODULATION_P3 = data[46]
-		self.MODULATION_P4 = data[47]
-		self.DELAY_STATE = data[48] == 1
-		self.DELAY_TYPE = data[49]
-		self.DELAY_P1 = (data[50] * 128) + data[51]
-		self.DELAY_P2 = data[52]
-		self.DELAY_P3 = data[53]
-		self.DELAY_P4 = data[54]
-		self.REVERB_STATE = data[55] == 1
-		self.REVERB_TYPE = data[56]
-		self.REVERB_P1 = data[57]
-		self.REVERB_P2 = data[58]
-		self.REVERB_P3 = data[59]
-		self.REVERB_P4 = data[60]
-		self.POWER_AMP_STATE = data[61] == 1
-		self.POWER_AMP_TYPE = data[62]
-		self.CABINET_STATE = data[63] == 1
-		self.CABINET_TYPE = data[64]
-		self.RESONANCE = data[65]
-		self.PRESENCE = data[66]
+	@property
+	def PRESET_NAME(self) -> str:
+		return decode_name(bytes(self.data[NAME_OFFSET:NAME_OFFSET + NAME_LENGTH]))
+
+	@PRESET_NAME.setter
+	def PRESET_NAME(self, value: str) -> None:
+		name = value.encode('latin-1', errors='replace')[:NAME_LENGTH].ljust(NAME_LENGTH, b' ')
+		self.writable_data()[NAME_OFFSET:NAME_OFFSET + NAME_LENGTH] = name
+
+	def writable_data(self) -> bytearray:
+		"""Get the SysEx data for modification, copying it first if it is a view over an immutable buffer."""
+		if not isinstance(self.data, bytearray):
+			self.data = bytearray(self.data)
+
+		return self.data
+
+	def load_from_sysex(self, data) -> None:
+		"""
+		Load the configuration from a SysEx message.
+
+		:param data: The message data. Buffers such as bytes or memory-mapped files are referenced rather than copied.
+		"""
+		if isinstance(data, bytes):
+			self.data = data
+		elif isinstance(data, (bytearray, memoryview)):
+			self.data = memoryview(data).toreadonly()
+		else:
+			self.data = bytes(data)
+
+		if len(self.data) < SYSEX_LENGTH:
+			raise ValueError(f'Preset SysEx data must be at least {SYSEX_LENGTH} bytes. Got {len(self.data)}.')
+
+	def content_hash(self) -> bytes:
+		"""Hash the settings of the configuration, leaving out the name and slot so copies of the same sound match."""
+		return hashlib.blake2b(self.data[SETTINGS_OFFSET:SYSEX_LENGTH], digest_size=16).digest()
 
 	def to_json(self) -> dict:
 		"""Create a JSON representation of the configuration."""
-		return {
-			"preset_name": self.PRESET_NAME,
-			"preset_number": self.PRESET_NUMBER,
-			"gain": self.GAIN,
-			"bass": self.BASS,
-			"middle": self.MIDDLE,
-			"treble": self.TREBLE,
-			"volume": self.VOLUME,
-			"pedal_state": self.PEDAL_STATE,
-			"pedal_type": self.PEDAL_TYPE,
-			"pedal_p1": self.PEDAL_P1,
-			"pedal_p2": self.PEDAL_P2,
-			"pedal_p3": self.PEDAL_P3,
-			"pedal_p4": self.PEDAL_P4,
-			"amp_state": self.AMP_STATE,
-			"amp_type": self.AMP_TYPE,
-			"gate_threshold": self.GATE_THRESHOLD,
-			"modulation_state": self.MODULATION_STATE,
-			"modulation_type": self.MODULATION_TYPE,
-			"modulation_p1": self.MODULATION_P1,
-			"modulation_p2": self.MODULATION_P2,
-			"modulation_p3": self.MODULATION_P3,
-			"modulation_p4": self.MODULATION_P4,
-			"delay_state": self.DELAY_STATE,
-			"delay_type": self.DELAY_TYPE,
-			"delay_p1": self.DELAY_P1,
-			"delay_p2": self.DELAY_P2,
-			"delay_p3": self.DELAY_P3,
-			"delay_p4": self.DELAY_P4,
-			"reverb_state": self.REVERB_STATE,
-			"reverb_type": self.REVERB_TYPE,
-			"reverb_p1": self.REVERB_P1,
-			"reverb_p2": self.REVERB_P2,
-			"reverb_p3": self.REVERB_P3,
-			"reverb_p4": self.REVERB_P4,
-			"power_amp_state": self.POWER_AMP_STATE,
-			"power_amp_type": self.POWER_AMP_TYPE,
-			"cabinet_state": self.CABINET_STATE,
-			"cabinet_type": self.CABINET_TYPE,
-			"resonance": self.RESONANCE,
-			"presence": self.PRESENCE
-		}
+		return {field.lower(): getattr(self, field) for field in FIELDS}
 
 	def load_from_json(self, config: dict) -> None:
 		"""Load the configuration from a JSON object."""
-		self.PRESET_NAME = config["preset_name"]
-		self.PRESET_NUMBER = config["preset_number"]
-		self.GAIN = config["gain"]
-		self.BASS = config["bass"]
-		self.MIDDLE = config["middle"]
-		self.TREBLE = config["treble"]
-		self.VOLUME = config["volume"]
-		self.PEDAL_STATE = config["pedal_state"]
-		self.PEDAL_TYPE = config["pedal_type"]
-		self.PEDAL_P1 = config["pedal_p1"]
-		self.PEDAL_P2 = config["pedal_p2"]
-		self.PEDAL_P3 = config["pedal_p3"]
-		self.PEDAL_P4 = config["pedal_p4"]
-		self.AMP_STATE = config["amp_state"]
-		self.AMP_TYPE = config["amp_type"]
-		self.GATE_THRESHOLD = config["gate_threshold"]
-		self.MODULATION_STATE = config["modulation_state"]
-		self.MODULATION_TYPE = config["modulation_type"]
-		self.MODULATION_P1 = config["modulation_p1"]
-		self.MODULATION_P2 = config["modulation_p2"]
-		self.MODULATION_P3 = config["modulation_p3"]
-		self.MODULATION_P4 = config["modulation_p4"]
-		self.DELAY_STATE = config["delay_state"]
-		self.DELAY_TYPE = config["delay_type"]
-		self.DELAY_P1 = config["delay_p1"]
-		self.DELAY_P2 = config["delay_p2"]
-		self.DELAY_P3 = config["delay_p3"]
-		self.DELAY_P4 = config["delay_p4"]
-		self.REVERB_STATE = config["reverb_state"]
-		self.REVERB_TYPE = config["reverb_type"]
-		self.REVERB_P1 = config["reverb_p1"]
-		self.REVERB_P2 = config["reverb_p2"]
-		self.REVERB_P3 = config["reverb_p3"]
-		self.REVERB_P4 = config["reverb_p4"]
-		self.POWER_AMP_STATE = config["power_amp_state"]
-		self.POWER_AMP_TYPE = config["power_amp_type"]
-		self.CABINET_STATE = config["cabinet_state"]
-		self.CABINET_TYPE = config["cabinet_type"]
-		self.RESONANCE = config["resonance"]
-		self.PRESENCE = config["presence"]
+		for field in FIELDS:
+			setattr(self, field, config[field.lower()])
+
+
+# Every field of a configuration, in the order they are written to JSON
+FIELDS = (
+	"PRESET_NAME",
+	"PRESET_NUMBER",
+	"GAIN",
+	"BASS",
+	"MIDDLE",
+	"TREBLE",
+	"VOLUME",
+	"PEDAL_STATE",
+	"PEDAL_TYPE",
+	"PEDAL_P1",
+	"PEDAL_P2",
+	"PEDAL_P3",
+	"PEDAL_P4",
+	"AMP_STATE",
+	"AMP_TYPE",
+	"GATE_THRESHOLD",
+	"MODULATION_STATE",
+	"MODULATION_TYPE",
+	"MODULATION_P1",
+	"MODULATION_P2",
+	"MODULATION_P3",
+	"MODULATION_P4",
+	"DELAY_STATE",
+	"DELAY_TYPE",
+	"DELAY_P1",
+	"DELAY_P2",
+	"DELAY_P3",
+	"DELAY_P4",
+	"REVERB_STATE",
+	"REVERB_TYPE",
+	"REVERB_P1",
+	"REVERB_P2",
+	"REVERB_P3",
+	"REVERB_P4",
+	"POWER_AMP_STATE",
+	"POWER_AMP_TYPE",
+	"CABINET_STATE",
+	"CABINET_TYPE",
+	"RESONANCE",
+	"PRESENCE"
+)
+
+# The fields stored as on and off flags
+BOOL_FIELDS = (
+	"AMP_STATE",
+	"MODULATION_STATE",
+	"DELAY_STATE",
+	"REVERB_STATE",
+	"POWER_AMP_STATE",
+	"CABINET_STATE"
+)
+
+# Every field of a preset, decoded. The search and similarity indexes read these like an AmpConfig
+PresetFields = namedtuple('PresetFields', FIELDS)
+
+# Where the settings of a record land once DELAY_P1 is joined, counted from the first setting
+DELAY_P1_POSITION = FIELDS.index("DELAY_P1") - 2
+BOOL_POSITIONS = tuple(FIELDS.index(field) - 2 for field in BOOL_FIELDS)
+
+
+def pack_bank(payloads: Iterable) -> bytearray:
+	"""
+	Pack many preset SysEx payloads, such as a full amp dump, into one buffer of consecutive fixed-size records.
+
+	Each payload is copied once, straight into its place in the buffer.
+	"""
+	payloads = list(payloads)
+	buffer = bytearray(len(payloads) * SYSEX_LENGTH)
+	for position, payload in enumerate(payloads):
+		if len(payload) < SYSEX_LENGTH:
+			raise ValueError(f'Preset SysEx data must be at least {SYSEX_LENGTH} bytes. Got {len(payload)}.')
+		buffer[position * SYSEX_LENGTH:(position + 1) * SYSEX_LENGTH] = payload[:SYSEX_LENGTH]
+
+	return buffer
+
+
+def load_bank(buffer) -> List[AmpConfig]:
+	"""Load every preset record of a bank buffer, each configuration being a view over its record rather than a copy."""
+	view = memoryview(buffer).toreadonly()
+	return [AmpConfig(view[offset:offset + SYSEX_LENGTH]) for offset in range(0, len(view), SYSEX_LENGTH)]
+
+
+def decode_bank(buffer) -> List[PresetFields]:
+	"""
+	Decode every field of a bank buffer in bulk.
+
+	The records are unpacked by one precompiled struct rather than one property at a time, with the names decoded,
+	DELAY_P1 joined from its MSB and LSB and the flags turned into booleans, so the values match those of an AmpConfig.
+	"""
+	decoded = []
+	for number, name, *settings in RECORD_STRUCT.iter_unpack(buffer):
+		settings[DELAY_P1_POSITION:DELAY_P1_POSITION + 2] = [
+			settings[DELAY_P1_POSITION] * 128 + settings[DELAY_P1_POSITION + 1]
+		]
+		for position in BOOL_POSITIONS:
+			settings[position] = settings[position] == 1
+		decoded.append(PresetFields(decode_name(name), number, *settings))
+
+	return decoded
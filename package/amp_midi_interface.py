@@ -1,16 +1,26 @@
+import sys
+import threading
+import time
+from typing import Iterator, List, Optional, Tuple
+
 import mido
 import rtmidi
 from PySide6.QtCore import QTimer
 
+from package.amp_config import AmpConfig
+from package.amp_patch import compile_patch
+from package.automation import AutomationRecorder
 from package.ui.main_window_ui import Ui_MainWindow
 
+NOTES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+
+# The name of every MIDI note, interned so repeated conversions return the same string object
+NOTE_NAMES = tuple(sys.intern(NOTES[midi_number % 12] + str(midi_number // 12 - 1)) for midi_number in range(128))
+
 
 def midi_to_note(midi_number: int) -> str:
 	"""Convert a MIDI note number to a note name."""
-	notes = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-	octave = int(midi_number / 12) - 1
-	note_index = midi_number % 12
-	return notes[note_index] + str(octave)
+	return NOTE_NAMES[midi_number]
 
 
 class AmpMIDIInterface:
@@ -20,6 +30,14 @@ class AmpMIDIInterface:
 		self.main = main
 		self.ui = ui
 		self.ignore_updates = False
+		self.sending_suppressed = False
+
+		# Messages may also be sent from other threads. The lock is re-entrant so pairs of messages can be held together
+		self.send_lock = threading.RLock()
+
+		# Records every control change sent from the widgets while set
+		self.recorder: Optional[AutomationRecorder] = None
+
 		try:
 			self.port = mido.open_ioport('CODE 0')
 			self.connected = True
@@ -49,9 +67,7 @@ class AmpMIDIInterface:
 					self.main.setup_from_config()
 
 				if msg.type == "polytouch":
-					note = midi_to_note(msg.note)
-					accuracy = msg.value
-					self.main.tunerDialog.draw_tuner(note, accuracy)
+					self.main.tunerDialog.post_reading(msg.note, msg.value)
 
 			self.ignore_updates = False
 		except KeyboardInterrupt:
@@ -59,6 +75,12 @@ class AmpMIDIInterface:
 
 	def __send_control_change(self, control_id: int, value: int) -> None:
 		"""Send a control_change message to the connected amp."""
+		if self.sending_suppressed:
+			return
+
+		if self.recorder is not None and 0 <= control_id <= 127 and 0 <= value <= 127:
+			self.recorder.record(control_id, value)
+
 		if not self.connected:
 			try:
 				self.port = mido.open_ioport('CODE 0')
@@ -84,18 +106,87 @@ class AmpMIDIInterface:
 			raise ValueError(f'Value must be between 0 and 127. Got {value} for control ID {control_id}.')
 
 		try:
-			self.port.send(mido.Message('control_change', control=control_id, value=value))
+			with self.send_lock:
+				self.port.send(mido.Message('control_change', control=control_id, value=value))
 		except rtmidi.SystemError:
 			self.connected = False
 			self.ui.connectionStatusLabel.setText('Status: DISCONNECTED')
 			self.ui.connectionStatusLabel.setStyleSheet('color: red')
 
+	def apply_config(self, config: AmpConfig) -> None:
+		"""Send only the settings that differ from the current configuration, then show the new configuration."""
+		if config.content_hash() == self.main.amp_config.content_hash():
+			# The amp already has these settings, only the name and slot differ
+			self.main.amp_config.load_from_sysex(bytes(config.data))
+			self.ui.presetNumberDisplay.display(config.PRESET_NUMBER)
+			self.ui.presetNameLabel.setText(config.PRESET_NAME)
+			return
+
+		self.switch_to_config(config, compile_patch(self.main.amp_config, config))
+
+	def switch_to_config(self, config: AmpConfig, patch: List[Tuple[int, int]], program: int = -1) -> float:
+		"""
+		Switch the amp to a configuration that is already in memory, without reading anything back from the amp.
+
+		:param config: The configuration to switch to.
+		:param patch: The control changes taking the current configuration to the new one.
+		:param program: The amp slot holding the same settings. When given, a single program change replaces a patch of
+			several messages.
+		:return: The seconds taken until the amp was sent every message, before the widgets are updated.
+		"""
+		start = time.perf_counter()
+		if program != -1 and len(patch) > 1:
+			self.send_message(mido.Message('program_change', program=program))
+		else:
+			for control_id, value in patch:
+				self.__send_control_change(control_id, value)
+		elapsed = time.perf_counter() - start
+
+		self.main.amp_config.load_from_sysex(bytes(config.data))
+
+		# The amp already has every change, so updating the widgets must not send them again
+		self.sending_suppressed = True
+		try:
+			self.main.setup_from_config(False)
+		finally:
+			self.sending_suppressed = False
+
+		return elapsed
+
+	def send_message(self, msg: mido.Message) -> bool:
+		"""
+		Send a message to the connected amp from any thread.
+
+		:return: Whether the message was sent. A failed send marks the amp as disconnected, the status label is updated
+			by the next send from the main window.
+		"""
+		if not self.connected:
+			return False
+
+		try:
+			with self.send_lock:
+				self.port.send(msg)
+		except rtmidi.SystemError:
+			self.connected = False
+			return False
+
+		return True
+
+	def send_messages(self, messages: List[mido.Message]) -> bool:
+		"""Send several messages to the connected amp from any thread, with no other message sent in between."""
+		with self.send_lock:
+			return all(self.send_message(msg) for msg in messages)
+
+	def send_control_change(self, control_id: int, value: int) -> bool:
+		"""Send a control change to the connected amp from any thread, without updating the widgets."""
+		return self.send_message(mido.Message('control_change', control=control_id, value=value))
+
 	def send_program_change(self, program: int):
 		"""Send a program change message to the connected amp."""
 		if not self.connected:
 			return
 
-		self.port.send(mido.Message('program_change', program=program))
+		self.send_message(mido.Message('program_change', program=program))
 		self.main.setup_from_config()
 
 	def get_amp_configuration(self, preset: int = -1) -> list:
@@ -108,15 +199,28 @@ class AmpMIDIInterface:
 			return []
 
 		if preset == -1:
-			self.port.send(mido.Message('sysex', data=[0x00, 0x21, 0x15, 0x7F, 0x7F, 0x7F, 0x73, 0x01, 0x00]))
+			self.send_message(mido.Message('sysex', data=[0x00, 0x21, 0x15, 0x7F, 0x7F, 0x7F, 0x73, 0x01, 0x00]))
 		else:
-			self.port.send(mido.Message('sysex', data=[0x00, 0x21, 0x15, 0x7F, 0x7F, 0x7F, 0x72, 0x01, preset]))
+			self.send_message(mido.Message('sysex', data=[0x00, 0x21, 0x15, 0x7F, 0x7F, 0x7F, 0x72, 0x01, preset]))
 
 		msg = self.port.receive()
 		while msg.type != "sysex":
 			msg = self.port.receive()
 		return msg.data
 
+	def dump_presets(self, presets: int = 100) -> Iterator[AmpConfig]:
+		"""
+		Request every preset from the amp, yielding each one as soon as it arrives.
+
+		:param presets: The number of preset slots to request.
+		"""
+		for preset in range(0, presets):
+			preset_data = self.get_amp_configuration(preset)
+			if len(preset_data) != 0:
+				yield AmpConfig(bytes(preset_data))
+			else:
+				print(f'Preset {preset} not found')
+
 	def set_gain(self, value: int) -> None:
 		"""Set the gain of the amp."""
 		self.ui.gainDisplay.display(value / 10.0)
@@ -338,11 +442,12 @@ class AmpMIDIInterface:
 				self.ui.reverseTimeDisplay.display(value)
 		self.main.amp_config.DELAY_P1 = value
 
-		# Delay uses MSB/LSB on 31 & 63
+		# Delay uses MSB/LSB on 31 & 63, held together so no other thread can send between them
 		msb = value // 128    # Integer division to get the MSB
 		lsb = value % 128     # Modulo operation to get the LSB
-		self.__send_control_change(31, msb)
-		self.__send_control_change(63, lsb)
+		with self.send_lock:
+			self.__send_control_change(31, msb)
+			self.__send_control_change(63, lsb)
 
 	def set_delay_p2(self, value: int) -> None:
 		"""Set the second parameter of the delay."""
@@ -0,0 +1,83 @@
+from typing import List, Tuple
+
+from package.amp_config import AmpConfig, SETTINGS_OFFSET, SYSEX_LENGTH
+
+# The control change ID of each field that can be sent to the amp
+CONTROL_IDS = {
+	"GAIN": 70,
+	"BASS": 71,
+	"MIDDLE": 72,
+	"TREBLE": 73,
+	"VOLUME": 74,
+	"PEDAL_STATE": 75,
+	"PEDAL_TYPE": 76,
+	"PEDAL_P1": 77,
+	"PEDAL_P2": 78,
+	"PEDAL_P3": 79,
+	"PEDAL_P4": 80,
+	"AMP_STATE": 81,
+	"AMP_TYPE": 82,
+	"GATE_THRESHOLD": 83,
+	"MODULATION_STATE": 85,
+	"MODULATION_TYPE": 86,
+	"MODULATION_P1": 90,
+	"MODULATION_P2": 87,
+	"MODULATION_P3": 89,
+	"MODULATION_P4": 102,
+	"DELAY_STATE": 103,
+	"DELAY_TYPE": 104,
+	"DELAY_P1": 31,   # Sent as an MSB on 31 followed by an LSB on 63
+	"DELAY_P2": 105,
+	"DELAY_P3": 106,
+	"DELAY_P4": 107,
+	"REVERB_STATE": 108,
+	"REVERB_TYPE": 109,
+	"REVERB_P1": 110,
+	"REVERB_P2": 111,
+	"REVERB_P3": 112,
+	"REVERB_P4": 113,
+	"POWER_AMP_STATE": 114,
+	"POWER_AMP_TYPE": 115,
+	"CABINET_STATE": 116,
+	"CABINET_TYPE": 117,
+	"RESONANCE": 119,
+	"PRESENCE": 118
+}
+DELAY_P1_LSB_CONTROL_ID = 63
+
+# Fields that change what the parameters of their block mean, so they are sent before anything else
+TYPE_FIELDS = ("AMP_TYPE", "POWER_AMP_TYPE", "CABINET_TYPE", "PEDAL_TYPE", "MODULATION_TYPE", "DELAY_TYPE", "REVERB_TYPE")
+
+
+def diff_configs(old: AmpConfig, new: AmpConfig) -> List[str]:
+	"""Get the fields that differ between two configurations, ignoring the preset name and number."""
+	if old.data[SETTINGS_OFFSET:SYSEX_LENGTH] == new.data[SETTINGS_OFFSET:SYSEX_LENGTH]:
+		return []
+
+	return [field for field in CONTROL_IDS if getattr(old, field) != getattr(new, field)]
+
+
+def field_messages(field: str, value: int) -> List[Tuple[int, int]]:
+	"""Get the control changes that set a single field, keeping the DELAY_P1 MSB and LSB together."""
+	if field == "DELAY_P1":
+		msb, lsb = divmod(value, 128)
+		return [(CONTROL_IDS[field], msb), (DELAY_P1_LSB_CONTROL_ID, lsb)]
+
+	return [(CONTROL_IDS[field], int(value))]
+
+
+def compile_patch(old: AmpConfig, new: AmpConfig) -> List[Tuple[int, int]]:
+	"""
+	Compile the minimal list of control changes that turns one configuration into another.
+
+	Type changes come first so the parameters that follow land on the right effect, and fields that are already equal
+	are left out entirely.
+	"""
+	fields = diff_configs(old, new)
+	ordered_fields = [field for field in fields if field in TYPE_FIELDS] + [field for field in fields if field not in TYPE_FIELDS]
+
+	messages = []
+	for field in ordered_fields:
+		messages.extend(field_messages(field, getattr(new, field)))
+
+	return messages
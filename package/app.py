@@ -1,13 +1,51 @@
 import json
-from typing import List
+import os
+import time
+from typing import Dict, List, Optional
 
-from PySide6.QtWidgets import QMainWindow, QFileDialog
+import mido
+from PySide6.QtCore import QModelIndex, QTimer, Qt
+from PySide6.QtWidgets import (
+	QApplication, QMainWindow, QFileDialog, QTabWidget, QInputDialog, QLabel, QDial, QListWidget, QMessageBox
+)
 
 from package.about_dialog import AboutDialog
 from package.amp_config import AmpConfig
 from package.amp_midi_interface import AmpMIDIInterface
+from package.automation import AutomationPlayer, AutomationRecorder, load_automation, save_automation
+from package.edit_history import EditHistory
+from package.midi_bridge import MIDIBridge, load_mappings
+from package.preset_bank import BANK_EXTENSION, JSON_LINES_EXTENSION, export_bank, import_bank
+from package.preset_list_model import SLOT_ROLE, PresetFilterModel, PresetListModel
+from package.preset_morph import PresetMorph
+from package.setlist import Setlist
+from package.tempo import DelayTempoSync
 from package.tuner_dialog import TunerDialog
+from package.ui.auto_wah_tab_ui import Ui_AutoWahTab
+from package.ui.chorus_tab_ui import Ui_ChorusTab
+from package.ui.compressor_tab_ui import Ui_CompressorTab
+from package.ui.distortion_tab_ui import Ui_DistortionTab
+from package.ui.flanger_tab_ui import Ui_FlangerTab
+from package.ui.hall_tab_ui import Ui_HallTab
 from package.ui.main_window_ui import Ui_MainWindow
+from package.ui.multi_tab_ui import Ui_MultiTab
+from package.ui.phaser_tab_ui import Ui_PhaserTab
+from package.ui.pitch_shifter_tab_ui import Ui_PitchShifterTab
+from package.ui.reverse_tab_ui import Ui_ReverseTab
+from package.ui.room_tab_ui import Ui_RoomTab
+from package.ui.spring_tab_ui import Ui_SpringTab
+from package.ui.stadium_tab_ui import Ui_StadiumTab
+from package.ui.studio_tab_ui import Ui_StudioTab
+from package.ui.tremolo_tab_ui import Ui_TremoloTab
+from package.ui.vintage_tab_ui import Ui_VintageTab
+
+BANK_FILE_FILTER = 'Preset Banks (*.codebank);;JSON Lines (*.jsonl)'
+PRESET_SEARCH_DELAY = 100   # Milliseconds to wait after the last keystroke before filtering the preset list
+SIMILAR_PRESET_COUNT = 10
+BRIDGE_STATUS_INTERVAL = 250   # Milliseconds between refreshes of the widgets and latency while a foot controller is connected
+AUTOMATION_STATUS_INTERVAL = 250   # Milliseconds between checks for the end of automation playback or a morph
+DEFAULT_MORPH_DURATION = 2.0   # Seconds
+HISTORY_COALESCE_DELAY = 500   # Milliseconds without changes before they become one undo entry
 
 
 class AmpInterfaceWindow(QMainWindow):
@@ -17,6 +55,26 @@ class AmpInterfaceWindow(QMainWindow):
 		self.ui = Ui_MainWindow()
 		self.ui.setupUi(self)
 
+		# Effect tabs are built the first time they are shown or their type becomes active
+		self.unbuilt_effect_pages = {
+			'compressorTab': Ui_CompressorTab,
+			'distortionTab': Ui_DistortionTab,
+			'autoWahTab': Ui_AutoWahTab,
+			'pitchShifterTab': Ui_PitchShifterTab,
+			'chorusTab': Ui_ChorusTab,
+			'flangerTab': Ui_FlangerTab,
+			'phaserTab': Ui_PhaserTab,
+			'tremoloTab': Ui_TremoloTab,
+			'studioTab': Ui_StudioTab,
+			'vintageTab': Ui_VintageTab,
+			'multiTab': Ui_MultiTab,
+			'reverseTab': Ui_ReverseTab,
+			'roomTab': Ui_RoomTab,
+			'hallTab': Ui_HallTab,
+			'springTab': Ui_SpringTab,
+			'stadiumTab': Ui_StadiumTab
+		}
+
 		self.aboutDialog = AboutDialog()
 		self.ui.actionAbout.triggered.connect(self.open_about_dialog)
 
@@ -26,14 +84,66 @@ class AmpInterfaceWindow(QMainWindow):
 		self.ui.actionRefresh_Amp_Settings.triggered.connect(lambda _: self.setup_from_config())
 		self.ui.actionLoad_from_File.triggered.connect(lambda _: self.open_preset_file())
 		self.ui.actionSave_to_File.triggered.connect(lambda _: self.save_preset_file())
+		self.ui.actionExport_Bank.triggered.connect(lambda _: self.export_preset_bank())
+		self.ui.actionImport_Bank.triggered.connect(lambda _: self.import_preset_bank())
+
+		self.bridge = None
+		self.bridgeStatusLabel = QLabel()
+		self.ui.statusbar.addPermanentWidget(self.bridgeStatusLabel)
+		self.bridgeStatusTimer = QTimer(self)
+		self.bridgeStatusTimer.setInterval(BRIDGE_STATUS_INTERVAL)
+		self.bridgeStatusTimer.timeout.connect(self.update_bridge_status)
+		self.ui.actionConnect_Foot_Controller.toggled.connect(self.toggle_foot_controller)
+
+		self.automation_events = []
+		self.automationPlayer = None
+		self.automationTimer = QTimer(self)
+		self.automationTimer.setInterval(AUTOMATION_STATUS_INTERVAL)
+		self.automationTimer.timeout.connect(self.update_automation_status)
+		self.ui.actionRecord_Automation.toggled.connect(self.toggle_automation_recording)
+		self.ui.actionPlay_Automation.triggered.connect(lambda _: self.play_automation())
+		self.ui.actionStop_Automation.triggered.connect(lambda _: self.stop_automation())
+		self.ui.actionSave_Automation.triggered.connect(lambda _: self.save_automation_file())
+		self.ui.actionLoad_Automation.triggered.connect(lambda _: self.open_automation_file())
+
+		self.tempoTimer = QTimer(self)
+		self.tempoTimer.setInterval(BRIDGE_STATUS_INTERVAL)
+		self.tempoTimer.timeout.connect(self.update_tempo_status)
+		self.ui.actionTap_Tempo.triggered.connect(lambda _: self.tap_tempo())
+		self.ui.actionFollow_MIDI_Clock.toggled.connect(self.toggle_midi_clock)
+
+		self.morph = None
+		self.morphTimer = QTimer(self)
+		self.morphTimer.setInterval(AUTOMATION_STATUS_INTERVAL)
+		self.morphTimer.timeout.connect(self.update_morph_status)
 
 		self.interface = AmpMIDIInterface(self, self.ui)
+		self.tempoSync = DelayTempoSync(self.interface)
 		if self.interface.connected:
 			self.ui.connectionStatusLabel.setText('Status: CONNECTED')
 			self.ui.connectionStatusLabel.setStyleSheet('color: green')
 
 		self.amp_config = AmpConfig()
 		self.presets: List[AmpConfig] = []
+		self.amp_slots: Dict[bytes, int] = {}   # The slot holding each preset dumped from the amp, by content hash
+		self.setlist = Setlist()
+		self.presetModel = PresetListModel(self.presets, self)
+		self.presetFilterModel = PresetFilterModel(self)
+		self.presetFilterModel.setSourceModel(self.presetModel)
+		self.ui.presetList.setModel(self.presetFilterModel)
+
+		self.history = EditHistory()
+		self.historyTimer = QTimer(self)
+		self.historyTimer.setSingleShot(True)
+		self.historyTimer.setInterval(HISTORY_COALESCE_DELAY)
+		self.historyTimer.timeout.connect(self.commit_history)
+		self.ui.actionUndo.triggered.connect(lambda _: self.undo())
+		self.ui.actionRedo.triggered.connect(lambda _: self.redo())
+
+		self.presetSearchTimer = QTimer(self)
+		self.presetSearchTimer.setSingleShot(True)
+		self.presetSearchTimer.setInterval(PRESET_SEARCH_DELAY)
+		self.presetSearchTimer.timeout.connect(self.handle_preset_search)
 
 		self.attach_signals()
 
@@ -54,7 +164,14 @@ class AmpInterfaceWindow(QMainWindow):
 			self.interface.set_tuner_state(update_tuner)
 
 	def closeEvent(self, event) -> None:
-		"""Close the MIDI port when the window is closed."""
+		"""Close the MIDI ports when the window is closed."""
+		if self.automationPlayer is not None:
+			self.automationPlayer.stop()
+		if self.morph is not None:
+			self.morph.stop()
+		self.tempoSync.close()
+		if self.bridge is not None:
+			self.bridge.close()
 		if self.interface.connected:
 			self.interface.port.close()
 
@@ -71,62 +188,6 @@ class AmpInterfaceWindow(QMainWindow):
 		self.ui.trebleDial.valueChanged.connect(self.interface.set_treble)
 		self.ui.presenceDial.valueChanged.connect(self.interface.set_presence)
 		self.ui.resonanceDial.valueChanged.connect(self.interface.set_resonance)
-		self.ui.compressorToneDial.valueChanged.connect(self.interface.set_pedal_p1)
-		self.ui.compressorRatioDial.valueChanged.connect(self.interface.set_pedal_p2)
-		self.ui.compressorCompressionDial.valueChanged.connect(self.interface.set_pedal_p3)
-		self.ui.compressorLevelDial.valueChanged.connect(self.interface.set_pedal_p4)
-		self.ui.distortionDriveDial.valueChanged.connect(self.interface.set_pedal_p2)
-		self.ui.distortionToneDial.valueChanged.connect(self.interface.set_pedal_p3)
-		self.ui.distortionLevelDial.valueChanged.connect(self.interface.set_pedal_p4)
-		self.ui.autoWahFreqDial.valueChanged.connect(self.interface.set_pedal_p2)
-		self.ui.autoWahSensitivityDial.valueChanged.connect(self.interface.set_pedal_p3)
-		self.ui.autoWahResDial.valueChanged.connect(self.interface.set_pedal_p4)
-		self.ui.pitchShifterFineDial.valueChanged.connect(self.interface.set_pedal_p2)
-		self.ui.pitchShifterRegenDial.valueChanged.connect(self.interface.set_pedal_p3)
-		self.ui.pitchShifterMixDial.valueChanged.connect(self.interface.set_pedal_p4)
-		self.ui.chorusSpeedDial.valueChanged.connect(self.interface.set_modulation_p2)
-		self.ui.chorusDepthDial.valueChanged.connect(self.interface.set_modulation_p3)
-		self.ui.chorusToneDial.valueChanged.connect(self.interface.set_modulation_p4)
-		self.ui.flangerSpeedDial.valueChanged.connect(self.interface.set_modulation_p2)
-		self.ui.flangerDepthDial.valueChanged.connect(self.interface.set_modulation_p3)
-		self.ui.flangerRegenDial.valueChanged.connect(self.interface.set_modulation_p4)
-		self.ui.phaserSpeedDial.valueChanged.connect(self.interface.set_modulation_p2)
-		self.ui.phaserDepthDial.valueChanged.connect(self.interface.set_modulation_p3)
-		self.ui.phaserRegenDial.valueChanged.connect(self.interface.set_modulation_p4)
-		self.ui.tremoloSpeedDial.valueChanged.connect(self.interface.set_modulation_p2)
-		self.ui.tremoloDepthDial.valueChanged.connect(self.interface.set_modulation_p3)
-		self.ui.tremoloSkewDial.valueChanged.connect(self.interface.set_modulation_p4)
-		self.ui.studioTimeDial.valueChanged.connect(self.interface.set_delay_p1)
-		self.ui.studioFeedbackDial.valueChanged.connect(self.interface.set_delay_p2)
-		self.ui.studioFreqDial.valueChanged.connect(self.interface.set_delay_p3)
-		self.ui.studioLevelDial.valueChanged.connect(self.interface.set_delay_p4)
-		self.ui.vintageTimeDial.valueChanged.connect(self.interface.set_delay_p1)
-		self.ui.vintageAgeDial.valueChanged.connect(self.interface.set_delay_p2)
-		self.ui.vintageFreqDial.valueChanged.connect(self.interface.set_delay_p3)
-		self.ui.vintageLevelDial.valueChanged.connect(self.interface.set_delay_p4)
-		self.ui.multiTimeDial.valueChanged.connect(self.interface.set_delay_p1)
-		self.ui.multiFeedbackDial.valueChanged.connect(self.interface.set_delay_p2)
-		self.ui.multiLevelDial.valueChanged.connect(self.interface.set_delay_p4)
-		self.ui.reverseTimeDial.valueChanged.connect(self.interface.set_delay_p1)
-		self.ui.reverseFeedbackDial.valueChanged.connect(self.interface.set_delay_p2)
-		self.ui.reverseFreqDial.valueChanged.connect(self.interface.set_delay_p3)
-		self.ui.reverseLevelDial.valueChanged.connect(self.interface.set_delay_p4)
-		self.ui.roomDecayDial.valueChanged.connect(self.interface.set_reverb_p1)
-		self.ui.roomPreDelayDial.valueChanged.connect(self.interface.set_reverb_p2)
-		self.ui.roomToneDial.valueChanged.connect(self.interface.set_reverb_p3)
-		self.ui.roomLevelDial.valueChanged.connect(self.interface.set_reverb_p4)
-		self.ui.hallDecayDial.valueChanged.connect(self.interface.set_reverb_p1)
-		self.ui.hallPreDelayDial.valueChanged.connect(self.interface.set_reverb_p2)
-		self.ui.hallToneDial.valueChanged.connect(self.interface.set_reverb_p3)
-		self.ui.hallLevelDial.valueChanged.connect(self.interface.set_reverb_p4)
-		self.ui.springDecayDial.valueChanged.connect(self.interface.set_reverb_p1)
-		self.ui.springPreDelayDial.valueChanged.connect(self.interface.set_reverb_p2)
-		self.ui.springToneDial.valueChanged.connect(self.interface.set_reverb_p3)
-		self.ui.springLevelDial.valueChanged.connect(self.interface.set_reverb_p4)
-		self.ui.stadiumDecayDial.valueChanged.connect(self.interface.set_reverb_p1)
-		self.ui.stadiumPreDelayDial.valueChanged.connect(self.interface.set_reverb_p2)
-		self.ui.stadiumToneDial.valueChanged.connect(self.interface.set_reverb_p3)
-		self.ui.stadiumLevelDial.valueChanged.connect(self.interface.set_reverb_p4)
 
 		# Buttons
 		self.ui.ampToggleButton.clicked.connect(self.interface.toggle_preamp)
@@ -143,37 +204,170 @@ class AmpInterfaceWindow(QMainWindow):
 		self.ui.ampList.currentRowChanged.connect(self.interface.set_preamp_type)
 		self.ui.powerList.currentRowChanged.connect(self.interface.set_power_amp_type)
 		self.ui.cabList.currentRowChanged.connect(self.interface.set_cab_type)
+		self.ui.preFXTab.currentChanged.connect(lambda index: self.build_effect_page(self.ui.preFXTab, index))
 		self.ui.preFXTab.currentChanged.connect(self.interface.set_pedal_type)
-		self.ui.distortionModeList.currentRowChanged.connect(self.interface.set_pedal_p1)
-		self.ui.autoWahModeList.currentRowChanged.connect(self.interface.set_pedal_p1)
+		self.ui.modulationTab.currentChanged.connect(lambda index: self.build_effect_page(self.ui.modulationTab, index))
 		self.ui.modulationTab.currentChanged.connect(self.interface.set_modulation_type)
-		self.ui.chorusModeList.currentRowChanged.connect(self.interface.set_modulation_p1)
-		self.ui.flangerModeList.currentRowChanged.connect(self.interface.set_modulation_p1)
-		self.ui.phaserModeList.currentRowChanged.connect(self.interface.set_modulation_p1)
-		self.ui.tremoloModeList.currentRowChanged.connect(self.interface.set_modulation_p1)
+		self.ui.delayTab.currentChanged.connect(lambda index: self.build_effect_page(self.ui.delayTab, index))
 		self.ui.delayTab.currentChanged.connect(self.interface.set_delay_type)
-		self.ui.multiTapPatternList.currentRowChanged.connect(self.interface.set_delay_p3)
+		self.ui.reverbTab.currentChanged.connect(lambda index: self.build_effect_page(self.ui.reverbTab, index))
 		self.ui.reverbTab.currentChanged.connect(self.interface.set_reverb_type)
 
+		# Changes made in quick succession, such as a dial drag, are undone together
+		for dial in (self.ui.gainDial, self.ui.volumeDial, self.ui.gateDial, self.ui.bassDial, self.ui.middleDial,
+				self.ui.trebleDial, self.ui.presenceDial, self.ui.resonanceDial):
+			dial.valueChanged.connect(self.restart_history_timer)
+		for button in (self.ui.ampToggleButton, self.ui.powerToggleButton, self.ui.cabToggleButton,
+				self.ui.preFXToggleButton, self.ui.modulationToggleButton, self.ui.delayToggleButton,
+				self.ui.reverbToggleButton, self.ui.flattenEQButton, self.ui.autoFlattenEQButton):
+			button.clicked.connect(self.restart_history_timer)
+		for type_list in (self.ui.ampList, self.ui.powerList, self.ui.cabList):
+			type_list.currentRowChanged.connect(self.restart_history_timer)
+		for tab in (self.ui.preFXTab, self.ui.modulationTab, self.ui.delayTab, self.ui.reverbTab):
+			tab.currentChanged.connect(self.restart_history_timer)
+
 		# Preset list
-		self.ui.presetList.itemClicked.connect(self.handle_preset_change)
-		self.ui.presetSearchBox.textChanged.connect(self.handle_preset_search)
+		self.ui.presetList.clicked.connect(self.handle_preset_change)
+		self.ui.presetSearchBox.textChanged.connect(lambda _: self.presetSearchTimer.start())
+		self.ui.presetList.addAction(self.ui.actionFind_Similar_Presets)
+		self.ui.actionFind_Similar_Presets.triggered.connect(lambda _: self.find_similar_presets())
+		self.ui.presetList.addAction(self.ui.actionAdd_to_Setlist)
+		self.ui.presetList.addAction(self.ui.actionMorph_to_Preset)
+		self.ui.actionMorph_to_Preset.triggered.connect(lambda _: self.morph_to_preset())
+
+		# Setlist
+		self.ui.actionNext_Setlist_Preset.triggered.connect(lambda _: self.step_setlist(1))
+		self.ui.actionPrevious_Setlist_Preset.triggered.connect(lambda _: self.step_setlist(-1))
+		self.ui.actionAdd_to_Setlist.triggered.connect(lambda _: self.add_to_setlist())
+		self.ui.actionLoad_Setlist.triggered.connect(lambda _: self.load_setlist())
+		self.ui.actionClear_Setlist.triggered.connect(lambda _: self.clear_setlist())
+
+		# Effect tabs that are visible at startup
+		for tab in (self.ui.preFXTab, self.ui.modulationTab, self.ui.delayTab, self.ui.reverbTab):
+			self.build_effect_page(tab, tab.currentIndex())
+
+	def build_effect_page(self, tab: QTabWidget, index: int) -> None:
+		"""Build the widgets of an effect tab page if this is the first time it is needed."""
+		page = tab.widget(index)
+		if page is None or page.objectName() not in self.unbuilt_effect_pages:
+			return
+
+		page_ui = self.unbuilt_effect_pages.pop(page.objectName())()
+		geometry = page.geometry()
+		page_ui.setupUi(page)
+		page.setGeometry(geometry)
+
+		# Expose the page widgets on the main UI so they can be targeted by name like the rest of the window. Only the
+		# widgets named after the page are copied, so generic names such as layouts never replace those of the window
+		prefix = page.objectName().removesuffix('Tab')
+		for name, widget in vars(page_ui).items():
+			if name.startswith(prefix) and not hasattr(self.ui, name):
+				setattr(self.ui, name, widget)
+		self.attach_effect_page_signals(page.objectName())
+
+		for dial in page.findChildren(QDial):
+			dial.valueChanged.connect(self.restart_history_timer)
+		for mode_list in page.findChildren(QListWidget):
+			mode_list.currentRowChanged.connect(self.restart_history_timer)
+
+	def attach_effect_page_signals(self, page: str) -> None:
+		"""Attach the signals of an effect tab page once it has been built."""
+		match page:
+			case 'compressorTab':
+				self.ui.compressorToneDial.valueChanged.connect(self.interface.set_pedal_p1)
+				self.ui.compressorRatioDial.valueChanged.connect(self.interface.set_pedal_p2)
+				self.ui.compressorCompressionDial.valueChanged.connect(self.interface.set_pedal_p3)
+				self.ui.compressorLevelDial.valueChanged.connect(self.interface.set_pedal_p4)
+			case 'distortionTab':
+				self.ui.distortionDriveDial.valueChanged.connect(self.interface.set_pedal_p2)
+				self.ui.distortionToneDial.valueChanged.connect(self.interface.set_pedal_p3)
+				self.ui.distortionLevelDial.valueChanged.connect(self.interface.set_pedal_p4)
+				self.ui.distortionModeList.currentRowChanged.connect(self.interface.set_pedal_p1)
+			case 'autoWahTab':
+				self.ui.autoWahFreqDial.valueChanged.connect(self.interface.set_pedal_p2)
+				self.ui.autoWahSensitivityDial.valueChanged.connect(self.interface.set_pedal_p3)
+				self.ui.autoWahResDial.valueChanged.connect(self.interface.set_pedal_p4)
+				self.ui.autoWahModeList.currentRowChanged.connect(self.interface.set_pedal_p1)
+			case 'pitchShifterTab':
+				self.ui.pitchShifterFineDial.valueChanged.connect(self.interface.set_pedal_p2)
+				self.ui.pitchShifterRegenDial.valueChanged.connect(self.interface.set_pedal_p3)
+				self.ui.pitchShifterMixDial.valueChanged.connect(self.interface.set_pedal_p4)
+			case 'chorusTab':
+				self.ui.chorusSpeedDial.valueChanged.connect(self.interface.set_modulation_p2)
+				self.ui.chorusDepthDial.valueChanged.connect(self.interface.set_modulation_p3)
+				self.ui.chorusToneDial.valueChanged.connect(self.interface.set_modulation_p4)
+				self.ui.chorusModeList.currentRowChanged.connect(self.interface.set_modulation_p1)
+			case 'flangerTab':
+				self.ui.flangerSpeedDial.valueChanged.connect(self.interface.set_modulation_p2)
+				self.ui.flangerDepthDial.valueChanged.connect(self.interface.set_modulation_p3)
+				self.ui.flangerRegenDial.valueChanged.connect(self.interface.set_modulation_p4)
+				self.ui.flangerModeList.currentRowChanged.connect(self.interface.set_modulation_p1)
+			case 'phaserTab':
+				self.ui.phaserSpeedDial.valueChanged.connect(self.interface.set_modulation_p2)
+				self.ui.phaserDepthDial.valueChanged.connect(self.interface.set_modulation_p3)
+				self.ui.phaserRegenDial.valueChanged.connect(self.interface.set_modulation_p4)
+				self.ui.phaserModeList.currentRowChanged.connect(self.interface.set_modulation_p1)
+			case 'tremoloTab':
+				self.ui.tremoloSpeedDial.valueChanged.connect(self.interface.set_modulation_p2)
+				self.ui.tremoloDepthDial.valueChanged.connect(self.interface.set_modulation_p3)
+				self.ui.tremoloSkewDial.valueChanged.connect(self.interface.set_modulation_p4)
+				self.ui.tremoloModeList.currentRowChanged.connect(self.interface.set_modulation_p1)
+			case 'studioTab':
+				self.ui.studioTimeDial.valueChanged.connect(self.interface.set_delay_p1)
+				self.ui.studioFeedbackDial.valueChanged.connect(self.interface.set_delay_p2)
+				self.ui.studioFreqDial.valueChanged.connect(self.interface.set_delay_p3)
+				self.ui.studioLevelDial.valueChanged.connect(self.interface.set_delay_p4)
+			case 'vintageTab':
+				self.ui.vintageTimeDial.valueChanged.connect(self.interface.set_delay_p1)
+				self.ui.vintageAgeDial.valueChanged.connect(self.interface.set_delay_p2)
+				self.ui.vintageFreqDial.valueChanged.connect(self.interface.set_delay_p3)
+				self.ui.vintageLevelDial.valueChanged.connect(self.interface.set_delay_p4)
+			case 'multiTab':
+				self.ui.multiTimeDial.valueChanged.connect(self.interface.set_delay_p1)
+				self.ui.multiFeedbackDial.valueChanged.connect(self.interface.set_delay_p2)
+				self.ui.multiLevelDial.valueChanged.connect(self.interface.set_delay_p4)
+				self.ui.multiTapPatternList.currentRowChanged.connect(self.interface.set_delay_p3)
+			case 'reverseTab':
+				self.ui.reverseTimeDial.valueChanged.connect(self.interface.set_delay_p1)
+				self.ui.reverseFeedbackDial.valueChanged.connect(self.interface.set_delay_p2)
+				self.ui.reverseFreqDial.valueChanged.connect(self.interface.set_delay_p3)
+				self.ui.reverseLevelDial.valueChanged.connect(self.interface.set_delay_p4)
+			case 'roomTab':
+				self.ui.roomDecayDial.valueChanged.connect(self.interface.set_reverb_p1)
+				self.ui.roomPreDelayDial.valueChanged.connect(self.interface.set_reverb_p2)
+				self.ui.roomToneDial.valueChanged.connect(self.interface.set_reverb_p3)
+				self.ui.roomLevelDial.valueChanged.connect(self.interface.set_reverb_p4)
+			case 'hallTab':
+				self.ui.hallDecayDial.valueChanged.connect(self.interface.set_reverb_p1)
+				self.ui.hallPreDelayDial.valueChanged.connect(self.interface.set_reverb_p2)
+				self.ui.hallToneDial.valueChanged.connect(self.interface.set_reverb_p3)
+				self.ui.hallLevelDial.valueChanged.connect(self.interface.set_reverb_p4)
+			case 'springTab':
+				self.ui.springDecayDial.valueChanged.connect(self.interface.set_reverb_p1)
+				self.ui.springPreDelayDial.valueChanged.connect(self.interface.set_reverb_p2)
+				self.ui.springToneDial.valueChanged.connect(self.interface.set_reverb_p3)
+				self.ui.springLevelDial.valueChanged.connect(self.interface.set_reverb_p4)
+			case 'stadiumTab':
+				self.ui.stadiumDecayDial.valueChanged.connect(self.interface.set_reverb_p1)
+				self.ui.stadiumPreDelayDial.valueChanged.connect(self.interface.set_reverb_p2)
+				self.ui.stadiumToneDial.valueChanged.connect(self.interface.set_reverb_p3)
+				self.ui.stadiumLevelDial.valueChanged.connect(self.interface.set_reverb_p4)
 
 	def setup_presets(self) -> None:
 		if not self.interface.connected:
 			return
 
+		payloads = []
 		for i in range(0, 100):
 			preset_data = self.interface.get_amp_configuration(i)
 			if len(preset_data) != 0:
-				preset_config = AmpConfig()
-				preset_config.load_from_sysex(preset_data)
-				self.presets.append(preset_config)
+				payloads.append(preset_data)
 			else:
 				print(f'Preset {i} not found')
 
-		for i in range(0, len(self.presets)):
-			self.ui.presetList.addItem(self.presets[i].PRESET_NAME)
+		presets = [AmpConfig(payload) for payload in payloads]
+		self.presetModel.append_presets(presets, from_amp=True)
+		self.amp_slots.update((config.content_hash(), config.PRESET_NUMBER) for config in presets)
 
 	def setup_from_config(self, load_from_amp: bool = True) -> None:
 		if load_from_amp:
@@ -215,6 +409,7 @@ class AmpInterfaceWindow(QMainWindow):
 		# Pre-FX (Pedal) settings
 		self.ui.preFXToggleButton.setChecked(self.amp_config.PEDAL_STATE)
 		self.ui.preFXTab.setCurrentIndex(self.amp_config.PEDAL_TYPE)
+		self.build_effect_page(self.ui.preFXTab, self.amp_config.PEDAL_TYPE)
 		match self.amp_config.PEDAL_TYPE:
 			case 0:
 				self.ui.compressorToneDial.setValue(self.amp_config.PEDAL_P1)
@@ -253,6 +448,7 @@ class AmpInterfaceWindow(QMainWindow):
 		# Modulation settings
 		self.ui.modulationToggleButton.setChecked(self.amp_config.MODULATION_STATE)
 		self.ui.modulationTab.setCurrentIndex(self.amp_config.MODULATION_TYPE)
+		self.build_effect_page(self.ui.modulationTab, self.amp_config.MODULATION_TYPE)
 		match self.amp_config.MODULATION_TYPE:
 			case 0:
 				self.ui.chorusModeList.setCurrentRow(self.amp_config.MODULATION_P1)
@@ -289,6 +485,7 @@ class AmpInterfaceWindow(QMainWindow):
 		# Delay settings
 		self.ui.delayToggleButton.setChecked(self.amp_config.DELAY_STATE)
 		self.ui.delayTab.setCurrentIndex(self.amp_config.DELAY_TYPE)
+		self.build_effect_page(self.ui.delayTab, self.amp_config.DELAY_TYPE)
 		match self.amp_config.DELAY_TYPE:
 			case 0:
 				self.ui.studioTimeDial.setValue(self.amp_config.DELAY_P1)
@@ -328,6 +525,7 @@ class AmpInterfaceWindow(QMainWindow):
 		# Reverb settings
 		self.ui.reverbToggleButton.setChecked(self.amp_config.REVERB_STATE)
 		self.ui.reverbTab.setCurrentIndex(self.amp_config.REVERB_TYPE)
+		self.build_effect_page(self.ui.reverbTab, self.amp_config.REVERB_TYPE)
 		match self.amp_config.REVERB_TYPE:
 			case 0:
 				self.ui.roomDecayDial.setValue(self.amp_config.REVERB_P1)
@@ -369,43 +567,391 @@ class AmpInterfaceWindow(QMainWindow):
 		if self.ui.autoFlattenEQButton.isChecked():
 			self.flatten_eq()
 
-	def handle_preset_change(self, item):
+		self.commit_history()
+
+	def restart_history_timer(self):
+		"""
+		Wait for the settings to stop changing before recording an undo entry.
+
+		Widgets updated by setup_from_config also restart the timer, but it is stopped again by the commit at the end.
+		"""
+		self.historyTimer.start()
+
+	def commit_history(self):
+		"""Record the settings changed since the last undo entry, waiting while a dial is still held."""
+		if QApplication.mouseButtons() & Qt.MouseButton.LeftButton:
+			self.historyTimer.start()
+			return
+
+		self.historyTimer.stop()
+		self.history.commit(self.amp_config)
+
+	def undo(self):
+		"""Undo the last change to the amp settings."""
+		self.historyTimer.stop()
+		self.history.commit(self.amp_config)
+		config = self.history.undo(self.amp_config)
+		if config is None:
+			self.ui.statusbar.showMessage('Nothing to undo')
+			return
+
+		self.interface.apply_config(config)
+
+	def redo(self):
+		"""Redo the last change to the amp settings that was undone."""
+		self.historyTimer.stop()
+		self.history.commit(self.amp_config)
+		config = self.history.redo(self.amp_config)
+		if config is None:
+			self.ui.statusbar.showMessage('Nothing to redo')
+			return
+
+		self.interface.apply_config(config)
+
+	def handle_preset_change(self, index: QModelIndex):
 		"""Runs when the selected preset changes."""
-		preset_name = item.text().lower()
+		row = self.presetFilterModel.mapToSource(index).row()
+		slot = index.data(SLOT_ROLE)
+		if slot is not None:
+			self.interface.send_program_change(slot)
+			self.refresh_slot_preset(row, slot)
+			return
+
+		# Presets that did not come from the amp are not in any of its slots, so their settings are sent instead
+		self.interface.apply_config(self.presets[row])
 
-		# Find the index of the preset name in the global list
-		preset_index = 0
-		for i in range(0, len(self.presets)):
-			if self.presets[i].PRESET_NAME.lower() == preset_name:
-				preset_index = i
-				break
+	def refresh_slot_preset(self, row: int, slot: int):
+		"""Update a preset dumped from the amp with the settings just read back from its slot, if they changed since."""
+		config = self.presets[row]
+		if self.amp_config.PRESET_NUMBER != slot:
+			return
+		if self.amp_config.PRESET_NAME == config.PRESET_NAME and self.amp_config.content_hash() == config.content_hash():
+			return
 
-		self.interface.send_program_change(preset_index)
+		# The preset was saved or renamed on the amp
+		if self.amp_slots.get(config.content_hash()) == slot:
+			del self.amp_slots[config.content_hash()]
+		config = AmpConfig(bytes(self.amp_config.data))
+		self.presetModel.set_preset(row, config, slot)
+		self.amp_slots[config.content_hash()] = slot
 
 	def handle_preset_search(self):
-		"""Runs when the text content of the preset search box is modified."""
-		search_content = self.ui.presetSearchBox.text().lower()
-		self.ui.presetList.clear()
-		for i in range(0, len(self.presets)):
-			if search_content in self.presets[i].PRESET_NAME.lower():
-				self.ui.presetList.addItem(self.presets[i].PRESET_NAME)
+		"""Runs once typing in the preset search box pauses."""
+		self.presetFilterModel.set_query(self.ui.presetSearchBox.text())
+
+	def find_similar_presets(self):
+		"""List the presets that sound closest to the selected preset, until the next search."""
+		index = self.ui.presetList.currentIndex()
+		if not index.isValid():
+			return
+
+		row = self.presetFilterModel.mapToSource(index).row()
+		self.presetSearchTimer.stop()
+		self.ui.presetSearchBox.blockSignals(True)
+		self.ui.presetSearchBox.clear()
+		self.ui.presetSearchBox.blockSignals(False)
+		self.presetFilterModel.show_similar(row, SIMILAR_PRESET_COUNT)
+		self.ui.statusbar.showMessage(f'Presets similar to {self.presets[row].PRESET_NAME}')
+
+	def morph_to_preset(self):
+		"""Morph the amp from its current settings to the selected preset over a chosen time."""
+		index = self.ui.presetList.currentIndex()
+		if not index.isValid() or (self.morph is not None and self.morph.is_alive()):
+			return
+
+		config = self.presets[self.presetFilterModel.mapToSource(index).row()]
+		duration, accepted = QInputDialog.getDouble(
+			self, 'Morph to Preset', 'Duration in seconds', DEFAULT_MORPH_DURATION, 0.0, 60.0, 1
+		)
+		if not accepted:
+			return
+		switch_point, accepted = QInputDialog.getInt(
+			self, 'Morph to Preset', 'Switch types and modes at (% of the way)', 50, 0, 100
+		)
+		if not accepted:
+			return
+
+		self.morph = PresetMorph(
+			AmpConfig(bytes(self.amp_config.data)), config, duration, self.interface.send_control_change, switch_point / 100
+		)
+		self.morph.start()
+		self.morphTimer.start()
+		self.ui.statusbar.showMessage(f'Morphing to {config.PRESET_NAME}')
+
+	def update_morph_status(self):
+		"""Once a morph has ended, show the settings it left the amp with and how many messages it took."""
+		if self.morph.is_alive():
+			return
+
+		self.morphTimer.stop()
+		if self.morph.finished:
+			self.interface.switch_to_config(self.morph.new, [])
+		else:
+			self.setup_from_config()
+
+		self.ui.statusbar.showMessage(
+			f'Morphed to {self.morph.new.PRESET_NAME} with {self.morph.message_count} messages '
+			f'over {self.morph.step_count} steps in {self.morph.elapsed:.2f}s'
+		)
+
+	def add_to_setlist(self):
+		"""Add the selected preset to the end of the setlist."""
+		index = self.ui.presetList.currentIndex()
+		if not index.isValid():
+			return
+
+		config = self.presets[self.presetFilterModel.mapToSource(index).row()]
+		self.setlist.add(config, self.amp_slots.get(config.content_hash(), -1))
+		self.ui.statusbar.showMessage(f'Added {config.PRESET_NAME} to the setlist ({len(self.setlist)} presets)')
+
+	def load_setlist(self):
+		"""Replace the setlist with the presets of a bank file, in order."""
+		file_name = QFileDialog.getOpenFileName(self, 'Select a setlist', '', BANK_FILE_FILTER)[0]
+		if file_name:
+			configs = self.read_bank_file(file_name)
+			if configs is None:
+				return
+
+			self.setlist.clear()
+			for config in configs:
+				self.setlist.add(config, self.amp_slots.get(config.content_hash(), -1))
+			self.ui.statusbar.showMessage(f'Loaded a setlist of {len(self.setlist)} presets from {file_name}')
+
+	def clear_setlist(self):
+		"""Remove every preset from the setlist."""
+		self.setlist.clear()
+		self.ui.statusbar.showMessage('Cleared the setlist')
+
+	def step_setlist(self, offset: int):
+		"""Switch to the next or previous preset of the setlist, showing how long the switch took."""
+		step = self.setlist.step(offset, self.amp_config)
+		if step is None:
+			return
+
+		start = time.perf_counter()
+		sound_latency = self.interface.switch_to_config(step.entry.config, step.patch, step.entry.program)
+		total_latency = time.perf_counter() - start
+		self.ui.statusbar.showMessage(
+			f'{step.position + 1}/{len(self.setlist)}: {step.entry.config.PRESET_NAME} - '
+			f'sound {sound_latency * 1000:.2f}ms, display {total_latency * 1000:.2f}ms'
+		)
+
+	def toggle_foot_controller(self, connect: bool):
+		"""Connect a foot controller through the MIDI bridge, or disconnect it."""
+		if not connect:
+			if self.bridge is not None:
+				self.bridge.close()
+				self.bridge = None
+			self.bridgeStatusTimer.stop()
+			self.bridgeStatusLabel.clear()
+			return
+
+		port_names = [name for name in mido.get_input_names() if not name.startswith('CODE')]
+		port_name, accepted = QInputDialog.getItem(self, 'Connect Foot Controller', 'Controller port', port_names, 0, False)
+		if not accepted or not port_name:
+			self.ui.actionConnect_Foot_Controller.setChecked(False)
+			return
+
+		mapping_file = QFileDialog.getOpenFileName(
+			self, 'Select a mapping file, or cancel to forward messages unchanged', '', 'JSON Files (*.json)'
+		)[0]
+		try:
+			self.bridge = MIDIBridge(self.interface, load_mappings(mapping_file) if mapping_file else None)
+			self.bridge.open(port_name)
+		except (OSError, ValueError) as e:
+			self.ui.statusbar.showMessage(f'Unable to connect {port_name}: {e}')
+			self.ui.actionConnect_Foot_Controller.setChecked(False)
+			return
+
+		self.bridgeStatusTimer.start()
+
+	def update_bridge_status(self):
+		"""Show the settings the foot controller changed and how much latency the bridge adds."""
+		if self.bridge.pending_refresh:
+			self.bridge.pending_refresh = False
+			self.setup_from_config()
+
+		count, mean_latency, maximum_latency = self.bridge.latency_stats()
+		self.bridgeStatusLabel.setText(
+			f'Foot controller: {count} messages, {mean_latency * 1000:.3f}ms mean, {maximum_latency * 1000:.3f}ms worst'
+		)
+
+	def toggle_automation_recording(self, record: bool):
+		"""Start recording the settings changed from the window, or stop and keep the recording."""
+		if record:
+			self.interface.recorder = AutomationRecorder()
+			self.ui.statusbar.showMessage('Recording automation')
+			return
+
+		if self.interface.recorder is None:
+			return
+
+		self.automation_events = self.interface.recorder.events
+		self.interface.recorder = None
+		length = self.automation_events[-1][0] if self.automation_events else 0.0
+		self.ui.statusbar.showMessage(f'Recorded {len(self.automation_events)} changes over {length:.1f}s')
+
+	def play_automation(self):
+		"""Play the recorded automation back to the amp."""
+		if self.automationPlayer is not None and self.automationPlayer.is_alive():
+			return
+		self.ui.actionRecord_Automation.setChecked(False)
+		if not self.automation_events:
+			self.ui.statusbar.showMessage('There is no automation to play')
+			return
+
+		self.automationPlayer = AutomationPlayer(self.automation_events, self.interface.send_control_change)
+		self.automationPlayer.start()
+		self.automationTimer.start()
+		self.ui.statusbar.showMessage('Playing automation')
+
+	def stop_automation(self):
+		"""Stop recording or playing automation."""
+		self.ui.actionRecord_Automation.setChecked(False)
+		if self.automationPlayer is not None:
+			self.automationPlayer.stop()
+
+	def update_automation_status(self):
+		"""Once playback has ended, show the settings it left the amp with and how closely it kept time."""
+		if self.automationPlayer.is_alive():
+			return
+
+		self.automationTimer.stop()
+		self.setup_from_config()
+
+		count, mean_error, maximum_error = self.automationPlayer.timing_stats()
+		self.ui.statusbar.showMessage(
+			f'Played {count} changes, {mean_error * 1000:.3f}ms mean timing error, {maximum_error * 1000:.3f}ms worst'
+		)
+
+	def open_automation_file(self):
+		"""Load automation recorded earlier."""
+		file_name = QFileDialog.getOpenFileName(self, 'Select an automation file', '', 'JSON Files (*.json)')[0]
+		if file_name:
+			self.automation_events = load_automation(file_name)
+			self.ui.statusbar.showMessage(f'Loaded {len(self.automation_events)} changes from {file_name}')
+
+	def save_automation_file(self):
+		"""Save the recorded automation to a file."""
+		file_name = QFileDialog.getSaveFileName(self, 'Save the recorded automation', '', 'JSON Files (*.json)')[0]
+		if file_name:
+			save_automation(file_name, self.automation_events)
+			self.ui.statusbar.showMessage(f'Saved automation to {file_name}')
+
+	def tap_tempo(self):
+		"""Set the delay time to the tempo of the taps so far."""
+		beat = self.tempoSync.tap()
+		if beat is None:
+			self.ui.statusbar.showMessage('Tap again to set the tempo')
+		elif self.tempoSync.pending_refresh:
+			self.update_tempo_status()
+		else:
+			self.show_tempo_status()
+
+	def toggle_midi_clock(self, follow: bool):
+		"""Follow the MIDI clock of an external device with the delay time, or stop following it."""
+		if not follow:
+			self.tempoSync.close()
+			self.tempoTimer.stop()
+			return
+
+		port_names = [name for name in mido.get_input_names() if not name.startswith('CODE')]
+		port_name, accepted = QInputDialog.getItem(self, 'Follow MIDI Clock', 'Clock port', port_names, 0, False)
+		if not accepted or not port_name:
+			self.ui.actionFollow_MIDI_Clock.setChecked(False)
+			return
+
+		try:
+			self.tempoSync.open(port_name)
+		except OSError as e:
+			self.ui.statusbar.showMessage(f'Unable to follow {port_name}: {e}')
+			self.ui.actionFollow_MIDI_Clock.setChecked(False)
+			return
+
+		self.tempoTimer.start()
+
+	def update_tempo_status(self):
+		"""Show the delay time set from the tempo."""
+		if not self.tempoSync.pending_refresh:
+			return
+		self.tempoSync.pending_refresh = False
+
+		# The amp already has the delay time, so only the widgets are updated
+		config = AmpConfig(bytes(self.amp_config.data))
+		config.DELAY_P1 = self.tempoSync.delay_time
+		self.interface.switch_to_config(config, [])
+		self.show_tempo_status()
+
+	def show_tempo_status(self):
+		"""Show the delay time the amp has as a tempo."""
+		bpm = 60000 * self.tempoSync.subdivision / max(self.amp_config.DELAY_P1, 1)
+		self.ui.statusbar.showMessage(f'Delay time {self.amp_config.DELAY_P1}ms ({bpm:.1f} BPM)')
 
 	def open_preset_file(self):
 		"""Open a preset file and load the configuration."""
 		file_name = QFileDialog.getOpenFileName(self, 'Select a preset file', '', 'JSON Files (*.json)')[0]
 		if file_name:
 			with open(file_name, 'r') as file:
-				config = json.load(file)
-				self.amp_config.load_from_json(config)
-				self.setup_from_config(False)
+				config = AmpConfig()
+				config.load_from_json(json.load(file))
+				self.interface.apply_config(config)
 
 	def save_preset_file(self):
 		"""Save the configuration to a preset file."""
 		file_name = QFileDialog.getSaveFileName(self, 'Save the current configuration', '', 'JSON Files (*.json)')[0]
 		if file_name:
+			content = json.dumps(self.amp_config.to_json(), indent=4)
+			if os.path.exists(file_name):
+				with open(file_name, 'r') as file:
+					if file.read() == content:
+						self.ui.statusbar.showMessage(f'{file_name} is already up to date')
+						return
+
 			with open(file_name, 'w') as file:
-				config = self.amp_config.to_json()
-				json.dump(config, file, indent=4)
+				file.write(content)
+
+	def export_preset_bank(self):
+		"""Export every preset on the amp, or the loaded presets when disconnected, to a bank file."""
+		file_name, selected_filter = QFileDialog.getSaveFileName(self, 'Export the preset bank', '', BANK_FILE_FILTER)
+		if file_name:
+			if not os.path.splitext(file_name)[1]:
+				file_name += JSON_LINES_EXTENSION if JSON_LINES_EXTENSION in selected_filter else BANK_EXTENSION
+
+			# Presets are written as they are received, so the whole bank is never held in memory
+			presets = self.interface.dump_presets() if self.interface.connected else self.presets
+			count = export_bank(file_name, presets)
+			self.ui.statusbar.showMessage(f'Exported {count} presets to {file_name}')
+
+	def import_preset_bank(self):
+		"""Import the presets in a bank file into the preset list, skipping any whose settings are already listed."""
+		file_name = QFileDialog.getOpenFileName(self, 'Select a preset bank', '', BANK_FILE_FILTER)[0]
+		if file_name:
+			configs = self.read_bank_file(file_name)
+			if configs is None:
+				return
+
+			imported = []
+			imported_hashes = set()
+			skipped = 0
+			for config in configs:
+				content_hash = config.content_hash()
+				if content_hash in self.presetModel.duplicate_index or content_hash in imported_hashes:
+					skipped += 1
+					continue
+
+				imported.append(config)
+				imported_hashes.add(content_hash)
+
+			count = self.presetModel.append_presets(imported)
+			self.ui.statusbar.showMessage(f'Imported {count} presets from {file_name}, skipped {skipped} duplicates')
+
+	def read_bank_file(self, file_name: str) -> Optional[List[AmpConfig]]:
+		"""Read every preset of a bank file, or tell the user why it cannot be read and return None."""
+		try:
+			return list(import_bank(file_name))
+		except (OSError, ValueError) as e:
+			QMessageBox.warning(self, 'Unable to read the bank', str(e))
+			return None
 
 	def flatten_eq(self):
 		"""Flatten all EQ settings"""
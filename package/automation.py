@@ -0,0 +1,118 @@
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Tuple
+
+# A recorded move: seconds since the recording started, control ID and value
+AutomationEvent = Tuple[float, int, int]
+
+# How long before an event the scheduler stops sleeping and waits on the clock instead
+SPIN_MARGIN = 0.0005
+
+# How often the interpreter may switch threads during playback, so Python code in the GUI thread delays events less
+PLAYBACK_SWITCH_INTERVAL = 0.0005
+
+# The switch interval is process-wide, so it is shortened while any playback runs and restored after the last one ends
+switch_interval_lock = threading.Lock()
+switch_interval_users = 0
+default_switch_interval = sys.getswitchinterval()
+
+
+@contextmanager
+def playback_switch_interval() -> Iterator[None]:
+	"""Shorten the thread switch interval for as long as any caller is inside this context."""
+	global switch_interval_users, default_switch_interval
+	with switch_interval_lock:
+		if switch_interval_users == 0:
+			default_switch_interval = sys.getswitchinterval()
+			sys.setswitchinterval(PLAYBACK_SWITCH_INTERVAL)
+		switch_interval_users += 1
+
+	try:
+		yield
+	finally:
+		with switch_interval_lock:
+			switch_interval_users -= 1
+			if switch_interval_users == 0:
+				sys.setswitchinterval(default_switch_interval)
+
+
+class AutomationRecorder:
+	"""Record the control changes sent to the amp with timestamps from a monotonic high-resolution clock."""
+
+	def __init__(self):
+		self.start = time.perf_counter()
+		self.events: List[AutomationEvent] = []
+
+	def record(self, control_id: int, value: int) -> None:
+		"""Record a control change sent now."""
+		self.events.append((time.perf_counter() - self.start, control_id, value))
+
+
+def save_automation(path: str, events: List[AutomationEvent]) -> None:
+	"""Save recorded events to a JSON file."""
+	with open(path, 'w') as file:
+		json.dump(events, file)
+
+
+def load_automation(path: str) -> List[AutomationEvent]:
+	"""Load recorded events from a JSON file."""
+	with open(path, 'r') as file:
+		return [(float(timestamp), int(control_id), int(value)) for timestamp, control_id, value in json.load(file)]
+
+
+class AutomationPlayer(threading.Thread):
+	"""
+	Play recorded events back on a dedicated thread.
+
+	The thread sleeps until just before each event and then waits on the clock, so events are sent on time while the Qt
+	event loop is busy in native code such as painting. Python code running in the GUI thread can still hold an event
+	back for up to the thread switch interval, which is shortened during playback. The difference between when each
+	event was due and when it was sent is kept.
+	"""
+
+	def __init__(self, events: List[AutomationEvent], send: Callable[[int, int], None]):
+		super().__init__(name='AutomationPlayer', daemon=True)
+		self.events = sorted(events)
+		self.send = send
+		self.stopped = threading.Event()
+		self.timing_errors: List[float] = []
+
+	def stop(self) -> None:
+		"""Stop playing, the event being waited on is not sent."""
+		self.stopped.set()
+
+	def run(self) -> None:
+		with playback_switch_interval():
+			self.play()
+
+	def play(self) -> None:
+		"""Send every event when it is due, until the end or until stopped."""
+		start = time.perf_counter()
+		for timestamp, control_id, value in self.events:
+			due = start + timestamp
+
+			# Sleep through most of the wait, waking early to stop if asked
+			remaining = due - time.perf_counter() - SPIN_MARGIN
+			if remaining > 0 and self.stopped.wait(remaining):
+				return
+			if self.stopped.is_set():
+				return
+
+			now = time.perf_counter()
+			while now < due:
+				now = time.perf_counter()
+
+			self.timing_errors.append(now - due)
+			self.send(control_id, value)
+
+	def timing_stats(self) -> Tuple[int, float, float]:
+		"""Get the number of events sent and the mean and worst timing error in seconds."""
+		errors = list(self.timing_errors)
+		if not errors:
+			return 0, 0.0, 0.0
+
+		return len(errors), sum(errors) / len(errors), max(errors)
+
@@ -0,0 +1,82 @@
+from collections import deque
+from typing import Optional, Tuple
+
+from package.amp_config import AmpConfig
+from package.amp_patch import diff_configs
+
+# A change to one setting: the field, its old value and its new value
+HistoryDelta = Tuple[str, int, int]
+
+# The most edits that can be undone, older ones are dropped
+HISTORY_LENGTH = 200
+
+
+class EditHistory:
+	"""
+	Undo and redo history of the amp settings, kept as the fields each edit changed rather than whole configurations.
+
+	The settings are compared against those of the last commit, so any number of changes between two commits, such as
+	every step of a dial drag, becomes a single entry. Both stacks are bounded, so memory stays the same however long
+	the session.
+	"""
+
+	def __init__(self, length: int = HISTORY_LENGTH):
+		self.undo_entries = deque(maxlen=length)
+		self.redo_entries = deque(maxlen=length)
+		self.committed: Optional[AmpConfig] = None
+
+	def commit(self, config: AmpConfig) -> bool:
+		"""
+		Record the settings changed since the last commit as one entry.
+
+		:param config: The configuration the amp holds now.
+		:return: Whether anything changed. The first commit only records the settings to compare against.
+		"""
+		committed, self.committed = self.committed, AmpConfig(bytes(config.data))
+		if committed is None:
+			return False
+
+		deltas = tuple((field, getattr(committed, field), getattr(config, field)) for field in diff_configs(committed, config))
+		if not deltas:
+			return False
+
+		self.undo_entries.append(deltas)
+		self.redo_entries.clear()
+		return True
+
+	def undo(self, config: AmpConfig) -> Optional[AmpConfig]:
+		"""
+		Step back through the history.
+
+		:param config: The configuration the amp holds now, with everything since the last commit already committed.
+		:return: The configuration to switch to, or None if there is nothing to undo.
+		"""
+		if not self.undo_entries:
+			return None
+
+		deltas = self.undo_entries.pop()
+		self.redo_entries.append(deltas)
+		return self.apply(config, ((field, new, old) for field, old, new in deltas))
+
+	def redo(self, config: AmpConfig) -> Optional[AmpConfig]:
+		"""
+		Step forward through the history again.
+
+		:param config: The configuration the amp holds now, with everything since the last commit already committed.
+		:return: The configuration to switch to, or None if there is nothing to redo.
+		"""
+		if not self.redo_entries:
+			return None
+
+		deltas = self.redo_entries.pop()
+		self.undo_entries.append(deltas)
+		return self.apply(config, deltas)
+
+	def apply(self, config: AmpConfig, deltas) -> AmpConfig:
+		"""Get a configuration with deltas applied, which becomes the settings the next commit compares against."""
+		target = AmpConfig(bytes(config.data))
+		for field, _, new in deltas:
+			setattr(target, field, new)
+
+		self.committed = AmpConfig(bytes(target.data))
+		return target
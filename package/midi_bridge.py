@@ -0,0 +1,122 @@
+import json
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import mido
+
+from package.amp_patch import CONTROL_IDS, field_messages
+
+# Messages forwarded for a controller value, looked up by control ID and then by value
+ControlTable = Dict[int, Tuple[Tuple[mido.Message, ...], ...]]
+
+
+def load_mappings(path: str) -> list:
+	"""
+	Load the mapping rules of a foot controller from a JSON file.
+
+	The file holds a list of rules, each remapping one control ID of the controller:
+	{"control": 20, "program": null} sends the value as a program change.
+	{"control": 21, "program": 5} sends program 5 whenever the control is pressed.
+	{"control": 22, "field": "GAIN", "minimum": 0, "maximum": 100} scales the value onto an amp setting.
+	"""
+	with open(path, 'r') as file:
+		return json.load(file)
+
+
+def scale(value: int, minimum: int, maximum: int) -> int:
+	"""Scale a 0-127 controller value onto a range."""
+	return minimum + round(value * (maximum - minimum) / 127)
+
+
+def compile_mappings(mappings: list) -> ControlTable:
+	"""
+	Compile mapping rules into the messages to send for every value of every remapped control.
+
+	Everything is built ahead of time so handling a message is a single lookup. Unmapped controls are forwarded as-is.
+	"""
+	table = {}
+	for mapping in mappings:
+		control = mapping['control']
+		if 'program' in mapping:
+			program = mapping['program']
+			if program is None:
+				table[control] = tuple((mido.Message('program_change', program=value),) for value in range(128))
+			else:
+				press = (mido.Message('program_change', program=program),)
+				table[control] = ((),) + (press,) * 127
+		elif 'field' in mapping:
+			field = mapping['field']
+			if field not in CONTROL_IDS:
+				raise ValueError(f'Unknown field {field} for control {control}.')
+
+			minimum = mapping.get('minimum', 0)
+			maximum = mapping.get('maximum', 127)
+			table[control] = tuple(
+				tuple(mido.Message('control_change', control=control_id, value=scaled)
+					for control_id, scaled in field_messages(field, scale(value, minimum, maximum)))
+				for value in range(128)
+			)
+		else:
+			raise ValueError(f'Mapping for control {control} needs a program or a field.')
+
+	return table
+
+
+class MIDIBridge:
+	"""
+	Forward a foot controller to the amp, remapping its messages on the way.
+
+	Messages are handled in the MIDI input thread as they arrive and sent through the locked send path of the amp
+	interface, so the Qt event loop is never in the way. The time from receiving each message to the amp having its
+	remapped messages is recorded.
+	"""
+
+	def __init__(self, interface, mappings: Optional[list] = None):
+		self.interface = interface
+		self.port = None
+		self.controls = compile_mappings(mappings or [])
+		self.stats_lock = threading.Lock()
+		self.message_count = 0
+		self.total_latency = 0.0
+		self.maximum_latency = 0.0
+
+		# Set when the amp settings changed behind the widgets, cleared once the main window has refreshed them
+		self.pending_refresh = False
+
+	def open(self, port_name: str) -> None:
+		"""Start forwarding the messages of a controller port."""
+		self.port = mido.open_input(port_name, callback=self.handle_message)
+
+	def close(self) -> None:
+		"""Stop forwarding and close the controller port."""
+		if self.port is not None:
+			self.port.close()
+			self.port = None
+
+	def handle_message(self, msg: mido.Message) -> None:
+		"""Remap and forward a message from the controller."""
+		start = time.perf_counter()
+
+		if msg.type == 'control_change':
+			messages = self.controls.get(msg.control)
+			messages = messages[msg.value] if messages is not None else (msg,)
+		elif msg.type == 'program_change':
+			messages = (msg,)
+		else:
+			return
+
+		self.interface.send_messages(messages)
+		self.pending_refresh = True
+
+		latency = time.perf_counter() - start
+		with self.stats_lock:
+			self.message_count += 1
+			self.total_latency += latency
+			self.maximum_latency = max(self.maximum_latency, latency)
+
+	def latency_stats(self) -> Tuple[int, float, float]:
+		"""Get the number of messages forwarded and the mean and worst added latency in seconds."""
+		with self.stats_lock:
+			mean = self.total_latency / self.message_count if self.message_count else 0.0
+			return self.message_count, mean, self.maximum_latency
@@ -0,0 +1,230 @@
+import json
+import mmap
+import struct
+from typing import Iterable, Iterator, Optional
+
+from package.amp_config import NAME_LENGTH, NAME_OFFSET, SYSEX_LENGTH, AmpConfig, decode_name, load_bank
+
+# A bank file is a header, then one fixed-size record per preset in the SysEx layout, then a name index
+BANK_MAGIC = b'MCPB'
+BANK_VERSION = 1
+BANK_EXTENSION = '.codebank'
+JSON_LINES_EXTENSION = '.jsonl'
+HEADER_STRUCT = struct.Struct('<4sHHII')   # Magic, version, record size, record count, name index offset
+INDEX_STRUCT = struct.Struct('<I')   # Record position, the index lists them sorted by lower-case name
+
+
+class PresetBankWriter:
+	"""
+	Write a preset bank file one record at a time.
+
+	Records are streamed straight to disk, only the lower-case names are kept to build the name index when closing.
+	The header is left blank until then, so a bank that failed part way through is never mistaken for a valid one.
+	"""
+
+	def __init__(self, path: str):
+		self.file = open(path, 'wb')
+		self.file.write(bytes(HEADER_STRUCT.size))
+		self.names = []
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback) -> None:
+		if exc_type is None:
+			self.close()
+		else:
+			self.abort()
+
+	def write(self, config: AmpConfig) -> None:
+		"""Append a preset to the bank."""
+		self.file.write(config.data[:SYSEX_LENGTH])
+		self.names.append(config.PRESET_NAME.lower())
+
+	def close(self) -> None:
+		"""Write the name index and the final header, then close the file."""
+		if self.file.closed:
+			return
+
+		index_offset = self.file.tell()
+		for position in sorted(range(len(self.names)), key=self.names.__getitem__):
+			self.file.write(INDEX_STRUCT.pack(position))
+
+		self.file.seek(0)
+		self.file.write(HEADER_STRUCT.pack(BANK_MAGIC, BANK_VERSION, SYSEX_LENGTH, len(self.names), index_offset))
+		self.file.close()
+
+	def abort(self) -> None:
+		"""Close the file without writing the header, leaving it an invalid bank."""
+		self.file.close()
+
+
+class PresetBank:
+	"""
+	A memory-mapped preset bank file.
+
+	Opening a bank only reads its header. Any single preset is read from its record in the mapping in O(1), as a copy
+	so it can outlive the bank. Lookups by name binary search the name index, reading only the names they compare.
+	"""
+
+	def __init__(self, path: str):
+		with open(path, 'rb') as file:
+			try:
+				self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+			except ValueError:
+				# An empty file cannot be mapped
+				raise ValueError(f'{path} is not a preset bank.') from None
+
+		self.view = memoryview(self.mapping)
+		if len(self.view) < HEADER_STRUCT.size:
+			self.close()
+			raise ValueError(f'{path} is not a preset bank.')
+
+		magic, version, record_size, self.count, index_offset = HEADER_STRUCT.unpack_from(self.view)
+		if magic != BANK_MAGIC:
+			self.close()
+			raise ValueError(f'{path} is not a preset bank.')
+		if version != BANK_VERSION or record_size != SYSEX_LENGTH:
+			self.close()
+			raise ValueError(f'{path} is a preset bank version {version} with {record_size} byte records, which is not supported.')
+
+		self.index_offset = index_offset
+		records_end = HEADER_STRUCT.size + self.count * SYSEX_LENGTH
+		if records_end > index_offset or index_offset + self.count * INDEX_STRUCT.size > len(self.view):
+			self.close()
+			raise ValueError(f'{path} is a truncated preset bank.')
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback) -> None:
+		self.close()
+
+	def close(self) -> None:
+		"""Release the mapping and the file it keeps open."""
+		if self.mapping.closed:
+			return
+
+		self.view.release()
+		self.mapping.close()
+
+	def __len__(self) -> int:
+		return self.count
+
+	def __getitem__(self, position: int) -> AmpConfig:
+		if position < 0:
+			position += self.count
+		if not 0 <= position < self.count:
+			raise IndexError(f'Preset {position} is out of range for a bank of {self.count} presets.')
+
+		offset = HEADER_STRUCT.size + position * SYSEX_LENGTH
+		return AmpConfig(bytes(self.view[offset:offset + SYSEX_LENGTH]))
+
+	def __iter__(self) -> Iterator[AmpConfig]:
+		for position in range(self.count):
+			yield self[position]
+
+	def records(self) -> memoryview:
+		"""
+		Get every record as one buffer, for loading in bulk with load_bank.
+
+		The buffer is a view over the mapping, so it must be released before the bank is closed.
+		"""
+		return self.view[HEADER_STRUCT.size:HEADER_STRUCT.size + self.count * SYSEX_LENGTH]
+
+	def position(self, rank: int) -> int:
+		"""Get the position of a preset by its rank in name order."""
+		return INDEX_STRUCT.unpack_from(self.view, self.index_offset + rank * INDEX_STRUCT.size)[0]
+
+	def indexed(self, rank: int) -> AmpConfig:
+		"""Get a preset by its rank in name order."""
+		return self[self.position(rank)]
+
+	def name(self, position: int) -> str:
+		"""Get the lower-case name of a preset without reading the rest of it."""
+		offset = HEADER_STRUCT.size + position * SYSEX_LENGTH + NAME_OFFSET
+		return decode_name(bytes(self.view[offset:offset + NAME_LENGTH])).lower()
+
+	def find(self, name: str) -> Optional[AmpConfig]:
+		"""Find a preset by name, ignoring case."""
+		name = name.lower()
+		low, high = 0, self.count
+		while low < high:
+			middle = (low + high) // 2
+			if self.name(self.position(middle)) < name:
+				low = middle + 1
+			else:
+				high = middle
+
+		if low < self.count and self.name(self.position(low)) == name:
+			return self.indexed(low)
+
+		return None
+
+
+def write_bank(path: str, configs: Iterable[AmpConfig]) -> None:
+	"""Write presets to a bank file."""
+	with PresetBankWriter(path) as writer:
+		for config in configs:
+			writer.write(config)
+
+
+def write_json_lines(path: str, configs: Iterable[AmpConfig]) -> None:
+	"""Write presets to a JSON Lines file, one preset per line."""
+	with open(path, 'w') as file:
+		for config in configs:
+			file.write(json.dumps(config.to_json()))
+			file.write('\n')
+
+
+def read_json_lines(path: str) -> Iterator[AmpConfig]:
+	"""Read presets from a JSON Lines file one line at a time, raising ValueError for a line that is not a preset."""
+	with open(path, 'r') as file:
+		for number, line in enumerate(file, 1):
+			if line.strip():
+				config = AmpConfig()
+				try:
+					config.load_from_json(json.loads(line))
+				except (ValueError, KeyError, TypeError) as e:
+					raise ValueError(f'Line {number} of {path} is not a preset: {e!r}') from e
+				yield config
+
+
+def export_bank(path: str, configs: Iterable[AmpConfig]) -> int:
+	"""
+	Stream presets to a bank file, choosing the format from the file extension.
+
+	:param path: The file to write, JSON Lines for .jsonl and the binary bank format otherwise.
+	:param configs: The presets to write, consumed one at a time.
+	:return: The number of presets written.
+	"""
+	count = 0
+
+	def counted(configs: Iterable[AmpConfig]) -> Iterator[AmpConfig]:
+		nonlocal count
+		for config in configs:
+			count += 1
+			yield config
+
+	if path.lower().endswith(JSON_LINES_EXTENSION):
+		write_json_lines(path, counted(configs))
+	else:
+		write_bank(path, counted(configs))
+
+	return count
+
+
+def import_bank(path: str) -> Iterator[AmpConfig]:
+	"""
+	Stream presets from a bank file, choosing the format from the file extension.
+
+	The records of a binary bank are copied out of the mapping in one go and loaded as a bank, so the presets can be
+	kept after the bank is closed.
+	"""
+	if path.lower().endswith(JSON_LINES_EXTENSION):
+		yield from read_json_lines(path)
+		return
+
+	with PresetBank(path) as bank, bank.records() as records:
+		buffer = bytes(records)
+	yield from load_bank(buffer)
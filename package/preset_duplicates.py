@@ -0,0 +1,42 @@
+from collections import defaultdict
+from typing import Dict, List
+
+from package.amp_config import AmpConfig
+
+
+class PresetDuplicateIndex:
+	"""A hash index from the content of presets to the rows holding it, so copies of a preset are found in O(1)."""
+
+	def __init__(self):
+		self.row_hashes: List[bytes] = []
+		self.rows: Dict[bytes, List[int]] = defaultdict(list)
+
+	def __len__(self) -> int:
+		return len(self.row_hashes)
+
+	def __contains__(self, content_hash: bytes) -> bool:
+		return content_hash in self.rows
+
+	def add(self, config: AmpConfig) -> List[int]:
+		"""Index a new preset and return the rows now holding its content, its own row last."""
+		content_hash = config.content_hash()
+		self.row_hashes.append(content_hash)
+		rows = self.rows[content_hash]
+		rows.append(len(self.row_hashes) - 1)
+		return rows
+
+	def update(self, row: int, config: AmpConfig) -> List[int]:
+		"""Re-index a preset whose settings changed and return every row whose copies changed, including its own."""
+		old_rows = self.rows[self.row_hashes[row]]
+		old_rows.remove(row)
+		if not old_rows:
+			del self.rows[self.row_hashes[row]]
+
+		self.row_hashes[row] = config.content_hash()
+		new_rows = self.rows[self.row_hashes[row]]
+		new_rows.append(row)
+		return old_rows + new_rows
+
+	def copies(self, row: int) -> int:
+		"""Count the other presets with the same settings as a preset."""
+		return len(self.rows[self.row_hashes[row]]) - 1
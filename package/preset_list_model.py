@@ -0,0 +1,214 @@
+from typing import Dict, Iterable, List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QAbstractProxyModel, QModelIndex, Qt
+from PySide6.QtGui import QBrush
+
+from package.amp_config import AmpConfig, decode_bank, pack_bank
+from package.preset_duplicates import PresetDuplicateIndex
+from package.preset_search import PresetSearchIndex
+from package.preset_similarity import PresetSimilarityIndex
+
+# The item data role holding the amp slot a preset was read from, or None for a preset that did not come from the amp
+SLOT_ROLE = Qt.ItemDataRole.UserRole
+
+# Presets with the same settings as another preset are shown in this color
+DUPLICATE_BRUSH = QBrush(Qt.GlobalColor.gray)
+
+
+class PresetListModel(QAbstractListModel):
+	"""A list model over the loaded presets, keeping their search, similarity and duplicate indexes up to date."""
+
+	def __init__(self, presets: List[AmpConfig], parent=None):
+		super().__init__(parent)
+		self.presets = presets
+		self.slots: List[Optional[int]] = [None] * len(presets)
+		self.search_index = PresetSearchIndex()
+		self.similarity_index = PresetSimilarityIndex()
+		self.duplicate_index = PresetDuplicateIndex()
+		for config, fields in zip(presets, decode_bank(pack_bank(preset.data for preset in presets))):
+			self.search_index.add(fields)
+			self.similarity_index.add(fields)
+			self.duplicate_index.add(config)
+
+	def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self.presets)
+
+	def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+		if not index.isValid():
+			return None
+
+		if role == Qt.ItemDataRole.DisplayRole:
+			return self.presets[index.row()].PRESET_NAME
+		if role == SLOT_ROLE:
+			return self.slots[index.row()]
+		if role == Qt.ItemDataRole.ForegroundRole:
+			return DUPLICATE_BRUSH if self.duplicate_index.copies(index.row()) else None
+		if role == Qt.ItemDataRole.ToolTipRole:
+			copies = self.duplicate_index.copies(index.row())
+			if copies:
+				return f'Same settings as {copies} other preset{"s" if copies > 1 else ""}'
+
+		return None
+
+	def emit_duplicates_changed(self, rows: Iterable[int]) -> None:
+		"""Repaint the rows whose number of copies changed."""
+		for row in rows:
+			index = self.index(row, 0)
+			self.dataChanged.emit(index, index, [Qt.ItemDataRole.ForegroundRole, Qt.ItemDataRole.ToolTipRole])
+
+	def append_presets(self, configs: Iterable[AmpConfig], from_amp: bool = False) -> int:
+		"""
+		Add presets to the end of the list.
+
+		:param configs: The presets to add.
+		:param from_amp: Whether the presets were just dumped from the amp, so each is switched to with a program change
+			to the slot in its preset number. The preset number of any other preset is only what its file recorded.
+		:return: The number of presets added.
+		"""
+		configs = list(configs)
+		if not configs:
+			return 0
+
+		# The indexes read most fields of every preset, so the new presets are decoded together as one bank
+		first = len(self.presets)
+		flagged_rows = set()
+		self.beginInsertRows(QModelIndex(), first, first + len(configs) - 1)
+		for config, fields in zip(configs, decode_bank(pack_bank(preset.data for preset in configs))):
+			self.presets.append(config)
+			self.slots.append(fields.PRESET_NUMBER if from_amp else None)
+			self.search_index.add(fields)
+			self.similarity_index.add(fields)
+
+			# The first copy of a preset that was already listed becomes a duplicate too
+			copies = self.duplicate_index.add(config)
+			if len(copies) == 2 and copies[0] < first:
+				flagged_rows.add(copies[0])
+		self.endInsertRows()
+
+		self.emit_duplicates_changed(sorted(flagged_rows))
+		return len(configs)
+
+	def set_preset(self, row: int, config: AmpConfig, slot: Optional[int] = None) -> None:
+		"""
+		Replace a preset, re-indexing only that preset.
+
+		:param row: The preset to replace.
+		:param config: The new settings of the preset.
+		:param slot: The amp slot holding the new settings, if any.
+		"""
+		self.presets[row] = config
+		self.slots[row] = slot
+		self.search_index.update(row, config)
+		self.similarity_index.update(row, config)
+		changed_rows = self.duplicate_index.update(row, config)
+		self.dataChanged.emit(self.index(row, 0), self.index(row, 0))
+		self.emit_duplicates_changed(other for other in changed_rows if other != row)
+
+
+class PresetFilterModel(QAbstractProxyModel):
+	"""
+	A proxy showing the presets matching the search query, best match first.
+
+	Matches and their ranking come from the search index of the source model. Presets added while the query is empty
+	are appended as they are, any other change to the source runs the query again. The proxy can instead show the
+	presets closest to a preset, until the next query.
+	"""
+
+	def __init__(self, parent=None):
+		super().__init__(parent)
+		self.query = ''
+		self.similar_to: Optional[int] = None
+		self.similar_count = 0
+		self.rows: List[int] = []
+		self.positions: Optional[Dict[int, int]] = None
+
+	def setSourceModel(self, source: PresetListModel) -> None:
+		self.beginResetModel()
+		super().setSourceModel(source)
+		source.rowsInserted.connect(self.__handle_rows_inserted)
+		source.dataChanged.connect(self.__handle_data_changed)
+		source.modelReset.connect(self.refresh)
+		self.rows = source.search_index.search(self.query)
+		self.positions = None
+		self.endResetModel()
+
+	def set_query(self, query: str) -> None:
+		"""Show only the presets matching the query, ranked by how well they match."""
+		if query.lower() != self.query or self.similar_to is not None:
+			self.query = query.lower()
+			self.similar_to = None
+			self.refresh()
+
+	def show_similar(self, row: int, count: int) -> None:
+		"""Show a preset followed by the presets that sound closest to it."""
+		self.similar_to = row
+		self.similar_count = count
+		self.refresh()
+
+	def refresh(self) -> None:
+		"""Run the query or similarity search again over the whole source."""
+		if self.similar_to is not None:
+			rows = [self.similar_to, *self.sourceModel().similarity_index.nearest(self.similar_to, self.similar_count)]
+		else:
+			rows = self.sourceModel().search_index.search(self.query)
+
+		self.beginResetModel()
+		self.rows = rows
+		self.positions = None
+		self.endResetModel()
+
+	def __handle_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: List[int] = ()) -> None:
+		# Changes that leave the names and settings alone cannot change the matches, so they are only passed on
+		if roles and Qt.ItemDataRole.DisplayRole not in roles:
+			for row in range(top_left.row(), bottom_right.row() + 1):
+				index = self.mapFromSource(self.sourceModel().index(row, 0))
+				if index.isValid():
+					self.dataChanged.emit(index, index, roles)
+			return
+
+		self.refresh()
+
+	def __handle_rows_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+		if self.query or self.similar_to is not None:
+			self.refresh()
+			return
+
+		self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + last - first)
+		self.rows.extend(range(first, last + 1))
+		self.positions = None
+		self.endInsertRows()
+
+	def mapToSource(self, proxy_index: QModelIndex) -> QModelIndex:
+		if not proxy_index.isValid():
+			return QModelIndex()
+
+		return self.sourceModel().index(self.rows[proxy_index.row()], 0)
+
+	def mapFromSource(self, source_index: QModelIndex) -> QModelIndex:
+		if not source_index.isValid():
+			return QModelIndex()
+
+		# Ranked rows are not in source order, so their positions are looked up rather than searched for
+		if self.positions is None:
+			self.positions = {row: position for position, row in enumerate(self.rows)}
+
+		position = self.positions.get(source_index.row())
+		if position is None:
+			return QModelIndex()
+
+		return self.index(position, 0)
+
+	def index(self, row: int, column: int = 0, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+		if parent.isValid() or column != 0 or not 0 <= row < len(self.rows):
+			return QModelIndex()
+
+		return self.createIndex(row, column)
+
+	def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+		return QModelIndex()
+
+	def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self.rows)
+
+	def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else 1
@@ -0,0 +1,173 @@
+import threading
+import time
+from typing import Callable, List, Tuple
+
+from package.amp_config import DELAY_TIME_MAXIMUM, DIAL_MAXIMUM, AmpConfig
+from package.amp_patch import TYPE_FIELDS, diff_configs, field_messages
+
+# How often a morph sends the settings it has reached
+MORPH_STEP = 0.001
+
+# The most control changes a morph sends per millisecond, about what a 5-pin MIDI link carries. Unused allowance
+# carries over to later steps up to a burst of two messages, enough for the MSB and LSB of the delay time
+MESSAGES_PER_MS = 1.0
+MESSAGE_BURST = 2
+
+# The type field deciding what the parameters of each effect block mean
+BLOCK_TYPES = {
+	"PEDAL": "PEDAL_TYPE",
+	"MODULATION": "MODULATION_TYPE",
+	"DELAY": "DELAY_TYPE",
+	"REVERB": "REVERB_TYPE"
+}
+
+# Parameters picked from a list rather than a dial. PEDAL_P1 is a dial only for the compressor, and DELAY_P3 is the
+# tap pattern list of the multi delay
+MODE_FIELDS = ("PEDAL_P1", "MODULATION_P1")
+COMPRESSOR_TYPE = 0
+MULTI_DELAY_TYPE = 2
+
+
+def is_continuous(field: str, old: AmpConfig, new: AmpConfig) -> bool:
+	"""
+	Check whether a field can be swept between two configurations.
+
+	Types, on and off states and modes can only switch. The parameters of an effect whose type changes also switch,
+	since their values mean something else on either side.
+	"""
+	if field in TYPE_FIELDS or field.endswith("_STATE"):
+		return False
+
+	block = field.rsplit("_", 1)[0]
+	if block in BLOCK_TYPES and getattr(old, BLOCK_TYPES[block]) != getattr(new, BLOCK_TYPES[block]):
+		return False
+
+	return not is_mode(field, old)
+
+
+def is_mode(field: str, config: AmpConfig) -> bool:
+	"""Check whether a field is picked from a list for the effect types of a configuration."""
+	if field == "PEDAL_P1":
+		return config.PEDAL_TYPE != COMPRESSOR_TYPE
+	if field == "DELAY_P3":
+		return config.DELAY_TYPE == MULTI_DELAY_TYPE
+
+	return field in MODE_FIELDS
+
+
+def morph_config(old: AmpConfig, new: AmpConfig, position: float, switch_point: float = 0.5) -> AmpConfig:
+	"""
+	Get the configuration part of the way through a morph.
+
+	:param old: The configuration the morph starts from.
+	:param new: The configuration the morph ends at.
+	:param position: How far through the morph, from 0 to 1.
+	:param switch_point: How far through the morph the fields that cannot be swept switch over.
+	:return: A new configuration with the continuous fields interpolated.
+	"""
+	config = AmpConfig(bytes(old.data))
+	for field in diff_configs(old, new):
+		if is_continuous(field, old, new):
+			start = getattr(old, field)
+			setattr(config, field, round(start + (getattr(new, field) - start) * position))
+		elif position >= switch_point:
+			setattr(config, field, getattr(new, field))
+
+	return config
+
+
+def compile_budgeted_patch(sent: AmpConfig, target: AmpConfig, budget: int) -> List[Tuple[int, int]]:
+	"""
+	Compile the control changes moving the amp towards a configuration, sending no more than a budget of messages.
+
+	Only fields that differ from what was last sent are included, and each field is sent with its latest value, so a
+	field that misses out on one step is coalesced into the next. Types go first, then states and modes, then the
+	continuous fields furthest from their target. A field needing more messages than the budget waits for a step with
+	a larger one.
+
+	:param sent: The configuration the amp was last sent, updated with the fields included in the patch.
+	:param target: The configuration to move towards.
+	:param budget: The most messages to include.
+	:return: The control changes to send, in order.
+	"""
+	def priority(field: str) -> tuple:
+		if field in TYPE_FIELDS:
+			return 0, 0.0
+		if field.endswith("_STATE") or is_mode(field, target):
+			return 1, 0.0
+
+		maximum = DELAY_TIME_MAXIMUM if field == "DELAY_P1" else DIAL_MAXIMUM
+		return 2, -abs(getattr(target, field) - getattr(sent, field)) / maximum
+
+	messages = []
+	for field in sorted(diff_configs(sent, target), key=priority):
+		field_patch = field_messages(field, getattr(target, field))
+		if len(messages) + len(field_patch) > budget:
+			break
+
+		messages.extend(field_patch)
+		setattr(sent, field, getattr(target, field))
+
+	return messages
+
+
+class PresetMorph(threading.Thread):
+	"""
+	Morph the amp from one configuration to another on a dedicated thread.
+
+	Every millisecond the continuous fields are interpolated, the others switch once the switch point is reached, and
+	the fields that changed are sent within the message allowance, which grows by the message rate each millisecond.
+	Messages are therefore spread evenly rather than sent in bursts. Once the end is reached, steps continue until
+	every field that was held back has been sent.
+	"""
+
+	def __init__(self, old: AmpConfig, new: AmpConfig, duration: float, send: Callable[[int, int], None],
+			switch_point: float = 0.5, messages_per_ms: float = MESSAGES_PER_MS):
+		super().__init__(name='PresetMorph', daemon=True)
+		self.old = old
+		self.new = new
+		self.duration = duration
+		self.send = send
+		self.switch_point = switch_point
+		self.messages_per_ms = messages_per_ms
+		self.stopped = threading.Event()
+		self.message_count = 0
+		self.step_count = 0
+		self.elapsed = 0.0
+
+	def stop(self) -> None:
+		"""Stop the morph, leaving the amp part of the way through."""
+		self.stopped.set()
+
+	def run(self) -> None:
+		sent = AmpConfig(bytes(self.old.data))
+		start = time.perf_counter()
+		previous_step = start
+		allowance = float(MESSAGE_BURST)
+		while not self.stopped.is_set():
+			now = time.perf_counter()
+			position = min((now - start) / self.duration, 1.0) if self.duration > 0 else 1.0
+			allowance = min(allowance + (now - previous_step) * 1000 * self.messages_per_ms, MESSAGE_BURST)
+			previous_step = now
+
+			target = morph_config(self.old, self.new, position, self.switch_point)
+			patch = compile_budgeted_patch(sent, target, int(allowance))
+			for control_id, value in patch:
+				self.send(control_id, value)
+
+			allowance -= len(patch)
+			self.message_count += len(patch)
+			self.step_count += 1
+			if position == 1.0 and not diff_configs(sent, self.new):
+				break
+
+			# Steps are timed from the start, so a slow step does not push back the ones after it
+			self.stopped.wait(MORPH_STEP - (time.perf_counter() - start) % MORPH_STEP)
+
+		self.elapsed = time.perf_counter() - start
+
+	@property
+	def finished(self) -> bool:
+		"""Whether the amp reached the new configuration."""
+		return not self.is_alive() and not self.stopped.is_set()
+
@@ -0,0 +1,232 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from package.amp_config import AmpConfig, PresetFields
+
+# The model and effect names for each type value, in the same order as the lists and tabs of the main window
+AMP_MODELS = (
+	"Marshall JTM45", "Marshall DSL", "Clean American", "Marshall JVM410H", "Acoustic", "Marshall Bluesbreaker",
+	"Marshall Plexi", "Crunch American", "Marshall JCM800", "50's British", "Marshall JVM", "Marshall DSL",
+	"OD American", "Marshall Silver Jubilee", "Natural"
+)
+POWER_AMP_MODELS = ("Classic Marshall 100w", "Vintage Marshall 30w", "British Class A", "American Class A/B")
+CABINET_MODELS = ("1960", "1960V", "1960X", "1960HW", "1936", "1936V", "1912", "1974CX")
+PEDAL_EFFECTS = ("Compressor", "Distortion", "Auto Wah", "Pitch Shifter")
+MODULATION_EFFECTS = ("Chorus", "Flanger", "Phaser", "Tremolo")
+DELAY_EFFECTS = ("Studio Delay", "Vintage Delay", "Multi Delay", "Reverse Delay")
+REVERB_EFFECTS = ("Room Reverb", "Hall Reverb", "Spring Reverb", "Stadium Reverb")
+
+# Matches in the preset name count for more than matches in its signal chain
+NAME_WEIGHT = 2
+ATTRIBUTE_WEIGHT = 1
+TOKEN_CACHE_SIZE = 256
+
+# The most characters of a search token that may be missing from a match, however long the token
+MAXIMUM_TYPOS = 2
+
+
+def type_name(names: tuple, value: int) -> str:
+	"""Get the name of a type value, or an empty string for a value outside the known types."""
+	return names[value] if 0 <= value < len(names) else ''
+
+
+def preset_terms(config: Union[AmpConfig, PresetFields]) -> Dict[str, int]:
+	"""Get the lower-case words a preset can be found by, each with its weight."""
+	attributes = [
+		type_name(AMP_MODELS, config.AMP_TYPE),
+		type_name(POWER_AMP_MODELS, config.POWER_AMP_TYPE),
+		type_name(CABINET_MODELS, config.CABINET_TYPE)
+	]
+	if config.PEDAL_STATE:
+		attributes.append(type_name(PEDAL_EFFECTS, config.PEDAL_TYPE))
+	if config.MODULATION_STATE:
+		attributes.append(type_name(MODULATION_EFFECTS, config.MODULATION_TYPE))
+	if config.DELAY_STATE:
+		attributes.append(type_name(DELAY_EFFECTS, config.DELAY_TYPE))
+	if config.REVERB_STATE:
+		attributes.append(type_name(REVERB_EFFECTS, config.REVERB_TYPE))
+
+	terms = {term: ATTRIBUTE_WEIGHT for attribute in attributes for term in attribute.lower().split()}
+	terms.update((term, NAME_WEIGHT) for term in config.PRESET_NAME.lower().split())
+	return terms
+
+
+def allowed_typos(token: str) -> int:
+	"""Get how many characters of a search token may be missing from a match, one for every four typed up to a limit."""
+	return min(len(token) // 4, MAXIMUM_TYPOS)
+
+
+def fuzzy_score(token: str, term: str) -> int:
+	"""
+	Score how well a search token matches a word, or 0 if it does not.
+
+	Prefixes score highest, then substrings, then the characters of the token appearing in order with gaps. Runs of
+	consecutive characters score more than scattered ones, and a few characters may be missing to allow for typos.
+	"""
+	if term.startswith(token):
+		return 3 * len(token) + (2 if len(token) == len(term) else 0)
+	if token in term:
+		return 2 * len(token)
+
+	score = 0
+	typos = 0
+	position = 0
+	previous = -2
+	for character in token:
+		found = term.find(character, position)
+		if found == -1:
+			typos += 1
+			if typos > allowed_typos(token):
+				return 0
+			continue
+
+		score += 2 if found == previous + 1 else 1
+		previous = found
+		position = found + 1
+
+	return max(score - 2 * typos, 1)
+
+
+class PresetSearchIndex:
+	"""
+	An inverted index from the words of preset names and signal chains to their rows, for ranked fuzzy search.
+
+	Search tokens are scored against the distinct words rather than every preset, and a character index narrows those
+	down to the words holding enough of the token's characters to match. The matching presets are then gathered and
+	ranked as sets of rows sharing a score, starting from the token matching the fewest presets so the other tokens
+	only gather rows among its matches. Changing a preset only touches its own words.
+	"""
+
+	def __init__(self):
+		self.row_terms: List[Dict[str, int]] = []
+		self.postings: Dict[str, Dict[int, Set[int]]] = defaultdict(dict)
+		self.characters: Dict[str, Set[str]] = defaultdict(set)
+		self.token_scores: Dict[str, Dict[str, int]] = {}
+		self.token_groups_cache: Dict[str, List[Tuple[int, Set[int]]]] = {}
+
+	def __len__(self) -> int:
+		return len(self.row_terms)
+
+	def add(self, config: Union[AmpConfig, PresetFields]) -> int:
+		"""Index a new preset and return its row."""
+		self.row_terms.append({})
+		row = len(self.row_terms) - 1
+		self.update(row, config)
+		return row
+
+	def update(self, row: int, config: Union[AmpConfig, PresetFields]) -> None:
+		"""Re-index a preset whose name or settings changed."""
+		self.token_groups_cache.clear()
+		for term, weight in self.row_terms[row].items():
+			postings = self.postings[term]
+			postings[weight].discard(row)
+			if not postings[weight]:
+				del postings[weight]
+			if not postings:
+				del self.postings[term]
+				for character in set(term):
+					self.characters[character].discard(term)
+				self.token_scores.clear()
+
+		terms = preset_terms(config)
+		for term, weight in terms.items():
+			if term not in self.postings:
+				for character in set(term):
+					self.characters[character].add(term)
+				self.token_scores.clear()
+			self.postings[term].setdefault(weight, set()).add(row)
+		self.row_terms[row] = terms
+
+	def match_terms(self, token: str) -> Dict[str, int]:
+		"""Score the indexed words against a search token, keeping only the words it matches."""
+		if token in self.token_scores:
+			return self.token_scores[token]
+
+		# A word can only match if it holds the token's distinct characters, less the allowed number of typos. Missing
+		# that many, it still holds one of the characters of any one more sets, so only the rarest are gathered and the
+		# rest are checked per word
+		character_sets = sorted((self.characters.get(character, set()) for character in set(token)), key=len)
+		misses = len(character_sets) - max(len(character_sets) - allowed_typos(token), 1)
+		candidates = set().union(*character_sets[:misses + 1])
+		if misses:
+			candidates = [
+				term for term in candidates
+				if sum(term not in characters for characters in character_sets) <= misses
+			]
+		else:
+			candidates.intersection_update(*character_sets[1:])
+
+		scores = {}
+		for term in candidates:
+			score = fuzzy_score(token, term)
+			if score:
+				scores[term] = score
+
+		if len(self.token_scores) >= TOKEN_CACHE_SIZE:
+			self.token_scores.clear()
+		self.token_scores[token] = scores
+		return scores
+
+	def match_count(self, token: str) -> int:
+		"""Estimate how many presets match a search token, counting a preset once for each of its matching words."""
+		return sum(len(rows) for term in self.match_terms(token) for rows in self.postings[term].values())
+
+	def token_groups(self, token: str, candidates: Optional[Set[int]] = None) -> List[Tuple[int, Set[int]]]:
+		"""
+		Group the presets matching a search token by the best score among their words, highest first.
+
+		:param token: The search token.
+		:param candidates: The only rows to consider. Groups over every row are cached until the index changes.
+		"""
+		if candidates is None and token in self.token_groups_cache:
+			return self.token_groups_cache[token]
+
+		contributions = defaultdict(set)
+		for term, score in self.match_terms(token).items():
+			for weight, rows in self.postings[term].items():
+				contributions[score * weight] |= rows if candidates is None else rows & candidates
+
+		groups = []
+		seen = set()
+		for value in sorted(contributions, reverse=True):
+			rows = contributions[value] - seen
+			if rows:
+				groups.append((value, rows))
+				seen |= rows
+
+		if candidates is None:
+			if len(self.token_groups_cache) >= TOKEN_CACHE_SIZE:
+				self.token_groups_cache.clear()
+			self.token_groups_cache[token] = groups
+		return groups
+
+	def search(self, query: str) -> List[int]:
+		"""
+		Find the presets matching every word of a query, best match first.
+
+		:param query: The words to search for, matched against names, amp, power amp and cab models and active effects.
+		:return: The matching rows, ranked by their total score and then by row.
+		"""
+		tokens = query.lower().split()
+		if not tokens:
+			return list(range(len(self.row_terms)))
+
+		tokens.sort(key=self.match_count)
+		groups = self.token_groups(tokens[0])
+		for token in tokens[1:]:
+			# Every row sits in exactly one group per token, so pairing the groups gives each row its total score
+			candidates = set().union(*(rows for _, rows in groups))
+			token_groups = self.token_groups(token, candidates)
+			combined = defaultdict(set)
+			for value, rows in groups:
+				for token_value, token_rows in token_groups:
+					matched = rows & token_rows
+					if matched:
+						combined[value + token_value] |= matched
+			groups = sorted(combined.items(), reverse=True)
+
+		ranked = []
+		for _, rows in groups:
+			ranked.extend(sorted(rows))
+
+		return ranked
@@ -0,0 +1,105 @@
+from typing import List, Union
+
+import numpy as np
+
+from package.amp_config import DELAY_TIME_MAXIMUM, DIAL_MAXIMUM, AmpConfig, PresetFields
+
+# The number of types of each block, so types can be one-hot encoded
+AMP_TYPES = 15
+POWER_AMP_TYPES = 4
+CABINET_TYPES = 8
+EFFECT_TYPES = 4
+
+EFFECT_BLOCKS = (
+	("PEDAL_STATE", "PEDAL_TYPE", ("PEDAL_P1", "PEDAL_P2", "PEDAL_P3", "PEDAL_P4")),
+	("MODULATION_STATE", "MODULATION_TYPE", ("MODULATION_P1", "MODULATION_P2", "MODULATION_P3", "MODULATION_P4")),
+	("DELAY_STATE", "DELAY_TYPE", ("DELAY_P1", "DELAY_P2", "DELAY_P3", "DELAY_P4")),
+	("REVERB_STATE", "REVERB_TYPE", ("REVERB_P1", "REVERB_P2", "REVERB_P3", "REVERB_P4"))
+)
+DIALS = ("GAIN", "BASS", "MIDDLE", "TREBLE", "VOLUME", "GATE_THRESHOLD", "PRESENCE", "RESONANCE")
+VECTOR_LENGTH = (
+	len(DIALS) + 3 + AMP_TYPES + POWER_AMP_TYPES + CABINET_TYPES + len(EFFECT_BLOCKS) * (1 + EFFECT_TYPES + 4)
+)
+
+
+def one_hot(value: int, types: int) -> List[float]:
+	"""Encode a type value as one flag per type, all clear for a value outside the known types."""
+	return [1.0 if value == index else 0.0 for index in range(types)]
+
+
+def preset_vector(config: Union[AmpConfig, PresetFields]) -> List[float]:
+	"""
+	Describe the sound of a preset as a vector of values between 0 and 1.
+
+	Dials and effect parameters are scaled to their full range and types are one-hot, so changing the amp model weighs
+	about as much as turning a dial across its whole range. A disabled effect contributes nothing, whatever its settings.
+	"""
+	vector = [getattr(config, dial) / DIAL_MAXIMUM for dial in DIALS]
+	vector += [float(config.AMP_STATE), float(config.POWER_AMP_STATE), float(config.CABINET_STATE)]
+	vector += one_hot(config.AMP_TYPE, AMP_TYPES)
+	vector += one_hot(config.POWER_AMP_TYPE, POWER_AMP_TYPES)
+	vector += one_hot(config.CABINET_TYPE, CABINET_TYPES)
+
+	for state_field, type_field, parameter_fields in EFFECT_BLOCKS:
+		if not getattr(config, state_field):
+			vector += [0.0] * (1 + EFFECT_TYPES + len(parameter_fields))
+			continue
+
+		vector.append(1.0)
+		vector += one_hot(getattr(config, type_field), EFFECT_TYPES)
+		for field in parameter_fields:
+			maximum = DELAY_TIME_MAXIMUM if field == "DELAY_P1" else DIAL_MAXIMUM
+			vector.append(getattr(config, field) / maximum)
+
+	return vector
+
+
+class PresetSimilarityIndex:
+	"""
+	A matrix of preset vectors for nearest-neighbour queries.
+
+	Rows are stored in a preallocated matrix that doubles when full, alongside their squared norms, so a query is a
+	single matrix-vector product over the whole library.
+	"""
+
+	def __init__(self, capacity: int = 128):
+		self.vectors = np.zeros((capacity, VECTOR_LENGTH), dtype=np.float32)
+		self.norms = np.zeros(capacity, dtype=np.float32)
+		self.count = 0
+
+	def __len__(self) -> int:
+		return self.count
+
+	def add(self, config: Union[AmpConfig, PresetFields]) -> int:
+		"""Add a preset and return its row."""
+		if self.count == len(self.vectors):
+			self.vectors = np.concatenate((self.vectors, np.zeros_like(self.vectors)))
+			self.norms = np.concatenate((self.norms, np.zeros_like(self.norms)))
+
+		self.count += 1
+		self.update(self.count - 1, config)
+		return self.count - 1
+
+	def update(self, row: int, config: Union[AmpConfig, PresetFields]) -> None:
+		"""Replace the vector of a preset whose settings changed."""
+		self.vectors[row] = preset_vector(config)
+		self.norms[row] = self.vectors[row] @ self.vectors[row]
+
+	def nearest(self, row: int, count: int = 10) -> List[int]:
+		"""
+		Find the presets that sound closest to a preset.
+
+		:param row: The preset to compare against.
+		:param count: The most presets to return.
+		:return: The closest rows other than the preset itself, closest first.
+		"""
+		count = min(count, self.count - 1)
+		if count <= 0:
+			return []
+
+		vectors = self.vectors[:self.count]
+		distances = self.norms[:self.count] - 2 * (vectors @ vectors[row]) + self.norms[row]
+		distances[row] = np.inf
+
+		nearest = np.argpartition(distances, count - 1)[:count]
+		return nearest[np.argsort(distances[nearest], kind='stable')].tolist()
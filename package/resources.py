@@ -0,0 +1,16 @@
+import os
+
+from PySide6.QtCore import QResource
+
+RESOURCE_FILE = os.path.join(os.path.dirname(__file__), 'ui', 'resources.rcc')
+
+
+def register_resources() -> None:
+	"""
+	Register the compiled resource bundle with Qt.
+
+	The bundle is built by generate_gui.py as a binary .rcc file, which Qt memory-maps instead of keeping the
+	images resident as a Python bytes object. Lookup paths such as ":/code50amp/resources/code50.png" are unchanged.
+	"""
+	if not QResource.registerResource(RESOURCE_FILE):
+		raise FileNotFoundError(f'Unable to register resources from {RESOURCE_FILE}. Run generate_gui.py first.')
@@ -0,0 +1,79 @@
+from typing import List, NamedTuple, Optional, Tuple
+
+from package.amp_config import AmpConfig
+from package.amp_patch import compile_patch
+
+
+class SetlistEntry(NamedTuple):
+	"""A preset in a setlist, with the amp slot already holding its settings or -1 if none does."""
+	config: AmpConfig
+	content_hash: bytes
+	program: int
+
+
+class SetlistStep(NamedTuple):
+	"""Everything needed to switch to a setlist entry, worked out ahead of time."""
+	position: int
+	entry: SetlistEntry
+	patch: List[Tuple[int, int]]
+
+
+class Setlist:
+	"""
+	An ordered list of presets stepped through with next and previous.
+
+	Every entry is held in memory, and the patches between neighbouring entries are compiled as entries are added, so
+	a step only looks up what to send. A precompiled patch is used only while the amp still holds the settings of the
+	current entry, otherwise the patch from the amp's actual settings is compiled instead.
+	"""
+
+	def __init__(self):
+		self.entries: List[SetlistEntry] = []
+		self.next_patches: List[List[Tuple[int, int]]] = []
+		self.previous_patches: List[List[Tuple[int, int]]] = []
+		self.position = -1
+
+	def __len__(self) -> int:
+		return len(self.entries)
+
+	def add(self, config: AmpConfig, program: int = -1) -> None:
+		"""
+		Add a preset to the end of the setlist.
+
+		:param config: The preset to add.
+		:param program: The amp slot holding the same settings, switched to with a program change. Omitting this sends
+			the patch instead.
+		"""
+		entry = SetlistEntry(config, config.content_hash(), program)
+		if self.entries:
+			self.next_patches.append(compile_patch(self.entries[-1].config, config))
+			self.previous_patches.append(compile_patch(config, self.entries[-1].config))
+		self.entries.append(entry)
+
+	def clear(self) -> None:
+		"""Remove every entry."""
+		self.entries.clear()
+		self.next_patches.clear()
+		self.previous_patches.clear()
+		self.position = -1
+
+	def step(self, offset: int, current: AmpConfig) -> Optional[SetlistStep]:
+		"""
+		Move to the next or previous entry.
+
+		:param offset: 1 to move to the next entry, -1 to move to the previous one.
+		:param current: The configuration the amp holds now.
+		:return: The entry to switch to and the patch taking the amp there, or None at either end of the setlist.
+		"""
+		position = self.position + offset if self.position != -1 else 0
+		if not 0 <= position < len(self.entries):
+			return None
+
+		entry = self.entries[position]
+		if self.position != -1 and current.content_hash() == self.entries[self.position].content_hash:
+			patch = self.next_patches[self.position] if offset > 0 else self.previous_patches[position]
+		else:
+			patch = compile_patch(current, entry.config)
+
+		self.position = position
+		return SetlistStep(position, entry, patch)
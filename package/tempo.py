@@ -0,0 +1,172 @@
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+import mido
+
+from package.amp_config import DELAY_TIME_MAXIMUM
+from package.amp_patch import field_messages
+
+# The shortest delay time the amp accepts, in milliseconds
+DELAY_TIME_MINIMUM = 0
+
+# Taps further apart than this start a new tempo, and taps off the current tempo by more than the tolerance replace it
+TAP_TIMEOUT = 2.0
+TAP_TOLERANCE = 0.5
+TAP_HISTORY = 4
+
+# MIDI clock sends 24 ticks per quarter note. The tempo is measured across up to four beats of ticks, once there is one
+CLOCK_TICKS_PER_BEAT = 24
+CLOCK_WINDOW_BEATS = 4
+
+# The smallest change in delay time worth sending, in milliseconds
+DELAY_TIME_THRESHOLD = 3
+
+
+class TapTempo:
+	"""
+	Estimate a tempo from taps.
+
+	The beat is the median of the last few intervals between taps, so a single early or late tap barely moves it. A tap
+	far off the current tempo is taken as a new tempo rather than averaged in.
+	"""
+
+	def __init__(self):
+		self.last_tap: Optional[float] = None
+		self.intervals = deque(maxlen=TAP_HISTORY)
+
+	def tap(self, now: float) -> Optional[float]:
+		"""
+		Record a tap.
+
+		:param now: The time of the tap on the perf_counter clock.
+		:return: The seconds per beat, or None until there have been two taps close enough together.
+		"""
+		previous, self.last_tap = self.last_tap, now
+		if previous is None or now - previous > TAP_TIMEOUT:
+			self.intervals.clear()
+			return None
+
+		interval = now - previous
+		if self.intervals:
+			beat = self.beat()
+			if abs(interval - beat) > beat * TAP_TOLERANCE:
+				self.intervals.clear()
+		self.intervals.append(interval)
+
+		return self.beat()
+
+	def beat(self) -> float:
+		"""Get the seconds per beat of the taps so far."""
+		intervals = sorted(self.intervals)
+		middle = len(intervals) // 2
+		return intervals[middle] if len(intervals) % 2 else (intervals[middle - 1] + intervals[middle]) / 2
+
+
+class ClockTempo:
+	"""
+	Estimate a tempo from MIDI clock ticks.
+
+	The beat is measured from the oldest tick kept, up to four beats earlier, so the jitter of a single tick is spread
+	over as many as 96 intervals. Following a change of tempo takes the same four beats.
+	"""
+
+	def __init__(self):
+		self.ticks = deque(maxlen=CLOCK_TICKS_PER_BEAT * CLOCK_WINDOW_BEATS + 1)
+
+	def reset(self) -> None:
+		"""Forget the ticks so far, for when the clock starts or stops."""
+		self.ticks.clear()
+
+	def tick(self, now: float) -> Optional[float]:
+		"""
+		Record a clock tick.
+
+		:param now: The time of the tick on the perf_counter clock.
+		:return: The seconds per beat, or None until a whole beat of ticks has arrived.
+		"""
+		self.ticks.append(now)
+		if len(self.ticks) <= CLOCK_TICKS_PER_BEAT:
+			return None
+
+		return (self.ticks[-1] - self.ticks[0]) * CLOCK_TICKS_PER_BEAT / (len(self.ticks) - 1)
+
+
+def delay_time(beat: float, subdivision: float = 1.0) -> int:
+	"""Get the delay time in milliseconds repeating on a subdivision of a beat, within what the amp accepts."""
+	return min(max(round(beat * subdivision * 1000), DELAY_TIME_MINIMUM), DELAY_TIME_MAXIMUM)
+
+
+class DelayTempoSync:
+	"""
+	Set the delay time from tap tempo or from the MIDI clock of an external device.
+
+	Clock ticks are handled in the MIDI input thread as they arrive, and taps as soon as they are made. A new delay time
+	is sent only when it moves by at least the threshold, with the MSB and LSB sent together through the locked send
+	path of the amp interface.
+	"""
+
+	def __init__(self, interface, subdivision: float = 1.0):
+		self.interface = interface
+		self.subdivision = subdivision
+		self.port = None
+		self.taps = TapTempo()
+		self.clock = ClockTempo()
+		self.update_lock = threading.Lock()
+		self.delay_time = -1
+		self.update_count = 0
+
+		# Set when the delay time changed behind the widgets, cleared once the main window has refreshed them
+		self.pending_refresh = False
+
+	def open(self, port_name: str) -> None:
+		"""Start following the MIDI clock of a port."""
+		self.clock.reset()
+		self.port = mido.open_input(port_name, callback=self.handle_message)
+
+	def close(self) -> None:
+		"""Stop following the MIDI clock and close the port."""
+		if self.port is not None:
+			self.port.close()
+			self.port = None
+
+	def handle_message(self, msg: mido.Message) -> None:
+		"""Follow the clock ticks of a message from the clock port."""
+		if msg.type == 'clock':
+			beat = self.clock.tick(time.perf_counter())
+			if beat is not None:
+				self.update(beat)
+		elif msg.type in ('start', 'stop', 'continue'):
+			self.clock.reset()
+
+	def tap(self) -> Optional[float]:
+		"""Record a tap, returning the seconds per beat once there is a tempo."""
+		beat = self.taps.tap(time.perf_counter())
+		if beat is not None:
+			self.update(beat)
+
+		return beat
+
+	def update(self, beat: float) -> bool:
+		"""
+		Send the delay time for a beat if it differs enough from the one the amp has.
+
+		:return: Whether a new delay time was sent.
+		"""
+		value = delay_time(beat, self.subdivision)
+		with self.update_lock:
+			# Until the main window refreshes, its settings do not have the last delay time sent. After that they also
+			# follow the dial and preset changes made since
+			current = self.delay_time if self.pending_refresh else self.interface.main.amp_config.DELAY_P1
+			if abs(value - current) < DELAY_TIME_THRESHOLD:
+				return False
+
+			# Sending under the lock keeps a tap and a clock tick from reaching the amp out of order
+			self.interface.send_messages([mido.Message('control_change', control=control_id, value=data)
+				for control_id, data in field_messages('DELAY_P1', value)])
+			self.delay_time = value
+			self.update_count += 1
+			self.pending_refresh = True
+
+		return True
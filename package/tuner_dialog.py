@@ -1,19 +1,57 @@
-from PySide6.QtCore import QRectF
+import time
+
+from PySide6.QtCore import QRectF, QTimer
 from PySide6.QtGui import QPixmap, QBrush, QPen, Qt
 from PySide6.QtWidgets import QDialog, QGraphicsScene, QGraphicsRectItem
 
+from package.amp_midi_interface import midi_to_note
+from package.tuner_history import TunerHistory
 from package.ui.tuner_dialog_ui import Ui_Dialog
 
+# The x position, width and color of the segment shown for each accuracy level
+TUNING_SEGMENTS = (
+	(12, 96, Qt.GlobalColor.red),
+	(122, 76, Qt.GlobalColor.yellow),
+	(212, 56, Qt.GlobalColor.green),
+	(282, 76, Qt.GlobalColor.yellow),
+	(372, 96, Qt.GlobalColor.red)
+)
+
 
 class TunerDialog(QDialog, Ui_Dialog):
-	def __init__(self, main):
+	def __init__(self, main, refresh_rate: float = 0):
+		"""
+		Create the tuner dialog.
+
+		:param refresh_rate: How many times per second the tuner is redrawn. Omitting this follows the screen refresh rate.
+		"""
 		super().__init__()
 		self.setupUi(self)
 		self.main = main
 		self.scene = QGraphicsScene()
-		self.tuning_rectangle = QGraphicsRectItem()
+		self.tuning_segments = []
+		self.note = self.tunerLabel.text()
+		self.accuracy = -1
 		self.__setup_graphics_scene()
 
+		# Readings are posted here as they arrive and only the newest one is drawn on each display tick
+		self.refresh_rate = refresh_rate
+		self.pending_reading = None
+		self.history = TunerHistory()
+		self.refresh_timer = QTimer(self)
+		self.refresh_timer.setTimerType(Qt.TimerType.PreciseTimer)
+		self.refresh_timer.timeout.connect(self.__draw_pending_reading)
+
+	def showEvent(self, event) -> None:
+		refresh_rate = self.refresh_rate or self.screen().refreshRate()
+		self.refresh_timer.start(max(1, round(1000 / refresh_rate)))
+		super().showEvent(event)
+
+	def hideEvent(self, event) -> None:
+		self.refresh_timer.stop()
+		self.pending_reading = None
+		super().hideEvent(event)
+
 	def closeEvent(self, event) -> None:
 		self.main.interface.set_tuner_state(False)
 		event.accept()
@@ -27,25 +65,46 @@ class TunerDialog(QDialog, Ui_Dialog):
 		# Set the scene's rectangle to the size of the pixmap
 		self.scene.setSceneRect(QRectF(pixmap.rect()))
 
+		# Build every accuracy segment up front, drawing the tuner then only toggles their visibility
+		pen = QPen(Qt.GlobalColor.black)
+		for x, width, color in TUNING_SEGMENTS:
+			segment = QGraphicsRectItem(x, 102, width, 36)
+			segment.setBrush(QBrush(color))
+			segment.setPen(pen)
+			segment.setVisible(False)
+			self.scene.addItem(segment)
+			self.tuning_segments.append(segment)
+
 		self.tunerGraphicsView.setScene(self.scene)
 
+	def post_reading(self, midi_number: int, accuracy: int) -> None:
+		"""Post a tuner reading to be drawn on the next display tick, replacing any reading not yet drawn."""
+		# A reading the tuner has no segment for would break every later redraw while it is in the history
+		if not 0 <= accuracy < len(TUNING_SEGMENTS):
+			return
+
+		self.pending_reading = (midi_number, accuracy)
+		self.history.append(time.monotonic(), midi_number, accuracy)
+
+	def __draw_pending_reading(self) -> None:
+		"""Draw the newest posted reading, if there is one, and scroll the history strip."""
+		self.tunerHistoryWidget.draw_history(self.history, time.monotonic())
+		if self.pending_reading is None:
+			return
+
+		midi_number, accuracy = self.pending_reading
+		self.pending_reading = None
+		self.draw_tuner(midi_to_note(midi_number), accuracy)
+
 	def draw_tuner(self, note: str, accuracy: int) -> None:
 		"""Draw the tuner on the screen."""
-		self.tunerLabel.setText(note)
-		self.scene.removeItem(self.tuning_rectangle)
-
-		box_data = [
-			(12, 96, Qt.GlobalColor.red),
-			(122, 76, Qt.GlobalColor.yellow),
-			(212, 56, Qt.GlobalColor.green),
-			(282, 76, Qt.GlobalColor.yellow),
-			(372, 96, Qt.GlobalColor.red)
-		]
-
-		x, width, color = box_data[accuracy]
-
-		# Draw a rectangle to represent the accuracy of the tuning
-		self.tuning_rectangle = QGraphicsRectItem(x, 102, width, 36)
-		self.tuning_rectangle.setBrush(QBrush(color))
-		self.tuning_rectangle.setPen(QPen(Qt.GlobalColor.black))
-		self.scene.addItem(self.tuning_rectangle)
+		if note != self.note:
+			self.note = note
+			self.tunerLabel.setText(note)
+
+		if accuracy != self.accuracy:
+			segment = self.tuning_segments[accuracy]
+			if self.accuracy != -1:
+				self.tuning_segments[self.accuracy].setVisible(False)
+			segment.setVisible(True)
+			self.accuracy = accuracy
@@ -0,0 +1,125 @@
+from array import array
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QColor, QPainter, QPixmap
+from PySide6.QtWidgets import QWidget
+
+from package.amp_midi_interface import midi_to_note
+
+# The color of each accuracy level, from flat to sharp
+ACCURACY_COLORS = (
+	QColor(Qt.GlobalColor.red),
+	QColor(Qt.GlobalColor.yellow),
+	QColor(Qt.GlobalColor.green),
+	QColor(Qt.GlobalColor.yellow),
+	QColor(Qt.GlobalColor.red)
+)
+BACKGROUND_COLOR = QColor(Qt.GlobalColor.black)
+NOTE_COLOR = QColor(Qt.GlobalColor.white)
+
+
+class TunerHistory:
+	"""A fixed-size ring buffer of tuner readings, preallocated so appending never allocates."""
+
+	def __init__(self, capacity: int = 4096):
+		self.capacity = capacity
+		self.timestamps = array('d', bytes(8 * capacity))
+		self.notes = array('B', bytes(capacity))
+		self.accuracies = array('B', bytes(capacity))
+		self.count = 0
+
+	def append(self, timestamp: float, midi_number: int, accuracy: int) -> None:
+		"""Add a reading, overwriting the oldest one once the buffer is full."""
+		if not 0 <= accuracy < len(ACCURACY_COLORS):
+			raise ValueError(f'Accuracy must be between 0 and {len(ACCURACY_COLORS) - 1}. Got {accuracy}.')
+
+		index = self.count % self.capacity
+		self.timestamps[index] = timestamp
+		self.notes[index] = midi_number
+		self.accuracies[index] = accuracy
+		self.count += 1
+
+	def oldest(self) -> int:
+		"""Get the sequence number of the oldest reading still held."""
+		return max(0, self.count - self.capacity)
+
+	def reading(self, sequence: int) -> tuple:
+		"""Get the timestamp, note and accuracy of a reading by its sequence number."""
+		index = sequence % self.capacity
+		return self.timestamps[index], self.notes[index], self.accuracies[index]
+
+
+class TunerHistoryWidget(QWidget):
+	"""A scrolling strip showing the tuning accuracy of recent readings."""
+
+	def __init__(self, parent=None, seconds: float = 10.0):
+		super().__init__(parent)
+		self.seconds = seconds
+		self.strip = QPixmap()
+		self.drawn_count = 0
+		self.drawn_until = 0.0
+		self.last_note = -1
+
+	def resizeEvent(self, event) -> None:
+		self.strip = QPixmap(self.size())
+		self.reset()
+		super().resizeEvent(event)
+
+	def hideEvent(self, event) -> None:
+		self.reset()
+		super().hideEvent(event)
+
+	def reset(self) -> None:
+		"""Clear the strip, readings already in the history are redrawn on the next update."""
+		self.strip.fill(BACKGROUND_COLOR)
+		self.drawn_count = 0
+		self.drawn_until = 0.0
+		self.last_note = -1
+
+	def draw_history(self, history: TunerHistory, now: float) -> None:
+		"""
+		Bring the strip up to date with the history.
+
+		Only the newly exposed part of the strip and readings added since the last update are painted, everything
+		already drawn is scrolled along with the pixmap.
+		"""
+		width = self.strip.width()
+		height = self.strip.height()
+		pixels_per_second = width / self.seconds
+
+		shift = round((now - self.drawn_until) * pixels_per_second) if self.drawn_until else 0
+		if shift <= 0 and history.count == self.drawn_count:
+			return
+
+		painter = QPainter(self.strip)
+		try:
+			if self.drawn_until == 0.0:
+				self.drawn_until = now
+			elif shift > 0:
+				self.strip.scroll(-shift, 0, self.strip.rect())
+				painter.fillRect(width - shift, 0, shift, height, BACKGROUND_COLOR)
+				self.drawn_until += shift / pixels_per_second
+
+			lane_height = height / len(ACCURACY_COLORS)
+			for sequence in range(max(self.drawn_count, history.oldest()), history.count):
+				timestamp, note, accuracy = history.reading(sequence)
+				x = width - (self.drawn_until - timestamp) * pixels_per_second
+				if x < 0:
+					continue
+
+				painter.fillRect(QRectF(x - 1, accuracy * lane_height, 3, lane_height), ACCURACY_COLORS[accuracy])
+				if note != self.last_note:
+					self.last_note = note
+					painter.setPen(NOTE_COLOR)
+					painter.drawLine(round(x), 0, round(x), height)
+					painter.drawText(round(x) + 3, 12, midi_to_note(note))
+		finally:
+			painter.end()
+
+		self.drawn_count = history.count
+		self.update()
+
+	def paintEvent(self, event) -> None:
+		painter = QPainter(self)
+		painter.drawPixmap(0, 0, self.strip)
+		painter.end()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'auto_wah_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QLCDNumber, QLabel,
+    QListWidget, QListWidgetItem, QSizePolicy, QWidget)
+
+class Ui_AutoWahTab(object):
+    def setupUi(self, autoWahTab):
+        if not autoWahTab.objectName():
+            autoWahTab.setObjectName(u"autoWahTab")
+        autoWahTab.resize(327, 113)
+        self.autoWahSensitivityDial = QDial(autoWahTab)
+        self.autoWahSensitivityDial.setObjectName(u"autoWahSensitivityDial")
+        self.autoWahSensitivityDial.setGeometry(QRect(180, 0, 50, 64))
+        self.autoWahSensitivityDial.setAutoFillBackground(False)
+        self.autoWahSensitivityDial.setMaximum(100)
+        self.autoWahSensitivityDial.setWrapping(False)
+        self.autoWahSensitivityDial.setNotchesVisible(True)
+        self.autoWahFreqDisplay = QLCDNumber(autoWahTab)
+        self.autoWahFreqDisplay.setObjectName(u"autoWahFreqDisplay")
+        self.autoWahFreqDisplay.setGeometry(QRect(110, 80, 51, 23))
+        self.autoWahFreqDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.autoWahResDial = QDial(autoWahTab)
+        self.autoWahResDial.setObjectName(u"autoWahResDial")
+        self.autoWahResDial.setGeometry(QRect(250, 0, 50, 64))
+        self.autoWahResDial.setAutoFillBackground(False)
+        self.autoWahResDial.setMaximum(100)
+        self.autoWahResDial.setWrapping(False)
+        self.autoWahResDial.setNotchesVisible(True)
+        self.autoWahResDisplay = QLCDNumber(autoWahTab)
+        self.autoWahResDisplay.setObjectName(u"autoWahResDisplay")
+        self.autoWahResDisplay.setGeometry(QRect(250, 80, 51, 23))
+        self.autoWahResDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.autoWahFreqLabel = QLabel(autoWahTab)
+        self.autoWahFreqLabel.setObjectName(u"autoWahFreqLabel")
+        self.autoWahFreqLabel.setGeometry(QRect(110, 60, 49, 16))
+        self.autoWahFreqLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.autoWahResLabel = QLabel(autoWahTab)
+        self.autoWahResLabel.setObjectName(u"autoWahResLabel")
+        self.autoWahResLabel.setGeometry(QRect(250, 60, 49, 16))
+        self.autoWahResLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.autoWahSensitivityDisplay = QLCDNumber(autoWahTab)
+        self.autoWahSensitivityDisplay.setObjectName(u"autoWahSensitivityDisplay")
+        self.autoWahSensitivityDisplay.setGeometry(QRect(180, 80, 51, 23))
+        self.autoWahSensitivityDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.autoWahSensitivityLabel = QLabel(autoWahTab)
+        self.autoWahSensitivityLabel.setObjectName(u"autoWahSensitivityLabel")
+        self.autoWahSensitivityLabel.setGeometry(QRect(170, 60, 71, 20))
+        self.autoWahSensitivityLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.autoWahModeList = QListWidget(autoWahTab)
+        font = QFont()
+        font.setPointSize(12)
+        __qlistwidgetitem = QListWidgetItem(self.autoWahModeList)
+        __qlistwidgetitem.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem.setFont(font);
+        __qlistwidgetitem1 = QListWidgetItem(self.autoWahModeList)
+        __qlistwidgetitem1.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem1.setFont(font);
+        self.autoWahModeList.setObjectName(u"autoWahModeList")
+        self.autoWahModeList.setGeometry(QRect(20, 30, 51, 51))
+        self.autoWahModeList.setUniformItemSizes(False)
+        self.autoWahModeList.setSelectionRectVisible(False)
+        self.autoWahFreqDial = QDial(autoWahTab)
+        self.autoWahFreqDial.setObjectName(u"autoWahFreqDial")
+        self.autoWahFreqDial.setGeometry(QRect(110, 0, 50, 64))
+        self.autoWahFreqDial.setAutoFillBackground(False)
+        self.autoWahFreqDial.setMaximum(100)
+        self.autoWahFreqDial.setWrapping(False)
+        self.autoWahFreqDial.setNotchesVisible(True)
+        self.autoWahHelpLabel = QLabel(autoWahTab)
+        self.autoWahHelpLabel.setObjectName(u"autoWahHelpLabel")
+        self.autoWahHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(autoWahTab)
+
+        QMetaObject.connectSlotsByName(autoWahTab)
+    # setupUi
+
+    def retranslateUi(self, autoWahTab):
+        self.autoWahFreqLabel.setText(QCoreApplication.translate("AutoWahTab", u"FREQ", None))
+        self.autoWahResLabel.setText(QCoreApplication.translate("AutoWahTab", u"RES", None))
+        self.autoWahSensitivityLabel.setText(QCoreApplication.translate("AutoWahTab", u"SENSITIVITY", None))
+
+        __sortingEnabled = self.autoWahModeList.isSortingEnabled()
+        self.autoWahModeList.setSortingEnabled(False)
+        ___qlistwidgetitem = self.autoWahModeList.item(0)
+        ___qlistwidgetitem.setText(QCoreApplication.translate("AutoWahTab", u"ENV", None));
+        ___qlistwidgetitem1 = self.autoWahModeList.item(1)
+        ___qlistwidgetitem1.setText(QCoreApplication.translate("AutoWahTab", u"LFO", None));
+        self.autoWahModeList.setSortingEnabled(__sortingEnabled)
+
+#if QT_CONFIG(tooltip)
+        self.autoWahHelpLabel.setToolTip(QCoreApplication.translate("AutoWahTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">ENV (attack) / LFO (auto) modes</span></p><p align=\"center\"><img src=\":/PreFX_Auto_Wah/resources/pre-fx/auto_wah.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.autoWahHelpLabel.setText(QCoreApplication.translate("AutoWahTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'chorus_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QLCDNumber, QLabel,
+    QListWidget, QListWidgetItem, QSizePolicy, QWidget)
+
+class Ui_ChorusTab(object):
+    def setupUi(self, chorusTab):
+        if not chorusTab.objectName():
+            chorusTab.setObjectName(u"chorusTab")
+        chorusTab.resize(327, 113)
+        self.chorusToneDial = QDial(chorusTab)
+        self.chorusToneDial.setObjectName(u"chorusToneDial")
+        self.chorusToneDial.setGeometry(QRect(250, 0, 50, 64))
+        self.chorusToneDial.setAutoFillBackground(False)
+        self.chorusToneDial.setMaximum(100)
+        self.chorusToneDial.setWrapping(False)
+        self.chorusToneDial.setNotchesVisible(True)
+        self.chorusDepthDial = QDial(chorusTab)
+        self.chorusDepthDial.setObjectName(u"chorusDepthDial")
+        self.chorusDepthDial.setGeometry(QRect(180, 0, 50, 64))
+        self.chorusDepthDial.setAutoFillBackground(False)
+        self.chorusDepthDial.setMaximum(100)
+        self.chorusDepthDial.setWrapping(False)
+        self.chorusDepthDial.setNotchesVisible(True)
+        self.chorusSpeedDial = QDial(chorusTab)
+        self.chorusSpeedDial.setObjectName(u"chorusSpeedDial")
+        self.chorusSpeedDial.setGeometry(QRect(110, 0, 50, 64))
+        self.chorusSpeedDial.setAutoFillBackground(False)
+        self.chorusSpeedDial.setMaximum(100)
+        self.chorusSpeedDial.setWrapping(False)
+        self.chorusSpeedDial.setNotchesVisible(True)
+        self.chorusDepthLabel = QLabel(chorusTab)
+        self.chorusDepthLabel.setObjectName(u"chorusDepthLabel")
+        self.chorusDepthLabel.setGeometry(QRect(170, 60, 71, 20))
+        self.chorusDepthLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.chorusSpeedDisplay = QLCDNumber(chorusTab)
+        self.chorusSpeedDisplay.setObjectName(u"chorusSpeedDisplay")
+        self.chorusSpeedDisplay.setGeometry(QRect(110, 80, 51, 23))
+        self.chorusSpeedDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.chorusSpeedLabel = QLabel(chorusTab)
+        self.chorusSpeedLabel.setObjectName(u"chorusSpeedLabel")
+        self.chorusSpeedLabel.setGeometry(QRect(110, 60, 49, 16))
+        self.chorusSpeedLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.chorusToneDisplay = QLCDNumber(chorusTab)
+        self.chorusToneDisplay.setObjectName(u"chorusToneDisplay")
+        self.chorusToneDisplay.setGeometry(QRect(250, 80, 51, 23))
+        self.chorusToneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.chorusModeList = QListWidget(chorusTab)
+        font = QFont()
+        font.setPointSize(12)
+        __qlistwidgetitem = QListWidgetItem(self.chorusModeList)
+        __qlistwidgetitem.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem.setFont(font);
+        __qlistwidgetitem1 = QListWidgetItem(self.chorusModeList)
+        __qlistwidgetitem1.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem1.setFont(font);
+        self.chorusModeList.setObjectName(u"chorusModeList")
+        self.chorusModeList.setGeometry(QRect(20, 30, 51, 51))
+        self.chorusModeList.setUniformItemSizes(False)
+        self.chorusModeList.setSelectionRectVisible(False)
+        self.chorusToneLabel = QLabel(chorusTab)
+        self.chorusToneLabel.setObjectName(u"chorusToneLabel")
+        self.chorusToneLabel.setGeometry(QRect(250, 60, 49, 16))
+        self.chorusToneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.chorusDepthDisplay = QLCDNumber(chorusTab)
+        self.chorusDepthDisplay.setObjectName(u"chorusDepthDisplay")
+        self.chorusDepthDisplay.setGeometry(QRect(180, 80, 51, 23))
+        self.chorusDepthDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.chorusHelpLabel = QLabel(chorusTab)
+        self.chorusHelpLabel.setObjectName(u"chorusHelpLabel")
+        self.chorusHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(chorusTab)
+
+        QMetaObject.connectSlotsByName(chorusTab)
+    # setupUi
+
+    def retranslateUi(self, chorusTab):
+        self.chorusDepthLabel.setText(QCoreApplication.translate("ChorusTab", u"DEPTH", None))
+        self.chorusSpeedLabel.setText(QCoreApplication.translate("ChorusTab", u"SPEED", None))
+
+        __sortingEnabled = self.chorusModeList.isSortingEnabled()
+        self.chorusModeList.setSortingEnabled(False)
+        ___qlistwidgetitem = self.chorusModeList.item(0)
+        ___qlistwidgetitem.setText(QCoreApplication.translate("ChorusTab", u"CLS", None));
+        ___qlistwidgetitem1 = self.chorusModeList.item(1)
+        ___qlistwidgetitem1.setText(QCoreApplication.translate("ChorusTab", u"VIB", None));
+        self.chorusModeList.setSortingEnabled(__sortingEnabled)
+
+        self.chorusToneLabel.setText(QCoreApplication.translate("ChorusTab", u"TONE", None))
+#if QT_CONFIG(tooltip)
+        self.chorusHelpLabel.setToolTip(QCoreApplication.translate("ChorusTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Chorus / Vibrato</span></p><p align=\"center\"><img src=\":/Modulation_Chorus/resources/modulation/chorus.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.chorusHelpLabel.setText(QCoreApplication.translate("ChorusTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'compressor_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QLCDNumber, QLabel,
+    QSizePolicy, QWidget)
+
+class Ui_CompressorTab(object):
+    def setupUi(self, compressorTab):
+        if not compressorTab.objectName():
+            compressorTab.setObjectName(u"compressorTab")
+        compressorTab.resize(327, 113)
+        self.compressorToneDial = QDial(compressorTab)
+        self.compressorToneDial.setObjectName(u"compressorToneDial")
+        self.compressorToneDial.setGeometry(QRect(30, 0, 50, 64))
+        self.compressorToneDial.setAutoFillBackground(False)
+        self.compressorToneDial.setMaximum(100)
+        self.compressorToneDial.setWrapping(False)
+        self.compressorToneDial.setNotchesVisible(True)
+        self.compressorToneDisplay = QLCDNumber(compressorTab)
+        self.compressorToneDisplay.setObjectName(u"compressorToneDisplay")
+        self.compressorToneDisplay.setGeometry(QRect(30, 80, 51, 23))
+        self.compressorToneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.compressorToneLabel = QLabel(compressorTab)
+        self.compressorToneLabel.setObjectName(u"compressorToneLabel")
+        self.compressorToneLabel.setGeometry(QRect(30, 60, 49, 16))
+        self.compressorToneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.compressorRatioDisplay = QLCDNumber(compressorTab)
+        self.compressorRatioDisplay.setObjectName(u"compressorRatioDisplay")
+        self.compressorRatioDisplay.setGeometry(QRect(100, 80, 51, 23))
+        self.compressorRatioDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.compressorRatioDial = QDial(compressorTab)
+        self.compressorRatioDial.setObjectName(u"compressorRatioDial")
+        self.compressorRatioDial.setGeometry(QRect(100, 0, 50, 64))
+        self.compressorRatioDial.setAutoFillBackground(False)
+        self.compressorRatioDial.setMaximum(100)
+        self.compressorRatioDial.setWrapping(False)
+        self.compressorRatioDial.setNotchesVisible(True)
+        self.compressorRatioLevel = QLabel(compressorTab)
+        self.compressorRatioLevel.setObjectName(u"compressorRatioLevel")
+        self.compressorRatioLevel.setGeometry(QRect(100, 60, 49, 16))
+        self.compressorRatioLevel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.compressorCompressionLabel = QLabel(compressorTab)
+        self.compressorCompressionLabel.setObjectName(u"compressorCompressionLabel")
+        self.compressorCompressionLabel.setGeometry(QRect(170, 60, 49, 16))
+        self.compressorCompressionLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.compressorCompressionDial = QDial(compressorTab)
+        self.compressorCompressionDial.setObjectName(u"compressorCompressionDial")
+        self.compressorCompressionDial.setGeometry(QRect(170, 0, 50, 64))
+        self.compressorCompressionDial.setAutoFillBackground(False)
+        self.compressorCompressionDial.setMaximum(100)
+        self.compressorCompressionDial.setWrapping(False)
+        self.compressorCompressionDial.setNotchesVisible(True)
+        self.compressorCompressionDisplay = QLCDNumber(compressorTab)
+        self.compressorCompressionDisplay.setObjectName(u"compressorCompressionDisplay")
+        self.compressorCompressionDisplay.setGeometry(QRect(170, 80, 51, 23))
+        self.compressorCompressionDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.compressorLevelLabel = QLabel(compressorTab)
+        self.compressorLevelLabel.setObjectName(u"compressorLevelLabel")
+        self.compressorLevelLabel.setGeometry(QRect(240, 60, 49, 16))
+        self.compressorLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.compressorLevelDisplay = QLCDNumber(compressorTab)
+        self.compressorLevelDisplay.setObjectName(u"compressorLevelDisplay")
+        self.compressorLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
+        self.compressorLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.compressorLevelDial = QDial(compressorTab)
+        self.compressorLevelDial.setObjectName(u"compressorLevelDial")
+        self.compressorLevelDial.setGeometry(QRect(240, 0, 50, 64))
+        self.compressorLevelDial.setAutoFillBackground(False)
+        self.compressorLevelDial.setMaximum(100)
+        self.compressorLevelDial.setWrapping(False)
+        self.compressorLevelDial.setNotchesVisible(True)
+        self.compressorHelpLabel = QLabel(compressorTab)
+        self.compressorHelpLabel.setObjectName(u"compressorHelpLabel")
+        self.compressorHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(compressorTab)
+
+        QMetaObject.connectSlotsByName(compressorTab)
+    # setupUi
+
+    def retranslateUi(self, compressorTab):
+        self.compressorToneLabel.setText(QCoreApplication.translate("CompressorTab", u"TONE", None))
+        self.compressorRatioLevel.setText(QCoreApplication.translate("CompressorTab", u"RATIO", None))
+        self.compressorCompressionLabel.setText(QCoreApplication.translate("CompressorTab", u"COMP", None))
+        self.compressorLevelLabel.setText(QCoreApplication.translate("CompressorTab", u"LEVEL", None))
+#if QT_CONFIG(tooltip)
+        self.compressorHelpLabel.setToolTip(QCoreApplication.translate("CompressorTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Compress the peaks of your signal</span></p><p align=\"center\"><img src=\":/PreFX_Compressor/resources/pre-fx/compressor.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.compressorHelpLabel.setText(QCoreApplication.translate("CompressorTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
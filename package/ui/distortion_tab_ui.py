@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'distortion_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QLCDNumber, QLabel,
+    QListWidget, QListWidgetItem, QSizePolicy, QWidget)
+
+class Ui_DistortionTab(object):
+    def setupUi(self, distortionTab):
+        if not distortionTab.objectName():
+            distortionTab.setObjectName(u"distortionTab")
+        distortionTab.resize(327, 113)
+        self.distortionLevelDial = QDial(distortionTab)
+        self.distortionLevelDial.setObjectName(u"distortionLevelDial")
+        self.distortionLevelDial.setGeometry(QRect(250, 0, 50, 64))
+        self.distortionLevelDial.setAutoFillBackground(False)
+        self.distortionLevelDial.setMaximum(100)
+        self.distortionLevelDial.setWrapping(False)
+        self.distortionLevelDial.setNotchesVisible(True)
+        self.distortionDriveLabel = QLabel(distortionTab)
+        self.distortionDriveLabel.setObjectName(u"distortionDriveLabel")
+        self.distortionDriveLabel.setGeometry(QRect(110, 60, 49, 16))
+        self.distortionDriveLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.distortionDriveDisplay = QLCDNumber(distortionTab)
+        self.distortionDriveDisplay.setObjectName(u"distortionDriveDisplay")
+        self.distortionDriveDisplay.setGeometry(QRect(110, 80, 51, 23))
+        self.distortionDriveDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.distortionToneLabel = QLabel(distortionTab)
+        self.distortionToneLabel.setObjectName(u"distortionToneLabel")
+        self.distortionToneLabel.setGeometry(QRect(180, 60, 49, 16))
+        self.distortionToneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.distortionLabel = QLabel(distortionTab)
+        self.distortionLabel.setObjectName(u"distortionLabel")
+        self.distortionLabel.setGeometry(QRect(250, 60, 49, 16))
+        self.distortionLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.distortionToneDisplay = QLCDNumber(distortionTab)
+        self.distortionToneDisplay.setObjectName(u"distortionToneDisplay")
+        self.distortionToneDisplay.setGeometry(QRect(180, 80, 51, 23))
+        self.distortionToneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.distortionToneDial = QDial(distortionTab)
+        self.distortionToneDial.setObjectName(u"distortionToneDial")
+        self.distortionToneDial.setGeometry(QRect(180, 0, 50, 64))
+        self.distortionToneDial.setAutoFillBackground(False)
+        self.distortionToneDial.setMaximum(100)
+        self.distortionToneDial.setWrapping(False)
+        self.distortionToneDial.setNotchesVisible(True)
+        self.distortionDriveDial = QDial(distortionTab)
+        self.distortionDriveDial.setObjectName(u"distortionDriveDial")
+        self.distortionDriveDial.setGeometry(QRect(110, 0, 50, 64))
+        self.distortionDriveDial.setAutoFillBackground(False)
+        self.distortionDriveDial.setMaximum(100)
+        self.distortionDriveDial.setWrapping(False)
+        self.distortionDriveDial.setNotchesVisible(True)
+        self.distortionLevelDisplay = QLCDNumber(distortionTab)
+        self.distortionLevelDisplay.setObjectName(u"distortionLevelDisplay")
+        self.distortionLevelDisplay.setGeometry(QRect(250, 80, 51, 23))
+        self.distortionLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.distortionModeList = QListWidget(distortionTab)
+        font = QFont()
+        font.setPointSize(11)
+        __qlistwidgetitem = QListWidgetItem(self.distortionModeList)
+        __qlistwidgetitem.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem.setFont(font);
+        __qlistwidgetitem1 = QListWidgetItem(self.distortionModeList)
+        __qlistwidgetitem1.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem1.setFont(font);
+        __qlistwidgetitem2 = QListWidgetItem(self.distortionModeList)
+        __qlistwidgetitem2.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem2.setFont(font);
+        self.distortionModeList.setObjectName(u"distortionModeList")
+        self.distortionModeList.setGeometry(QRect(20, 20, 51, 71))
+        self.distortionModeList.setUniformItemSizes(False)
+        self.distortionModeList.setSelectionRectVisible(False)
+        self.distortionHelpLabel = QLabel(distortionTab)
+        self.distortionHelpLabel.setObjectName(u"distortionHelpLabel")
+        self.distortionHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(distortionTab)
+
+        QMetaObject.connectSlotsByName(distortionTab)
+    # setupUi
+
+    def retranslateUi(self, distortionTab):
+        self.distortionDriveLabel.setText(QCoreApplication.translate("DistortionTab", u"DRIVE", None))
+        self.distortionToneLabel.setText(QCoreApplication.translate("DistortionTab", u"TONE", None))
+        self.distortionLabel.setText(QCoreApplication.translate("DistortionTab", u"LEVEL", None))
+
+        __sortingEnabled = self.distortionModeList.isSortingEnabled()
+        self.distortionModeList.setSortingEnabled(False)
+        ___qlistwidgetitem = self.distortionModeList.item(0)
+        ___qlistwidgetitem.setText(QCoreApplication.translate("DistortionTab", u"GUV", None));
+        ___qlistwidgetitem1 = self.distortionModeList.item(1)
+        ___qlistwidgetitem1.setText(QCoreApplication.translate("DistortionTab", u"ODR", None));
+        ___qlistwidgetitem2 = self.distortionModeList.item(2)
+        ___qlistwidgetitem2.setText(QCoreApplication.translate("DistortionTab", u"DIST", None));
+        self.distortionModeList.setSortingEnabled(__sortingEnabled)
+
+#if QT_CONFIG(tooltip)
+        self.distortionHelpLabel.setToolTip(QCoreApplication.translate("DistortionTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Guv'nor / Overdrive / Distortion</span></p><p align=\"center\"><img src=\":/PreFX_Distortion/resources/pre-fx/distortion.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.distortionHelpLabel.setText(QCoreApplication.translate("DistortionTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
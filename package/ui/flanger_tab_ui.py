@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'flanger_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QLCDNumber, QLabel,
+    QListWidget, QListWidgetItem, QSizePolicy, QWidget)
+
+class Ui_FlangerTab(object):
+    def setupUi(self, flangerTab):
+        if not flangerTab.objectName():
+            flangerTab.setObjectName(u"flangerTab")
+        flangerTab.resize(327, 113)
+        self.flangerRegenLabel = QLabel(flangerTab)
+        self.flangerRegenLabel.setObjectName(u"flangerRegenLabel")
+        self.flangerRegenLabel.setGeometry(QRect(250, 60, 49, 16))
+        self.flangerRegenLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.flangerSpeedDial = QDial(flangerTab)
+        self.flangerSpeedDial.setObjectName(u"flangerSpeedDial")
+        self.flangerSpeedDial.setGeometry(QRect(110, 0, 50, 64))
+        self.flangerSpeedDial.setAutoFillBackground(False)
+        self.flangerSpeedDial.setMaximum(100)
+        self.flangerSpeedDial.setWrapping(False)
+        self.flangerSpeedDial.setNotchesVisible(True)
+        self.flangerSpeedLabel = QLabel(flangerTab)
+        self.flangerSpeedLabel.setObjectName(u"flangerSpeedLabel")
+        self.flangerSpeedLabel.setGeometry(QRect(110, 60, 49, 16))
+        self.flangerSpeedLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.flangerRegenDial = QDial(flangerTab)
+        self.flangerRegenDial.setObjectName(u"flangerRegenDial")
+        self.flangerRegenDial.setGeometry(QRect(250, 0, 50, 64))
+        self.flangerRegenDial.setAutoFillBackground(False)
+        self.flangerRegenDial.setMaximum(100)
+        self.flangerRegenDial.setWrapping(False)
+        self.flangerRegenDial.setNotchesVisible(True)
+        self.flangerRegenDisplay = QLCDNumber(flangerTab)
+        self.flangerRegenDisplay.setObjectName(u"flangerRegenDisplay")
+        self.flangerRegenDisplay.setGeometry(QRect(250, 80, 51, 23))
+        self.flangerRegenDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.flangerSpeedDisplay = QLCDNumber(flangerTab)
+        self.flangerSpeedDisplay.setObjectName(u"flangerSpeedDisplay")
+        self.flangerSpeedDisplay.setGeometry(QRect(110, 80, 51, 23))
+        self.flangerSpeedDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.flangerDepthLabel = QLabel(flangerTab)
+        self.flangerDepthLabel.setObjectName(u"flangerDepthLabel")
+        self.flangerDepthLabel.setGeometry(QRect(170, 60, 71, 20))
+        self.flangerDepthLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.flangerDepthDisplay = QLCDNumber(flangerTab)
+        self.flangerDepthDisplay.setObjectName(u"flangerDepthDisplay")
+        self.flangerDepthDisplay.setGeometry(QRect(180, 80, 51, 23))
+        self.flangerDepthDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.flangerModeList = QListWidget(flangerTab)
+        font = QFont()
+        font.setPointSize(12)
+        __qlistwidgetitem = QListWidgetItem(self.flangerModeList)
+        __qlistwidgetitem.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem.setFont(font);
+        __qlistwidgetitem1 = QListWidgetItem(self.flangerModeList)
+        __qlistwidgetitem1.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem1.setFont(font);
+        self.flangerModeList.setObjectName(u"flangerModeList")
+        self.flangerModeList.setGeometry(QRect(20, 30, 51, 51))
+        self.flangerModeList.setUniformItemSizes(False)
+        self.flangerModeList.setSelectionRectVisible(False)
+        self.flangerDepthDial = QDial(flangerTab)
+        self.flangerDepthDial.setObjectName(u"flangerDepthDial")
+        self.flangerDepthDial.setGeometry(QRect(180, 0, 50, 64))
+        self.flangerDepthDial.setAutoFillBackground(False)
+        self.flangerDepthDial.setMaximum(100)
+        self.flangerDepthDial.setWrapping(False)
+        self.flangerDepthDial.setNotchesVisible(True)
+        self.flangerHelpLabel = QLabel(flangerTab)
+        self.flangerHelpLabel.setObjectName(u"flangerHelpLabel")
+        self.flangerHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(flangerTab)
+
+        QMetaObject.connectSlotsByName(flangerTab)
+    # setupUi
+
+    def retranslateUi(self, flangerTab):
+        self.flangerRegenLabel.setText(QCoreApplication.translate("FlangerTab", u"REGEN", None))
+        self.flangerSpeedLabel.setText(QCoreApplication.translate("FlangerTab", u"SPEED", None))
+        self.flangerDepthLabel.setText(QCoreApplication.translate("FlangerTab", u"DEPTH", None))
+
+        __sortingEnabled = self.flangerModeList.isSortingEnabled()
+        self.flangerModeList.setSortingEnabled(False)
+        ___qlistwidgetitem = self.flangerModeList.item(0)
+        ___qlistwidgetitem.setText(QCoreApplication.translate("FlangerTab", u"JET", None));
+        ___qlistwidgetitem1 = self.flangerModeList.item(1)
+        ___qlistwidgetitem1.setText(QCoreApplication.translate("FlangerTab", u"MET", None));
+        self.flangerModeList.setSortingEnabled(__sortingEnabled)
+
+#if QT_CONFIG(tooltip)
+        self.flangerHelpLabel.setToolTip(QCoreApplication.translate("FlangerTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Jet / Metal</span></p><p align=\"center\"><img src=\":/Modulation_Flanger/resources/modulation/flanger.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.flangerHelpLabel.setText(QCoreApplication.translate("FlangerTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'hall_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QLCDNumber, QLabel,
+    QSizePolicy, QWidget)
+
+class Ui_HallTab(object):
+    def setupUi(self, hallTab):
+        if not hallTab.objectName():
+            hallTab.setObjectName(u"hallTab")
+        hallTab.resize(327, 113)
+        self.hallLevelLabel = QLabel(hallTab)
+        self.hallLevelLabel.setObjectName(u"hallLevelLabel")
+        self.hallLevelLabel.setGeometry(QRect(240, 60, 49, 16))
+        self.hallLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.hallPreDelayDisplay = QLCDNumber(hallTab)
+        self.hallPreDelayDisplay.setObjectName(u"hallPreDelayDisplay")
+        self.hallPreDelayDisplay.setGeometry(QRect(100, 80, 51, 23))
+        self.hallPreDelayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.hallDecayDisplay = QLCDNumber(hallTab)
+        self.hallDecayDisplay.setObjectName(u"hallDecayDisplay")
+        self.hallDecayDisplay.setGeometry(QRect(30, 80, 51, 23))
+        self.hallDecayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.hallPreDelayLabel = QLabel(hallTab)
+        self.hallPreDelayLabel.setObjectName(u"hallPreDelayLabel")
+        self.hallPreDelayLabel.setGeometry(QRect(88, 60, 71, 20))
+        self.hallPreDelayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.hallToneDial = QDial(hallTab)
+        self.hallToneDial.setObjectName(u"hallToneDial")
+        self.hallToneDial.setGeometry(QRect(170, 0, 50, 64))
+        self.hallToneDial.setAutoFillBackground(False)
+        self.hallToneDial.setMaximum(100)
+        self.hallToneDial.setWrapping(False)
+        self.hallToneDial.setNotchesVisible(True)
+        self.hallDecayLabel = QLabel(hallTab)
+        self.hallDecayLabel.setObjectName(u"hallDecayLabel")
+        self.hallDecayLabel.setGeometry(QRect(30, 60, 49, 16))
+        self.hallDecayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.hallLevelDisplay = QLCDNumber(hallTab)
+        self.hallLevelDisplay.setObjectName(u"hallLevelDisplay")
+        self.hallLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
+        self.hallLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.hallLevelDial = QDial(hallTab)
+        self.hallLevelDial.setObjectName(u"hallLevelDial")
+        self.hallLevelDial.setGeometry(QRect(240, 0, 50, 64))
+        self.hallLevelDial.setAutoFillBackground(False)
+        self.hallLevelDial.setMaximum(100)
+        self.hallLevelDial.setWrapping(False)
+        self.hallLevelDial.setNotchesVisible(True)
+        self.hallToneLabel = QLabel(hallTab)
+        self.hallToneLabel.setObjectName(u"hallToneLabel")
+        self.hallToneLabel.setGeometry(QRect(170, 60, 49, 16))
+        self.hallToneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.hallDecayDial = QDial(hallTab)
+        self.hallDecayDial.setObjectName(u"hallDecayDial")
+        self.hallDecayDial.setGeometry(QRect(30, 0, 50, 64))
+        self.hallDecayDial.setAutoFillBackground(False)
+        self.hallDecayDial.setMaximum(100)
+        self.hallDecayDial.setWrapping(False)
+        self.hallDecayDial.setNotchesVisible(True)
+        self.hallToneDisplay = QLCDNumber(hallTab)
+        self.hallToneDisplay.setObjectName(u"hallToneDisplay")
+        self.hallToneDisplay.setGeometry(QRect(170, 80, 51, 23))
+        self.hallToneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.hallPreDelayDial = QDial(hallTab)
+        self.hallPreDelayDial.setObjectName(u"hallPreDelayDial")
+        self.hallPreDelayDial.setGeometry(QRect(100, 0, 50, 64))
+        self.hallPreDelayDial.setAutoFillBackground(False)
+        self.hallPreDelayDial.setMaximum(100)
+        self.hallPreDelayDial.setWrapping(False)
+        self.hallPreDelayDial.setNotchesVisible(True)
+        self.hallHelpLabel = QLabel(hallTab)
+        self.hallHelpLabel.setObjectName(u"hallHelpLabel")
+        self.hallHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(hallTab)
+
+        QMetaObject.connectSlotsByName(hallTab)
+    # setupUi
+
+    def retranslateUi(self, hallTab):
+        self.hallLevelLabel.setText(QCoreApplication.translate("HallTab", u"LEVEL", None))
+        self.hallPreDelayLabel.setText(QCoreApplication.translate("HallTab", u"PRE-DELAY", None))
+        self.hallDecayLabel.setText(QCoreApplication.translate("HallTab", u"DECAY", None))
+        self.hallToneLabel.setText(QCoreApplication.translate("HallTab", u"TONE", None))
+#if QT_CONFIG(tooltip)
+        self.hallHelpLabel.setToolTip(QCoreApplication.translate("HallTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Acoustic reflections of a hall-sized space</span></p><p align=\"center\"><img src=\":/Reverb_Hall/resources/reverb/hall.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.hallHelpLabel.setText(QCoreApplication.translate("HallTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
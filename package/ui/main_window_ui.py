@@ -16,12 +16,11 @@ from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
     QIcon, QImage, QKeySequence, QLinearGradient,
     QPainter, QPalette, QPixmap, QRadialGradient,
     QTransform)
-from PySide6.QtWidgets import (QApplication, QDial, QFrame, QGroupBox,
-    QLCDNumber, QLabel, QLineEdit, QListWidget,
-    QListWidgetItem, QMainWindow, QMenu, QMenuBar,
-    QPushButton, QSizePolicy, QStatusBar, QTabWidget,
-    QWidget)
-import package.ui.resources_rc
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QDial, QFrame,
+    QGroupBox, QLCDNumber, QLabel, QLineEdit,
+    QListView, QListWidget, QListWidgetItem, QMainWindow,
+    QMenu, QMenuBar, QPushButton, QSizePolicy,
+    QStatusBar, QTabWidget, QWidget)
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -48,10 +47,84 @@ class Ui_MainWindow(object):
         self.actionLoad_from_File.setObjectName(u"actionLoad_from_File")
         icon4 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.DocumentOpen))
         self.actionLoad_from_File.setIcon(icon4)
+        self.actionExport_Bank = QAction(MainWindow)
+        self.actionExport_Bank.setObjectName(u"actionExport_Bank")
+        self.actionExport_Bank.setIcon(icon3)
+        self.actionImport_Bank = QAction(MainWindow)
+        self.actionImport_Bank.setObjectName(u"actionImport_Bank")
+        self.actionImport_Bank.setIcon(icon4)
+        self.actionFind_Similar_Presets = QAction(MainWindow)
+        self.actionFind_Similar_Presets.setObjectName(u"actionFind_Similar_Presets")
+        icon5 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.EditFind))
+        self.actionFind_Similar_Presets.setIcon(icon5)
+        self.actionMorph_to_Preset = QAction(MainWindow)
+        self.actionMorph_to_Preset.setObjectName(u"actionMorph_to_Preset")
+        icon6 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.MediaSeekForward))
+        self.actionMorph_to_Preset.setIcon(icon6)
+        self.actionNext_Setlist_Preset = QAction(MainWindow)
+        self.actionNext_Setlist_Preset.setObjectName(u"actionNext_Setlist_Preset")
+        icon7 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.GoNext))
+        self.actionNext_Setlist_Preset.setIcon(icon7)
+        self.actionPrevious_Setlist_Preset = QAction(MainWindow)
+        self.actionPrevious_Setlist_Preset.setObjectName(u"actionPrevious_Setlist_Preset")
+        icon8 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.GoPrevious))
+        self.actionPrevious_Setlist_Preset.setIcon(icon8)
+        self.actionAdd_to_Setlist = QAction(MainWindow)
+        self.actionAdd_to_Setlist.setObjectName(u"actionAdd_to_Setlist")
+        icon9 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.ListAdd))
+        self.actionAdd_to_Setlist.setIcon(icon9)
+        self.actionLoad_Setlist = QAction(MainWindow)
+        self.actionLoad_Setlist.setObjectName(u"actionLoad_Setlist")
+        self.actionLoad_Setlist.setIcon(icon4)
+        self.actionClear_Setlist = QAction(MainWindow)
+        self.actionClear_Setlist.setObjectName(u"actionClear_Setlist")
+        icon10 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.EditClear))
+        self.actionClear_Setlist.setIcon(icon10)
+        self.actionConnect_Foot_Controller = QAction(MainWindow)
+        self.actionConnect_Foot_Controller.setObjectName(u"actionConnect_Foot_Controller")
+        self.actionConnect_Foot_Controller.setCheckable(True)
+        icon11 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.InputGaming))
+        self.actionConnect_Foot_Controller.setIcon(icon11)
         self.actionRefresh_Amp_Settings = QAction(MainWindow)
         self.actionRefresh_Amp_Settings.setObjectName(u"actionRefresh_Amp_Settings")
-        icon5 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.ViewRefresh))
-        self.actionRefresh_Amp_Settings.setIcon(icon5)
+        icon12 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.ViewRefresh))
+        self.actionRefresh_Amp_Settings.setIcon(icon12)
+        self.actionRecord_Automation = QAction(MainWindow)
+        self.actionRecord_Automation.setObjectName(u"actionRecord_Automation")
+        self.actionRecord_Automation.setCheckable(True)
+        icon13 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.MediaRecord))
+        self.actionRecord_Automation.setIcon(icon13)
+        self.actionPlay_Automation = QAction(MainWindow)
+        self.actionPlay_Automation.setObjectName(u"actionPlay_Automation")
+        icon14 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.MediaPlaybackStart))
+        self.actionPlay_Automation.setIcon(icon14)
+        self.actionStop_Automation = QAction(MainWindow)
+        self.actionStop_Automation.setObjectName(u"actionStop_Automation")
+        icon15 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.MediaPlaybackStop))
+        self.actionStop_Automation.setIcon(icon15)
+        self.actionSave_Automation = QAction(MainWindow)
+        self.actionSave_Automation.setObjectName(u"actionSave_Automation")
+        icon16 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.DocumentSave))
+        self.actionSave_Automation.setIcon(icon16)
+        self.actionLoad_Automation = QAction(MainWindow)
+        self.actionLoad_Automation.setObjectName(u"actionLoad_Automation")
+        self.actionLoad_Automation.setIcon(icon4)
+        self.actionTap_Tempo = QAction(MainWindow)
+        self.actionTap_Tempo.setObjectName(u"actionTap_Tempo")
+        icon17 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.MediaPlaylistRepeat))
+        self.actionTap_Tempo.setIcon(icon17)
+        self.actionFollow_MIDI_Clock = QAction(MainWindow)
+        self.actionFollow_MIDI_Clock.setObjectName(u"actionFollow_MIDI_Clock")
+        self.actionFollow_MIDI_Clock.setCheckable(True)
+        self.actionFollow_MIDI_Clock.setIcon(icon17)
+        self.actionUndo = QAction(MainWindow)
+        self.actionUndo.setObjectName(u"actionUndo")
+        icon18 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.EditUndo))
+        self.actionUndo.setIcon(icon18)
+        self.actionRedo = QAction(MainWindow)
+        self.actionRedo.setObjectName(u"actionRedo")
+        icon19 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.EditRedo))
+        self.actionRedo.setIcon(icon19)
         self.centralwidget = QWidget(MainWindow)
         self.centralwidget.setObjectName(u"centralwidget")
         self.logoLabel = QLabel(self.centralwidget)
@@ -203,13 +276,13 @@ class Ui_MainWindow(object):
         self.flattenEQButton = QPushButton(self.preampGroupBox)
         self.flattenEQButton.setObjectName(u"flattenEQButton")
         self.flattenEQButton.setGeometry(QRect(390, 20, 20, 20))
-        icon6 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.ListRemove))
-        self.flattenEQButton.setIcon(icon6)
+        icon20 = QIcon(QIcon.fromTheme(QIcon.ThemeIcon.ListRemove))
+        self.flattenEQButton.setIcon(icon20)
         self.flattenEQButton.setIconSize(QSize(8, 8))
         self.autoFlattenEQButton = QPushButton(self.preampGroupBox)
         self.autoFlattenEQButton.setObjectName(u"autoFlattenEQButton")
         self.autoFlattenEQButton.setGeometry(QRect(390, 50, 20, 20))
-        self.autoFlattenEQButton.setIcon(icon6)
+        self.autoFlattenEQButton.setIcon(icon20)
         self.autoFlattenEQButton.setIconSize(QSize(8, 8))
         self.autoFlattenEQButton.setCheckable(True)
         self.powerGroupBox = QGroupBox(self.centralwidget)
@@ -289,271 +362,15 @@ class Ui_MainWindow(object):
         self.preFXTab.setGeometry(QRect(90, 20, 331, 141))
         self.compressorTab = QWidget()
         self.compressorTab.setObjectName(u"compressorTab")
-        self.compressorToneDial = QDial(self.compressorTab)
-        self.compressorToneDial.setObjectName(u"compressorToneDial")
-        self.compressorToneDial.setGeometry(QRect(30, 0, 50, 64))
-        self.compressorToneDial.setAutoFillBackground(False)
-        self.compressorToneDial.setMaximum(100)
-        self.compressorToneDial.setWrapping(False)
-        self.compressorToneDial.setNotchesVisible(True)
-        self.compressorToneDisplay = QLCDNumber(self.compressorTab)
-        self.compressorToneDisplay.setObjectName(u"compressorToneDisplay")
-        self.compressorToneDisplay.setGeometry(QRect(30, 80, 51, 23))
-        self.compressorToneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.compressorToneLabel = QLabel(self.compressorTab)
-        self.compressorToneLabel.setObjectName(u"compressorToneLabel")
-        self.compressorToneLabel.setGeometry(QRect(30, 60, 49, 16))
-        self.compressorToneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.compressorRatioDisplay = QLCDNumber(self.compressorTab)
-        self.compressorRatioDisplay.setObjectName(u"compressorRatioDisplay")
-        self.compressorRatioDisplay.setGeometry(QRect(100, 80, 51, 23))
-        self.compressorRatioDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.compressorRatioDial = QDial(self.compressorTab)
-        self.compressorRatioDial.setObjectName(u"compressorRatioDial")
-        self.compressorRatioDial.setGeometry(QRect(100, 0, 50, 64))
-        self.compressorRatioDial.setAutoFillBackground(False)
-        self.compressorRatioDial.setMaximum(100)
-        self.compressorRatioDial.setWrapping(False)
-        self.compressorRatioDial.setNotchesVisible(True)
-        self.compressorRatioLevel = QLabel(self.compressorTab)
-        self.compressorRatioLevel.setObjectName(u"compressorRatioLevel")
-        self.compressorRatioLevel.setGeometry(QRect(100, 60, 49, 16))
-        self.compressorRatioLevel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.compressorCompressionLabel = QLabel(self.compressorTab)
-        self.compressorCompressionLabel.setObjectName(u"compressorCompressionLabel")
-        self.compressorCompressionLabel.setGeometry(QRect(170, 60, 49, 16))
-        self.compressorCompressionLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.compressorCompressionDial = QDial(self.compressorTab)
-        self.compressorCompressionDial.setObjectName(u"compressorCompressionDial")
-        self.compressorCompressionDial.setGeometry(QRect(170, 0, 50, 64))
-        self.compressorCompressionDial.setAutoFillBackground(False)
-        self.compressorCompressionDial.setMaximum(100)
-        self.compressorCompressionDial.setWrapping(False)
-        self.compressorCompressionDial.setNotchesVisible(True)
-        self.compressorCompressionDisplay = QLCDNumber(self.compressorTab)
-        self.compressorCompressionDisplay.setObjectName(u"compressorCompressionDisplay")
-        self.compressorCompressionDisplay.setGeometry(QRect(170, 80, 51, 23))
-        self.compressorCompressionDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.compressorLevelLabel = QLabel(self.compressorTab)
-        self.compressorLevelLabel.setObjectName(u"compressorLevelLabel")
-        self.compressorLevelLabel.setGeometry(QRect(240, 60, 49, 16))
-        self.compressorLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.compressorLevelDisplay = QLCDNumber(self.compressorTab)
-        self.compressorLevelDisplay.setObjectName(u"compressorLevelDisplay")
-        self.compressorLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
-        self.compressorLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.compressorLevelDial = QDial(self.compressorTab)
-        self.compressorLevelDial.setObjectName(u"compressorLevelDial")
-        self.compressorLevelDial.setGeometry(QRect(240, 0, 50, 64))
-        self.compressorLevelDial.setAutoFillBackground(False)
-        self.compressorLevelDial.setMaximum(100)
-        self.compressorLevelDial.setWrapping(False)
-        self.compressorLevelDial.setNotchesVisible(True)
-        self.compressorHelpLabel = QLabel(self.compressorTab)
-        self.compressorHelpLabel.setObjectName(u"compressorHelpLabel")
-        self.compressorHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.preFXTab.addTab(self.compressorTab, "")
         self.distortionTab = QWidget()
         self.distortionTab.setObjectName(u"distortionTab")
-        self.distortionLevelDial = QDial(self.distortionTab)
-        self.distortionLevelDial.setObjectName(u"distortionLevelDial")
-        self.distortionLevelDial.setGeometry(QRect(250, 0, 50, 64))
-        self.distortionLevelDial.setAutoFillBackground(False)
-        self.distortionLevelDial.setMaximum(100)
-        self.distortionLevelDial.setWrapping(False)
-        self.distortionLevelDial.setNotchesVisible(True)
-        self.distortionDriveLabel = QLabel(self.distortionTab)
-        self.distortionDriveLabel.setObjectName(u"distortionDriveLabel")
-        self.distortionDriveLabel.setGeometry(QRect(110, 60, 49, 16))
-        self.distortionDriveLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.distortionDriveDisplay = QLCDNumber(self.distortionTab)
-        self.distortionDriveDisplay.setObjectName(u"distortionDriveDisplay")
-        self.distortionDriveDisplay.setGeometry(QRect(110, 80, 51, 23))
-        self.distortionDriveDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.distortionToneLabel = QLabel(self.distortionTab)
-        self.distortionToneLabel.setObjectName(u"distortionToneLabel")
-        self.distortionToneLabel.setGeometry(QRect(180, 60, 49, 16))
-        self.distortionToneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.distortionLabel = QLabel(self.distortionTab)
-        self.distortionLabel.setObjectName(u"distortionLabel")
-        self.distortionLabel.setGeometry(QRect(250, 60, 49, 16))
-        self.distortionLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.distortionToneDisplay = QLCDNumber(self.distortionTab)
-        self.distortionToneDisplay.setObjectName(u"distortionToneDisplay")
-        self.distortionToneDisplay.setGeometry(QRect(180, 80, 51, 23))
-        self.distortionToneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.distortionToneDial = QDial(self.distortionTab)
-        self.distortionToneDial.setObjectName(u"distortionToneDial")
-        self.distortionToneDial.setGeometry(QRect(180, 0, 50, 64))
-        self.distortionToneDial.setAutoFillBackground(False)
-        self.distortionToneDial.setMaximum(100)
-        self.distortionToneDial.setWrapping(False)
-        self.distortionToneDial.setNotchesVisible(True)
-        self.distortionDriveDial = QDial(self.distortionTab)
-        self.distortionDriveDial.setObjectName(u"distortionDriveDial")
-        self.distortionDriveDial.setGeometry(QRect(110, 0, 50, 64))
-        self.distortionDriveDial.setAutoFillBackground(False)
-        self.distortionDriveDial.setMaximum(100)
-        self.distortionDriveDial.setWrapping(False)
-        self.distortionDriveDial.setNotchesVisible(True)
-        self.distortionLevelDisplay = QLCDNumber(self.distortionTab)
-        self.distortionLevelDisplay.setObjectName(u"distortionLevelDisplay")
-        self.distortionLevelDisplay.setGeometry(QRect(250, 80, 51, 23))
-        self.distortionLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.distortionModeList = QListWidget(self.distortionTab)
-        font3 = QFont()
-        font3.setPointSize(11)
-        __qlistwidgetitem = QListWidgetItem(self.distortionModeList)
-        __qlistwidgetitem.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem.setFont(font3);
-        __qlistwidgetitem1 = QListWidgetItem(self.distortionModeList)
-        __qlistwidgetitem1.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem1.setFont(font3);
-        __qlistwidgetitem2 = QListWidgetItem(self.distortionModeList)
-        __qlistwidgetitem2.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem2.setFont(font3);
-        self.distortionModeList.setObjectName(u"distortionModeList")
-        self.distortionModeList.setGeometry(QRect(20, 20, 51, 71))
-        self.distortionModeList.setUniformItemSizes(False)
-        self.distortionModeList.setSelectionRectVisible(False)
-        self.distortionHelpLabel = QLabel(self.distortionTab)
-        self.distortionHelpLabel.setObjectName(u"distortionHelpLabel")
-        self.distortionHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.preFXTab.addTab(self.distortionTab, "")
         self.autoWahTab = QWidget()
         self.autoWahTab.setObjectName(u"autoWahTab")
-        self.autoWahSensitivityDial = QDial(self.autoWahTab)
-        self.autoWahSensitivityDial.setObjectName(u"autoWahSensitivityDial")
-        self.autoWahSensitivityDial.setGeometry(QRect(180, 0, 50, 64))
-        self.autoWahSensitivityDial.setAutoFillBackground(False)
-        self.autoWahSensitivityDial.setMaximum(100)
-        self.autoWahSensitivityDial.setWrapping(False)
-        self.autoWahSensitivityDial.setNotchesVisible(True)
-        self.autoWahFreqDisplay = QLCDNumber(self.autoWahTab)
-        self.autoWahFreqDisplay.setObjectName(u"autoWahFreqDisplay")
-        self.autoWahFreqDisplay.setGeometry(QRect(110, 80, 51, 23))
-        self.autoWahFreqDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.autoWahResDial = QDial(self.autoWahTab)
-        self.autoWahResDial.setObjectName(u"autoWahResDial")
-        self.autoWahResDial.setGeometry(QRect(250, 0, 50, 64))
-        self.autoWahResDial.setAutoFillBackground(False)
-        self.autoWahResDial.setMaximum(100)
-        self.autoWahResDial.setWrapping(False)
-        self.autoWahResDial.setNotchesVisible(True)
-        self.autoWahResDisplay = QLCDNumber(self.autoWahTab)
-        self.autoWahResDisplay.setObjectName(u"autoWahResDisplay")
-        self.autoWahResDisplay.setGeometry(QRect(250, 80, 51, 23))
-        self.autoWahResDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.autoWahFreqLabel = QLabel(self.autoWahTab)
-        self.autoWahFreqLabel.setObjectName(u"autoWahFreqLabel")
-        self.autoWahFreqLabel.setGeometry(QRect(110, 60, 49, 16))
-        self.autoWahFreqLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.autoWahResLabel = QLabel(self.autoWahTab)
-        self.autoWahResLabel.setObjectName(u"autoWahResLabel")
-        self.autoWahResLabel.setGeometry(QRect(250, 60, 49, 16))
-        self.autoWahResLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.autoWahSensitivityDisplay = QLCDNumber(self.autoWahTab)
-        self.autoWahSensitivityDisplay.setObjectName(u"autoWahSensitivityDisplay")
-        self.autoWahSensitivityDisplay.setGeometry(QRect(180, 80, 51, 23))
-        self.autoWahSensitivityDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.autoWahSensitivityLabel = QLabel(self.autoWahTab)
-        self.autoWahSensitivityLabel.setObjectName(u"autoWahSensitivityLabel")
-        self.autoWahSensitivityLabel.setGeometry(QRect(170, 60, 71, 20))
-        self.autoWahSensitivityLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.autoWahModeList = QListWidget(self.autoWahTab)
-        font4 = QFont()
-        font4.setPointSize(12)
-        __qlistwidgetitem3 = QListWidgetItem(self.autoWahModeList)
-        __qlistwidgetitem3.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem3.setFont(font4);
-        __qlistwidgetitem4 = QListWidgetItem(self.autoWahModeList)
-        __qlistwidgetitem4.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem4.setFont(font4);
-        self.autoWahModeList.setObjectName(u"autoWahModeList")
-        self.autoWahModeList.setGeometry(QRect(20, 30, 51, 51))
-        self.autoWahModeList.setUniformItemSizes(False)
-        self.autoWahModeList.setSelectionRectVisible(False)
-        self.autoWahFreqDial = QDial(self.autoWahTab)
-        self.autoWahFreqDial.setObjectName(u"autoWahFreqDial")
-        self.autoWahFreqDial.setGeometry(QRect(110, 0, 50, 64))
-        self.autoWahFreqDial.setAutoFillBackground(False)
-        self.autoWahFreqDial.setMaximum(100)
-        self.autoWahFreqDial.setWrapping(False)
-        self.autoWahFreqDial.setNotchesVisible(True)
-        self.autoWahHelpLabel = QLabel(self.autoWahTab)
-        self.autoWahHelpLabel.setObjectName(u"autoWahHelpLabel")
-        self.autoWahHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.preFXTab.addTab(self.autoWahTab, "")
         self.pitchShifterTab = QWidget()
         self.pitchShifterTab.setObjectName(u"pitchShifterTab")
-        self.pitchShifterSemitoneDisplay = QLCDNumber(self.pitchShifterTab)
-        self.pitchShifterSemitoneDisplay.setObjectName(u"pitchShifterSemitoneDisplay")
-        self.pitchShifterSemitoneDisplay.setGeometry(QRect(30, 80, 51, 23))
-        self.pitchShifterSemitoneDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.pitchShifterSemitoneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.pitchShifterRegenLabel = QLabel(self.pitchShifterTab)
-        self.pitchShifterRegenLabel.setObjectName(u"pitchShifterRegenLabel")
-        self.pitchShifterRegenLabel.setGeometry(QRect(170, 60, 49, 16))
-        self.pitchShifterRegenLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.pitchShifterMixLabel = QLabel(self.pitchShifterTab)
-        self.pitchShifterMixLabel.setObjectName(u"pitchShifterMixLabel")
-        self.pitchShifterMixLabel.setGeometry(QRect(240, 60, 49, 16))
-        self.pitchShifterMixLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.pitchShifterMixDial = QDial(self.pitchShifterTab)
-        self.pitchShifterMixDial.setObjectName(u"pitchShifterMixDial")
-        self.pitchShifterMixDial.setGeometry(QRect(240, 0, 50, 64))
-        self.pitchShifterMixDial.setAutoFillBackground(False)
-        self.pitchShifterMixDial.setMaximum(100)
-        self.pitchShifterMixDial.setWrapping(False)
-        self.pitchShifterMixDial.setNotchesVisible(True)
-        self.pitchShifterSemitoneLabel = QLabel(self.pitchShifterTab)
-        self.pitchShifterSemitoneLabel.setObjectName(u"pitchShifterSemitoneLabel")
-        self.pitchShifterSemitoneLabel.setGeometry(QRect(18, 60, 71, 20))
-        self.pitchShifterSemitoneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.pitchShifterFineLabel = QLabel(self.pitchShifterTab)
-        self.pitchShifterFineLabel.setObjectName(u"pitchShifterFineLabel")
-        self.pitchShifterFineLabel.setGeometry(QRect(100, 60, 49, 16))
-        self.pitchShifterFineLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.pitchShifterFineDial = QDial(self.pitchShifterTab)
-        self.pitchShifterFineDial.setObjectName(u"pitchShifterFineDial")
-        self.pitchShifterFineDial.setGeometry(QRect(100, 0, 50, 64))
-        self.pitchShifterFineDial.setAutoFillBackground(False)
-        self.pitchShifterFineDial.setMaximum(100)
-        self.pitchShifterFineDial.setWrapping(False)
-        self.pitchShifterFineDial.setNotchesVisible(True)
-        self.pitchShifterMixDisplay = QLCDNumber(self.pitchShifterTab)
-        self.pitchShifterMixDisplay.setObjectName(u"pitchShifterMixDisplay")
-        self.pitchShifterMixDisplay.setGeometry(QRect(240, 80, 51, 23))
-        self.pitchShifterMixDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.pitchShifterMixDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.pitchShifterRegenDisplay = QLCDNumber(self.pitchShifterTab)
-        self.pitchShifterRegenDisplay.setObjectName(u"pitchShifterRegenDisplay")
-        self.pitchShifterRegenDisplay.setGeometry(QRect(170, 80, 51, 23))
-        self.pitchShifterRegenDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.pitchShifterRegenDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.pitchShifterRegenDial = QDial(self.pitchShifterTab)
-        self.pitchShifterRegenDial.setObjectName(u"pitchShifterRegenDial")
-        self.pitchShifterRegenDial.setGeometry(QRect(170, 0, 50, 64))
-        self.pitchShifterRegenDial.setAutoFillBackground(False)
-        self.pitchShifterRegenDial.setMaximum(100)
-        self.pitchShifterRegenDial.setWrapping(False)
-        self.pitchShifterRegenDial.setNotchesVisible(True)
-        self.pitchShifterSemitoneDial = QDial(self.pitchShifterTab)
-        self.pitchShifterSemitoneDial.setObjectName(u"pitchShifterSemitoneDial")
-        self.pitchShifterSemitoneDial.setGeometry(QRect(30, 0, 50, 64))
-        self.pitchShifterSemitoneDial.setAutoFillBackground(False)
-        self.pitchShifterSemitoneDial.setMinimum(-12)
-        self.pitchShifterSemitoneDial.setMaximum(12)
-        self.pitchShifterSemitoneDial.setWrapping(False)
-        self.pitchShifterSemitoneDial.setNotchesVisible(True)
-        self.pitchShifterFineDisplay = QLCDNumber(self.pitchShifterTab)
-        self.pitchShifterFineDisplay.setObjectName(u"pitchShifterFineDisplay")
-        self.pitchShifterFineDisplay.setGeometry(QRect(100, 80, 51, 23))
-        self.pitchShifterFineDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.pitchShifterFineDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.pitchShifterHelpLabel = QLabel(self.pitchShifterTab)
-        self.pitchShifterHelpLabel.setObjectName(u"pitchShifterHelpLabel")
-        self.pitchShifterHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.preFXTab.addTab(self.pitchShifterTab, "")
         self.modulationGroupBox = QGroupBox(self.centralwidget)
         self.modulationGroupBox.setObjectName(u"modulationGroupBox")
@@ -568,255 +385,15 @@ class Ui_MainWindow(object):
         self.modulationTab.setGeometry(QRect(90, 20, 331, 141))
         self.chorusTab = QWidget()
         self.chorusTab.setObjectName(u"chorusTab")
-        self.chorusToneDial = QDial(self.chorusTab)
-        self.chorusToneDial.setObjectName(u"chorusToneDial")
-        self.chorusToneDial.setGeometry(QRect(250, 0, 50, 64))
-        self.chorusToneDial.setAutoFillBackground(False)
-        self.chorusToneDial.setMaximum(100)
-        self.chorusToneDial.setWrapping(False)
-        self.chorusToneDial.setNotchesVisible(True)
-        self.chorusDepthDial = QDial(self.chorusTab)
-        self.chorusDepthDial.setObjectName(u"chorusDepthDial")
-        self.chorusDepthDial.setGeometry(QRect(180, 0, 50, 64))
-        self.chorusDepthDial.setAutoFillBackground(False)
-        self.chorusDepthDial.setMaximum(100)
-        self.chorusDepthDial.setWrapping(False)
-        self.chorusDepthDial.setNotchesVisible(True)
-        self.chorusSpeedDial = QDial(self.chorusTab)
-        self.chorusSpeedDial.setObjectName(u"chorusSpeedDial")
-        self.chorusSpeedDial.setGeometry(QRect(110, 0, 50, 64))
-        self.chorusSpeedDial.setAutoFillBackground(False)
-        self.chorusSpeedDial.setMaximum(100)
-        self.chorusSpeedDial.setWrapping(False)
-        self.chorusSpeedDial.setNotchesVisible(True)
-        self.chorusDepthLabel = QLabel(self.chorusTab)
-        self.chorusDepthLabel.setObjectName(u"chorusDepthLabel")
-        self.chorusDepthLabel.setGeometry(QRect(170, 60, 71, 20))
-        self.chorusDepthLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.chorusSpeedDisplay = QLCDNumber(self.chorusTab)
-        self.chorusSpeedDisplay.setObjectName(u"chorusSpeedDisplay")
-        self.chorusSpeedDisplay.setGeometry(QRect(110, 80, 51, 23))
-        self.chorusSpeedDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.chorusSpeedLabel = QLabel(self.chorusTab)
-        self.chorusSpeedLabel.setObjectName(u"chorusSpeedLabel")
-        self.chorusSpeedLabel.setGeometry(QRect(110, 60, 49, 16))
-        self.chorusSpeedLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.chorusToneDisplay = QLCDNumber(self.chorusTab)
-        self.chorusToneDisplay.setObjectName(u"chorusToneDisplay")
-        self.chorusToneDisplay.setGeometry(QRect(250, 80, 51, 23))
-        self.chorusToneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.chorusModeList = QListWidget(self.chorusTab)
-        __qlistwidgetitem5 = QListWidgetItem(self.chorusModeList)
-        __qlistwidgetitem5.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem5.setFont(font4);
-        __qlistwidgetitem6 = QListWidgetItem(self.chorusModeList)
-        __qlistwidgetitem6.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem6.setFont(font4);
-        self.chorusModeList.setObjectName(u"chorusModeList")
-        self.chorusModeList.setGeometry(QRect(20, 30, 51, 51))
-        self.chorusModeList.setUniformItemSizes(False)
-        self.chorusModeList.setSelectionRectVisible(False)
-        self.chorusToneLabel = QLabel(self.chorusTab)
-        self.chorusToneLabel.setObjectName(u"chorusToneLabel")
-        self.chorusToneLabel.setGeometry(QRect(250, 60, 49, 16))
-        self.chorusToneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.chorusDepthDisplay = QLCDNumber(self.chorusTab)
-        self.chorusDepthDisplay.setObjectName(u"chorusDepthDisplay")
-        self.chorusDepthDisplay.setGeometry(QRect(180, 80, 51, 23))
-        self.chorusDepthDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.chorusHelpLabel = QLabel(self.chorusTab)
-        self.chorusHelpLabel.setObjectName(u"chorusHelpLabel")
-        self.chorusHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.modulationTab.addTab(self.chorusTab, "")
         self.flangerTab = QWidget()
         self.flangerTab.setObjectName(u"flangerTab")
-        self.flangerRegenLabel = QLabel(self.flangerTab)
-        self.flangerRegenLabel.setObjectName(u"flangerRegenLabel")
-        self.flangerRegenLabel.setGeometry(QRect(250, 60, 49, 16))
-        self.flangerRegenLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.flangerSpeedDial = QDial(self.flangerTab)
-        self.flangerSpeedDial.setObjectName(u"flangerSpeedDial")
-        self.flangerSpeedDial.setGeometry(QRect(110, 0, 50, 64))
-        self.flangerSpeedDial.setAutoFillBackground(False)
-        self.flangerSpeedDial.setMaximum(100)
-        self.flangerSpeedDial.setWrapping(False)
-        self.flangerSpeedDial.setNotchesVisible(True)
-        self.flangerSpeedLabel = QLabel(self.flangerTab)
-        self.flangerSpeedLabel.setObjectName(u"flangerSpeedLabel")
-        self.flangerSpeedLabel.setGeometry(QRect(110, 60, 49, 16))
-        self.flangerSpeedLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.flangerRegenDial = QDial(self.flangerTab)
-        self.flangerRegenDial.setObjectName(u"flangerRegenDial")
-        self.flangerRegenDial.setGeometry(QRect(250, 0, 50, 64))
-        self.flangerRegenDial.setAutoFillBackground(False)
-        self.flangerRegenDial.setMaximum(100)
-        self.flangerRegenDial.setWrapping(False)
-        self.flangerRegenDial.setNotchesVisible(True)
-        self.flangerRegenDisplay = QLCDNumber(self.flangerTab)
-        self.flangerRegenDisplay.setObjectName(u"flangerRegenDisplay")
-        self.flangerRegenDisplay.setGeometry(QRect(250, 80, 51, 23))
-        self.flangerRegenDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.flangerSpeedDisplay = QLCDNumber(self.flangerTab)
-        self.flangerSpeedDisplay.setObjectName(u"flangerSpeedDisplay")
-        self.flangerSpeedDisplay.setGeometry(QRect(110, 80, 51, 23))
-        self.flangerSpeedDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.flangerDepthLabel = QLabel(self.flangerTab)
-        self.flangerDepthLabel.setObjectName(u"flangerDepthLabel")
-        self.flangerDepthLabel.setGeometry(QRect(170, 60, 71, 20))
-        self.flangerDepthLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.flangerDepthDisplay = QLCDNumber(self.flangerTab)
-        self.flangerDepthDisplay.setObjectName(u"flangerDepthDisplay")
-        self.flangerDepthDisplay.setGeometry(QRect(180, 80, 51, 23))
-        self.flangerDepthDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.flangerModeList = QListWidget(self.flangerTab)
-        __qlistwidgetitem7 = QListWidgetItem(self.flangerModeList)
-        __qlistwidgetitem7.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem7.setFont(font4);
-        __qlistwidgetitem8 = QListWidgetItem(self.flangerModeList)
-        __qlistwidgetitem8.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem8.setFont(font4);
-        self.flangerModeList.setObjectName(u"flangerModeList")
-        self.flangerModeList.setGeometry(QRect(20, 30, 51, 51))
-        self.flangerModeList.setUniformItemSizes(False)
-        self.flangerModeList.setSelectionRectVisible(False)
-        self.flangerDepthDial = QDial(self.flangerTab)
-        self.flangerDepthDial.setObjectName(u"flangerDepthDial")
-        self.flangerDepthDial.setGeometry(QRect(180, 0, 50, 64))
-        self.flangerDepthDial.setAutoFillBackground(False)
-        self.flangerDepthDial.setMaximum(100)
-        self.flangerDepthDial.setWrapping(False)
-        self.flangerDepthDial.setNotchesVisible(True)
-        self.flangerHelpLabel = QLabel(self.flangerTab)
-        self.flangerHelpLabel.setObjectName(u"flangerHelpLabel")
-        self.flangerHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.modulationTab.addTab(self.flangerTab, "")
         self.phaserTab = QWidget()
         self.phaserTab.setObjectName(u"phaserTab")
-        self.phaserDepthDial = QDial(self.phaserTab)
-        self.phaserDepthDial.setObjectName(u"phaserDepthDial")
-        self.phaserDepthDial.setGeometry(QRect(180, 0, 50, 64))
-        self.phaserDepthDial.setAutoFillBackground(False)
-        self.phaserDepthDial.setMaximum(100)
-        self.phaserDepthDial.setWrapping(False)
-        self.phaserDepthDial.setNotchesVisible(True)
-        self.phaserSpeedDial = QDial(self.phaserTab)
-        self.phaserSpeedDial.setObjectName(u"phaserSpeedDial")
-        self.phaserSpeedDial.setGeometry(QRect(110, 0, 50, 64))
-        self.phaserSpeedDial.setAutoFillBackground(False)
-        self.phaserSpeedDial.setMaximum(100)
-        self.phaserSpeedDial.setWrapping(False)
-        self.phaserSpeedDial.setNotchesVisible(True)
-        self.phaserDepthLabel = QLabel(self.phaserTab)
-        self.phaserDepthLabel.setObjectName(u"phaserDepthLabel")
-        self.phaserDepthLabel.setGeometry(QRect(170, 60, 71, 20))
-        self.phaserDepthLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.phaserRegenDial = QDial(self.phaserTab)
-        self.phaserRegenDial.setObjectName(u"phaserRegenDial")
-        self.phaserRegenDial.setGeometry(QRect(250, 0, 50, 64))
-        self.phaserRegenDial.setAutoFillBackground(False)
-        self.phaserRegenDial.setMaximum(100)
-        self.phaserRegenDial.setWrapping(False)
-        self.phaserRegenDial.setNotchesVisible(True)
-        self.phaserDepthDisplay = QLCDNumber(self.phaserTab)
-        self.phaserDepthDisplay.setObjectName(u"phaserDepthDisplay")
-        self.phaserDepthDisplay.setGeometry(QRect(180, 80, 51, 23))
-        self.phaserDepthDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.phaserModeList = QListWidget(self.phaserTab)
-        __qlistwidgetitem9 = QListWidgetItem(self.phaserModeList)
-        __qlistwidgetitem9.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem9.setFont(font4);
-        __qlistwidgetitem10 = QListWidgetItem(self.phaserModeList)
-        __qlistwidgetitem10.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem10.setFont(font4);
-        self.phaserModeList.setObjectName(u"phaserModeList")
-        self.phaserModeList.setGeometry(QRect(20, 30, 51, 51))
-        self.phaserModeList.setUniformItemSizes(False)
-        self.phaserModeList.setSelectionRectVisible(False)
-        self.phaserRegenLabel = QLabel(self.phaserTab)
-        self.phaserRegenLabel.setObjectName(u"phaserRegenLabel")
-        self.phaserRegenLabel.setGeometry(QRect(250, 60, 49, 16))
-        self.phaserRegenLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.phaserSpeedLabel = QLabel(self.phaserTab)
-        self.phaserSpeedLabel.setObjectName(u"phaserSpeedLabel")
-        self.phaserSpeedLabel.setGeometry(QRect(110, 60, 49, 16))
-        self.phaserSpeedLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.phaserSpeedDisplay = QLCDNumber(self.phaserTab)
-        self.phaserSpeedDisplay.setObjectName(u"phaserSpeedDisplay")
-        self.phaserSpeedDisplay.setGeometry(QRect(110, 80, 51, 23))
-        self.phaserSpeedDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.phaserRegenDisplay = QLCDNumber(self.phaserTab)
-        self.phaserRegenDisplay.setObjectName(u"phaserRegenDisplay")
-        self.phaserRegenDisplay.setGeometry(QRect(250, 80, 51, 23))
-        self.phaserRegenDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.phaserHelpLabel = QLabel(self.phaserTab)
-        self.phaserHelpLabel.setObjectName(u"phaserHelpLabel")
-        self.phaserHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.modulationTab.addTab(self.phaserTab, "")
         self.tremoloTab = QWidget()
         self.tremoloTab.setObjectName(u"tremoloTab")
-        self.tremoloSkewLabel = QLabel(self.tremoloTab)
-        self.tremoloSkewLabel.setObjectName(u"tremoloSkewLabel")
-        self.tremoloSkewLabel.setGeometry(QRect(250, 60, 49, 16))
-        self.tremoloSkewLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.tremoloSpeedDial = QDial(self.tremoloTab)
-        self.tremoloSpeedDial.setObjectName(u"tremoloSpeedDial")
-        self.tremoloSpeedDial.setGeometry(QRect(110, 0, 50, 64))
-        self.tremoloSpeedDial.setAutoFillBackground(False)
-        self.tremoloSpeedDial.setMaximum(100)
-        self.tremoloSpeedDial.setWrapping(False)
-        self.tremoloSpeedDial.setNotchesVisible(True)
-        self.tremoloSpeedLabel = QLabel(self.tremoloTab)
-        self.tremoloSpeedLabel.setObjectName(u"tremoloSpeedLabel")
-        self.tremoloSpeedLabel.setGeometry(QRect(110, 60, 49, 16))
-        self.tremoloSpeedLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.tremoloSkewDial = QDial(self.tremoloTab)
-        self.tremoloSkewDial.setObjectName(u"tremoloSkewDial")
-        self.tremoloSkewDial.setGeometry(QRect(250, 0, 50, 64))
-        self.tremoloSkewDial.setAutoFillBackground(False)
-        self.tremoloSkewDial.setMinimum(-50)
-        self.tremoloSkewDial.setMaximum(50)
-        self.tremoloSkewDial.setWrapping(False)
-        self.tremoloSkewDial.setNotchesVisible(True)
-        self.tremoloSkewDisplay = QLCDNumber(self.tremoloTab)
-        self.tremoloSkewDisplay.setObjectName(u"tremoloSkewDisplay")
-        self.tremoloSkewDisplay.setGeometry(QRect(250, 80, 51, 23))
-        self.tremoloSkewDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.tremoloSkewDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.tremoloSpeedDisplay = QLCDNumber(self.tremoloTab)
-        self.tremoloSpeedDisplay.setObjectName(u"tremoloSpeedDisplay")
-        self.tremoloSpeedDisplay.setGeometry(QRect(110, 80, 51, 23))
-        self.tremoloSpeedDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.tremoloSpeedDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.tremoloDepthLabel = QLabel(self.tremoloTab)
-        self.tremoloDepthLabel.setObjectName(u"tremoloDepthLabel")
-        self.tremoloDepthLabel.setGeometry(QRect(170, 60, 71, 20))
-        self.tremoloDepthLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.tremoloDepthDisplay = QLCDNumber(self.tremoloTab)
-        self.tremoloDepthDisplay.setObjectName(u"tremoloDepthDisplay")
-        self.tremoloDepthDisplay.setGeometry(QRect(180, 80, 51, 23))
-        self.tremoloDepthDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.tremoloDepthDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.tremoloModeList = QListWidget(self.tremoloTab)
-        __qlistwidgetitem11 = QListWidgetItem(self.tremoloModeList)
-        __qlistwidgetitem11.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem11.setFont(font4);
-        __qlistwidgetitem12 = QListWidgetItem(self.tremoloModeList)
-        __qlistwidgetitem12.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem12.setFont(font4);
-        self.tremoloModeList.setObjectName(u"tremoloModeList")
-        self.tremoloModeList.setGeometry(QRect(20, 30, 51, 51))
-        self.tremoloModeList.setUniformItemSizes(False)
-        self.tremoloModeList.setSelectionRectVisible(False)
-        self.tremoloDepthDial = QDial(self.tremoloTab)
-        self.tremoloDepthDial.setObjectName(u"tremoloDepthDial")
-        self.tremoloDepthDial.setGeometry(QRect(180, 0, 50, 64))
-        self.tremoloDepthDial.setAutoFillBackground(False)
-        self.tremoloDepthDial.setMaximum(100)
-        self.tremoloDepthDial.setWrapping(False)
-        self.tremoloDepthDial.setNotchesVisible(True)
-        self.tremoloHelpLabel = QLabel(self.tremoloTab)
-        self.tremoloHelpLabel.setObjectName(u"tremoloHelpLabel")
-        self.tremoloHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.modulationTab.addTab(self.tremoloTab, "")
         self.delayGroupBox = QGroupBox(self.centralwidget)
         self.delayGroupBox.setObjectName(u"delayGroupBox")
@@ -831,277 +408,15 @@ class Ui_MainWindow(object):
         self.delayTab.setGeometry(QRect(90, 20, 331, 141))
         self.studioTab = QWidget()
         self.studioTab.setObjectName(u"studioTab")
-        self.studioTimeDial = QDial(self.studioTab)
-        self.studioTimeDial.setObjectName(u"studioTimeDial")
-        self.studioTimeDial.setGeometry(QRect(30, 0, 50, 64))
-        self.studioTimeDial.setAutoFillBackground(False)
-        self.studioTimeDial.setMaximum(4000)
-        self.studioTimeDial.setWrapping(False)
-        self.studioTimeDial.setNotchesVisible(True)
-        self.studioTimeDisplay = QLCDNumber(self.studioTab)
-        self.studioTimeDisplay.setObjectName(u"studioTimeDisplay")
-        self.studioTimeDisplay.setGeometry(QRect(30, 80, 51, 23))
-        self.studioTimeDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.studioTimeLabel = QLabel(self.studioTab)
-        self.studioTimeLabel.setObjectName(u"studioTimeLabel")
-        self.studioTimeLabel.setGeometry(QRect(30, 60, 49, 16))
-        self.studioTimeLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.studioFeedbackDisplay = QLCDNumber(self.studioTab)
-        self.studioFeedbackDisplay.setObjectName(u"studioFeedbackDisplay")
-        self.studioFeedbackDisplay.setGeometry(QRect(100, 80, 51, 23))
-        self.studioFeedbackDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.studioFeedbackDial = QDial(self.studioTab)
-        self.studioFeedbackDial.setObjectName(u"studioFeedbackDial")
-        self.studioFeedbackDial.setGeometry(QRect(100, 0, 50, 64))
-        self.studioFeedbackDial.setAutoFillBackground(False)
-        self.studioFeedbackDial.setMaximum(100)
-        self.studioFeedbackDial.setWrapping(False)
-        self.studioFeedbackDial.setNotchesVisible(True)
-        self.studioFeedbackLabel = QLabel(self.studioTab)
-        self.studioFeedbackLabel.setObjectName(u"studioFeedbackLabel")
-        self.studioFeedbackLabel.setGeometry(QRect(88, 60, 71, 20))
-        self.studioFeedbackLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.studioFreqLabel = QLabel(self.studioTab)
-        self.studioFreqLabel.setObjectName(u"studioFreqLabel")
-        self.studioFreqLabel.setGeometry(QRect(170, 60, 49, 16))
-        self.studioFreqLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.studioFreqDial = QDial(self.studioTab)
-        self.studioFreqDial.setObjectName(u"studioFreqDial")
-        self.studioFreqDial.setGeometry(QRect(170, 0, 50, 64))
-        self.studioFreqDial.setAutoFillBackground(False)
-        self.studioFreqDial.setMaximum(100)
-        self.studioFreqDial.setWrapping(False)
-        self.studioFreqDial.setNotchesVisible(True)
-        self.studioFreqDisplay = QLCDNumber(self.studioTab)
-        self.studioFreqDisplay.setObjectName(u"studioFreqDisplay")
-        self.studioFreqDisplay.setGeometry(QRect(170, 80, 51, 23))
-        self.studioFreqDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.studioLevelLabel = QLabel(self.studioTab)
-        self.studioLevelLabel.setObjectName(u"studioLevelLabel")
-        self.studioLevelLabel.setGeometry(QRect(240, 60, 49, 16))
-        self.studioLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.studioLevelDisplay = QLCDNumber(self.studioTab)
-        self.studioLevelDisplay.setObjectName(u"studioLevelDisplay")
-        self.studioLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
-        self.studioLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.studioLevelDial = QDial(self.studioTab)
-        self.studioLevelDial.setObjectName(u"studioLevelDial")
-        self.studioLevelDial.setGeometry(QRect(240, 0, 50, 64))
-        self.studioLevelDial.setAutoFillBackground(False)
-        self.studioLevelDial.setMaximum(100)
-        self.studioLevelDial.setWrapping(False)
-        self.studioLevelDial.setNotchesVisible(True)
-        self.studioHelpLabel = QLabel(self.studioTab)
-        self.studioHelpLabel.setObjectName(u"studioHelpLabel")
-        self.studioHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.delayTab.addTab(self.studioTab, "")
         self.vintageTab = QWidget()
         self.vintageTab.setObjectName(u"vintageTab")
-        self.vintageLevelLabel = QLabel(self.vintageTab)
-        self.vintageLevelLabel.setObjectName(u"vintageLevelLabel")
-        self.vintageLevelLabel.setGeometry(QRect(240, 60, 49, 16))
-        self.vintageLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.vintageAgeDisplay = QLCDNumber(self.vintageTab)
-        self.vintageAgeDisplay.setObjectName(u"vintageAgeDisplay")
-        self.vintageAgeDisplay.setGeometry(QRect(100, 80, 51, 23))
-        self.vintageAgeDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.vintageTimeDisplay = QLCDNumber(self.vintageTab)
-        self.vintageTimeDisplay.setObjectName(u"vintageTimeDisplay")
-        self.vintageTimeDisplay.setGeometry(QRect(30, 80, 51, 23))
-        self.vintageTimeDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.vintageAgeLabel = QLabel(self.vintageTab)
-        self.vintageAgeLabel.setObjectName(u"vintageAgeLabel")
-        self.vintageAgeLabel.setGeometry(QRect(88, 60, 71, 20))
-        self.vintageAgeLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.vintageFreqDial = QDial(self.vintageTab)
-        self.vintageFreqDial.setObjectName(u"vintageFreqDial")
-        self.vintageFreqDial.setGeometry(QRect(170, 0, 50, 64))
-        self.vintageFreqDial.setAutoFillBackground(False)
-        self.vintageFreqDial.setMaximum(100)
-        self.vintageFreqDial.setWrapping(False)
-        self.vintageFreqDial.setNotchesVisible(True)
-        self.vintageTimeLabel = QLabel(self.vintageTab)
-        self.vintageTimeLabel.setObjectName(u"vintageTimeLabel")
-        self.vintageTimeLabel.setGeometry(QRect(30, 60, 49, 16))
-        self.vintageTimeLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.vintageLevelDisplay = QLCDNumber(self.vintageTab)
-        self.vintageLevelDisplay.setObjectName(u"vintageLevelDisplay")
-        self.vintageLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
-        self.vintageLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.vintageLevelDial = QDial(self.vintageTab)
-        self.vintageLevelDial.setObjectName(u"vintageLevelDial")
-        self.vintageLevelDial.setGeometry(QRect(240, 0, 50, 64))
-        self.vintageLevelDial.setAutoFillBackground(False)
-        self.vintageLevelDial.setMaximum(100)
-        self.vintageLevelDial.setWrapping(False)
-        self.vintageLevelDial.setNotchesVisible(True)
-        self.vintageFreqLabel = QLabel(self.vintageTab)
-        self.vintageFreqLabel.setObjectName(u"vintageFreqLabel")
-        self.vintageFreqLabel.setGeometry(QRect(170, 60, 49, 16))
-        self.vintageFreqLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.vintageTimeDial = QDial(self.vintageTab)
-        self.vintageTimeDial.setObjectName(u"vintageTimeDial")
-        self.vintageTimeDial.setGeometry(QRect(30, 0, 50, 64))
-        self.vintageTimeDial.setAutoFillBackground(False)
-        self.vintageTimeDial.setMaximum(4000)
-        self.vintageTimeDial.setWrapping(False)
-        self.vintageTimeDial.setNotchesVisible(True)
-        self.vintageFreqDisplay = QLCDNumber(self.vintageTab)
-        self.vintageFreqDisplay.setObjectName(u"vintageFreqDisplay")
-        self.vintageFreqDisplay.setGeometry(QRect(170, 80, 51, 23))
-        self.vintageFreqDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.vintageAgeDial = QDial(self.vintageTab)
-        self.vintageAgeDial.setObjectName(u"vintageAgeDial")
-        self.vintageAgeDial.setGeometry(QRect(100, 0, 50, 64))
-        self.vintageAgeDial.setAutoFillBackground(False)
-        self.vintageAgeDial.setMaximum(100)
-        self.vintageAgeDial.setWrapping(False)
-        self.vintageAgeDial.setNotchesVisible(True)
-        self.vintageHelpLabel = QLabel(self.vintageTab)
-        self.vintageHelpLabel.setObjectName(u"vintageHelpLabel")
-        self.vintageHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.delayTab.addTab(self.vintageTab, "")
         self.multiTab = QWidget()
         self.multiTab.setObjectName(u"multiTab")
-        self.multiLevelLabel = QLabel(self.multiTab)
-        self.multiLevelLabel.setObjectName(u"multiLevelLabel")
-        self.multiLevelLabel.setGeometry(QRect(240, 60, 49, 16))
-        self.multiLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.multiLevelDisplay = QLCDNumber(self.multiTab)
-        self.multiLevelDisplay.setObjectName(u"multiLevelDisplay")
-        self.multiLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
-        self.multiLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.multiFeedbackDisplay = QLCDNumber(self.multiTab)
-        self.multiFeedbackDisplay.setObjectName(u"multiFeedbackDisplay")
-        self.multiFeedbackDisplay.setGeometry(QRect(100, 80, 51, 23))
-        self.multiFeedbackDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.multiFeedbackDial = QDial(self.multiTab)
-        self.multiFeedbackDial.setObjectName(u"multiFeedbackDial")
-        self.multiFeedbackDial.setGeometry(QRect(100, 0, 50, 64))
-        self.multiFeedbackDial.setAutoFillBackground(False)
-        self.multiFeedbackDial.setMaximum(100)
-        self.multiFeedbackDial.setWrapping(False)
-        self.multiFeedbackDial.setNotchesVisible(True)
-        self.multiTimeDisplay = QLCDNumber(self.multiTab)
-        self.multiTimeDisplay.setObjectName(u"multiTimeDisplay")
-        self.multiTimeDisplay.setGeometry(QRect(30, 80, 51, 23))
-        self.multiTimeDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.multiLevelDial = QDial(self.multiTab)
-        self.multiLevelDial.setObjectName(u"multiLevelDial")
-        self.multiLevelDial.setGeometry(QRect(240, 0, 50, 64))
-        self.multiLevelDial.setAutoFillBackground(False)
-        self.multiLevelDial.setMaximum(100)
-        self.multiLevelDial.setWrapping(False)
-        self.multiLevelDial.setNotchesVisible(True)
-        self.multiTimeDial = QDial(self.multiTab)
-        self.multiTimeDial.setObjectName(u"multiTimeDial")
-        self.multiTimeDial.setGeometry(QRect(30, 0, 50, 64))
-        self.multiTimeDial.setAutoFillBackground(False)
-        self.multiTimeDial.setMaximum(4000)
-        self.multiTimeDial.setWrapping(False)
-        self.multiTimeDial.setNotchesVisible(True)
-        self.multiTimeLabel = QLabel(self.multiTab)
-        self.multiTimeLabel.setObjectName(u"multiTimeLabel")
-        self.multiTimeLabel.setGeometry(QRect(30, 60, 49, 16))
-        self.multiTimeLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.multiFeedbackLabel = QLabel(self.multiTab)
-        self.multiFeedbackLabel.setObjectName(u"multiFeedbackLabel")
-        self.multiFeedbackLabel.setGeometry(QRect(88, 60, 71, 20))
-        self.multiFeedbackLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.multiTapPatternList = QListWidget(self.multiTab)
-        font5 = QFont()
-        font5.setPointSize(7)
-        __qlistwidgetitem13 = QListWidgetItem(self.multiTapPatternList)
-        __qlistwidgetitem13.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem13.setFont(font5);
-        __qlistwidgetitem14 = QListWidgetItem(self.multiTapPatternList)
-        __qlistwidgetitem14.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem14.setFont(font5);
-        __qlistwidgetitem15 = QListWidgetItem(self.multiTapPatternList)
-        __qlistwidgetitem15.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem15.setFont(font5);
-        __qlistwidgetitem16 = QListWidgetItem(self.multiTapPatternList)
-        __qlistwidgetitem16.setTextAlignment(Qt.AlignCenter);
-        __qlistwidgetitem16.setFont(font5);
-        self.multiTapPatternList.setObjectName(u"multiTapPatternList")
-        self.multiTapPatternList.setGeometry(QRect(170, 10, 51, 61))
-        self.multiTapPatternLabel = QLabel(self.multiTab)
-        self.multiTapPatternLabel.setObjectName(u"multiTapPatternLabel")
-        self.multiTapPatternLabel.setGeometry(QRect(160, 80, 71, 20))
-        self.multiTapPatternLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.multiHelpLabel = QLabel(self.multiTab)
-        self.multiHelpLabel.setObjectName(u"multiHelpLabel")
-        self.multiHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.delayTab.addTab(self.multiTab, "")
         self.reverseTab = QWidget()
         self.reverseTab.setObjectName(u"reverseTab")
-        self.reverseTimeDisplay = QLCDNumber(self.reverseTab)
-        self.reverseTimeDisplay.setObjectName(u"reverseTimeDisplay")
-        self.reverseTimeDisplay.setGeometry(QRect(30, 80, 51, 23))
-        self.reverseTimeDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.reverseTimeDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.reverseFreqLabel = QLabel(self.reverseTab)
-        self.reverseFreqLabel.setObjectName(u"reverseFreqLabel")
-        self.reverseFreqLabel.setGeometry(QRect(170, 60, 49, 16))
-        self.reverseFreqLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.reverseLevelLabel = QLabel(self.reverseTab)
-        self.reverseLevelLabel.setObjectName(u"reverseLevelLabel")
-        self.reverseLevelLabel.setGeometry(QRect(240, 60, 49, 16))
-        self.reverseLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.reverseLevelDial = QDial(self.reverseTab)
-        self.reverseLevelDial.setObjectName(u"reverseLevelDial")
-        self.reverseLevelDial.setGeometry(QRect(240, 0, 50, 64))
-        self.reverseLevelDial.setAutoFillBackground(False)
-        self.reverseLevelDial.setMaximum(100)
-        self.reverseLevelDial.setWrapping(False)
-        self.reverseLevelDial.setNotchesVisible(True)
-        self.reverseTimeLabel = QLabel(self.reverseTab)
-        self.reverseTimeLabel.setObjectName(u"reverseTimeLabel")
-        self.reverseTimeLabel.setGeometry(QRect(30, 60, 49, 16))
-        self.reverseTimeLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.reverseFeedbackLabel = QLabel(self.reverseTab)
-        self.reverseFeedbackLabel.setObjectName(u"reverseFeedbackLabel")
-        self.reverseFeedbackLabel.setGeometry(QRect(88, 60, 71, 20))
-        self.reverseFeedbackLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.reverseFeedbackDial = QDial(self.reverseTab)
-        self.reverseFeedbackDial.setObjectName(u"reverseFeedbackDial")
-        self.reverseFeedbackDial.setGeometry(QRect(100, 0, 50, 64))
-        self.reverseFeedbackDial.setAutoFillBackground(False)
-        self.reverseFeedbackDial.setMaximum(100)
-        self.reverseFeedbackDial.setWrapping(False)
-        self.reverseFeedbackDial.setNotchesVisible(True)
-        self.reverseLevelDisplay = QLCDNumber(self.reverseTab)
-        self.reverseLevelDisplay.setObjectName(u"reverseLevelDisplay")
-        self.reverseLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
-        self.reverseLevelDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.reverseLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.reverseFreqDisplay = QLCDNumber(self.reverseTab)
-        self.reverseFreqDisplay.setObjectName(u"reverseFreqDisplay")
-        self.reverseFreqDisplay.setGeometry(QRect(170, 80, 51, 23))
-        self.reverseFreqDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.reverseFreqDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.reverseFreqDial = QDial(self.reverseTab)
-        self.reverseFreqDial.setObjectName(u"reverseFreqDial")
-        self.reverseFreqDial.setGeometry(QRect(170, 0, 50, 64))
-        self.reverseFreqDial.setAutoFillBackground(False)
-        self.reverseFreqDial.setMaximum(100)
-        self.reverseFreqDial.setWrapping(False)
-        self.reverseFreqDial.setNotchesVisible(True)
-        self.reverseTimeDial = QDial(self.reverseTab)
-        self.reverseTimeDial.setObjectName(u"reverseTimeDial")
-        self.reverseTimeDial.setGeometry(QRect(30, 0, 50, 64))
-        self.reverseTimeDial.setAutoFillBackground(False)
-        self.reverseTimeDial.setMaximum(4000)
-        self.reverseTimeDial.setWrapping(False)
-        self.reverseTimeDial.setNotchesVisible(True)
-        self.reverseFeedbackDisplay = QLCDNumber(self.reverseTab)
-        self.reverseFeedbackDisplay.setObjectName(u"reverseFeedbackDisplay")
-        self.reverseFeedbackDisplay.setGeometry(QRect(100, 80, 51, 23))
-        self.reverseFeedbackDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.reverseFeedbackDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.reverseHelpLabel = QLabel(self.reverseTab)
-        self.reverseHelpLabel.setObjectName(u"reverseHelpLabel")
-        self.reverseHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.delayTab.addTab(self.reverseTab, "")
         self.reverbGroupBox = QGroupBox(self.centralwidget)
         self.reverbGroupBox.setObjectName(u"reverbGroupBox")
@@ -1116,271 +431,15 @@ class Ui_MainWindow(object):
         self.reverbTab.setGeometry(QRect(90, 20, 331, 141))
         self.roomTab = QWidget()
         self.roomTab.setObjectName(u"roomTab")
-        self.roomDecayDial = QDial(self.roomTab)
-        self.roomDecayDial.setObjectName(u"roomDecayDial")
-        self.roomDecayDial.setGeometry(QRect(30, 0, 50, 64))
-        self.roomDecayDial.setAutoFillBackground(False)
-        self.roomDecayDial.setMaximum(100)
-        self.roomDecayDial.setWrapping(False)
-        self.roomDecayDial.setNotchesVisible(True)
-        self.roomDecayDisplay = QLCDNumber(self.roomTab)
-        self.roomDecayDisplay.setObjectName(u"roomDecayDisplay")
-        self.roomDecayDisplay.setGeometry(QRect(30, 80, 51, 23))
-        self.roomDecayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.roomDecayLabel = QLabel(self.roomTab)
-        self.roomDecayLabel.setObjectName(u"roomDecayLabel")
-        self.roomDecayLabel.setGeometry(QRect(30, 60, 49, 16))
-        self.roomDecayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.roomPreDelayDisplay = QLCDNumber(self.roomTab)
-        self.roomPreDelayDisplay.setObjectName(u"roomPreDelayDisplay")
-        self.roomPreDelayDisplay.setGeometry(QRect(100, 80, 51, 23))
-        self.roomPreDelayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.roomPreDelayDial = QDial(self.roomTab)
-        self.roomPreDelayDial.setObjectName(u"roomPreDelayDial")
-        self.roomPreDelayDial.setGeometry(QRect(100, 0, 50, 64))
-        self.roomPreDelayDial.setAutoFillBackground(False)
-        self.roomPreDelayDial.setMaximum(100)
-        self.roomPreDelayDial.setWrapping(False)
-        self.roomPreDelayDial.setNotchesVisible(True)
-        self.roomPreDelayLabel = QLabel(self.roomTab)
-        self.roomPreDelayLabel.setObjectName(u"roomPreDelayLabel")
-        self.roomPreDelayLabel.setGeometry(QRect(88, 60, 71, 20))
-        self.roomPreDelayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.roomToneLabel = QLabel(self.roomTab)
-        self.roomToneLabel.setObjectName(u"roomToneLabel")
-        self.roomToneLabel.setGeometry(QRect(170, 60, 49, 16))
-        self.roomToneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.roomToneDial = QDial(self.roomTab)
-        self.roomToneDial.setObjectName(u"roomToneDial")
-        self.roomToneDial.setGeometry(QRect(170, 0, 50, 64))
-        self.roomToneDial.setAutoFillBackground(False)
-        self.roomToneDial.setMaximum(100)
-        self.roomToneDial.setWrapping(False)
-        self.roomToneDial.setNotchesVisible(True)
-        self.roomToneDisplay = QLCDNumber(self.roomTab)
-        self.roomToneDisplay.setObjectName(u"roomToneDisplay")
-        self.roomToneDisplay.setGeometry(QRect(170, 80, 51, 23))
-        self.roomToneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.roomLevelLabel = QLabel(self.roomTab)
-        self.roomLevelLabel.setObjectName(u"roomLevelLabel")
-        self.roomLevelLabel.setGeometry(QRect(240, 60, 49, 16))
-        self.roomLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.roomLevelDisplay = QLCDNumber(self.roomTab)
-        self.roomLevelDisplay.setObjectName(u"roomLevelDisplay")
-        self.roomLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
-        self.roomLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.roomLevelDial = QDial(self.roomTab)
-        self.roomLevelDial.setObjectName(u"roomLevelDial")
-        self.roomLevelDial.setGeometry(QRect(240, 0, 50, 64))
-        self.roomLevelDial.setAutoFillBackground(False)
-        self.roomLevelDial.setMaximum(100)
-        self.roomLevelDial.setWrapping(False)
-        self.roomLevelDial.setNotchesVisible(True)
-        self.roomHelpLabel = QLabel(self.roomTab)
-        self.roomHelpLabel.setObjectName(u"roomHelpLabel")
-        self.roomHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.reverbTab.addTab(self.roomTab, "")
         self.hallTab = QWidget()
         self.hallTab.setObjectName(u"hallTab")
-        self.hallLevelLabel = QLabel(self.hallTab)
-        self.hallLevelLabel.setObjectName(u"hallLevelLabel")
-        self.hallLevelLabel.setGeometry(QRect(240, 60, 49, 16))
-        self.hallLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.hallPreDelayDisplay = QLCDNumber(self.hallTab)
-        self.hallPreDelayDisplay.setObjectName(u"hallPreDelayDisplay")
-        self.hallPreDelayDisplay.setGeometry(QRect(100, 80, 51, 23))
-        self.hallPreDelayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.hallDecayDisplay = QLCDNumber(self.hallTab)
-        self.hallDecayDisplay.setObjectName(u"hallDecayDisplay")
-        self.hallDecayDisplay.setGeometry(QRect(30, 80, 51, 23))
-        self.hallDecayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.hallPreDelayLabel = QLabel(self.hallTab)
-        self.hallPreDelayLabel.setObjectName(u"hallPreDelayLabel")
-        self.hallPreDelayLabel.setGeometry(QRect(88, 60, 71, 20))
-        self.hallPreDelayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.hallToneDial = QDial(self.hallTab)
-        self.hallToneDial.setObjectName(u"hallToneDial")
-        self.hallToneDial.setGeometry(QRect(170, 0, 50, 64))
-        self.hallToneDial.setAutoFillBackground(False)
-        self.hallToneDial.setMaximum(100)
-        self.hallToneDial.setWrapping(False)
-        self.hallToneDial.setNotchesVisible(True)
-        self.hallDecayLabel = QLabel(self.hallTab)
-        self.hallDecayLabel.setObjectName(u"hallDecayLabel")
-        self.hallDecayLabel.setGeometry(QRect(30, 60, 49, 16))
-        self.hallDecayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.hallLevelDisplay = QLCDNumber(self.hallTab)
-        self.hallLevelDisplay.setObjectName(u"hallLevelDisplay")
-        self.hallLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
-        self.hallLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.hallLevelDial = QDial(self.hallTab)
-        self.hallLevelDial.setObjectName(u"hallLevelDial")
-        self.hallLevelDial.setGeometry(QRect(240, 0, 50, 64))
-        self.hallLevelDial.setAutoFillBackground(False)
-        self.hallLevelDial.setMaximum(100)
-        self.hallLevelDial.setWrapping(False)
-        self.hallLevelDial.setNotchesVisible(True)
-        self.hallToneLabel = QLabel(self.hallTab)
-        self.hallToneLabel.setObjectName(u"hallToneLabel")
-        self.hallToneLabel.setGeometry(QRect(170, 60, 49, 16))
-        self.hallToneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.hallDecayDial = QDial(self.hallTab)
-        self.hallDecayDial.setObjectName(u"hallDecayDial")
-        self.hallDecayDial.setGeometry(QRect(30, 0, 50, 64))
-        self.hallDecayDial.setAutoFillBackground(False)
-        self.hallDecayDial.setMaximum(100)
-        self.hallDecayDial.setWrapping(False)
-        self.hallDecayDial.setNotchesVisible(True)
-        self.hallToneDisplay = QLCDNumber(self.hallTab)
-        self.hallToneDisplay.setObjectName(u"hallToneDisplay")
-        self.hallToneDisplay.setGeometry(QRect(170, 80, 51, 23))
-        self.hallToneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.hallPreDelayDial = QDial(self.hallTab)
-        self.hallPreDelayDial.setObjectName(u"hallPreDelayDial")
-        self.hallPreDelayDial.setGeometry(QRect(100, 0, 50, 64))
-        self.hallPreDelayDial.setAutoFillBackground(False)
-        self.hallPreDelayDial.setMaximum(100)
-        self.hallPreDelayDial.setWrapping(False)
-        self.hallPreDelayDial.setNotchesVisible(True)
-        self.hallHelpLabel = QLabel(self.hallTab)
-        self.hallHelpLabel.setObjectName(u"hallHelpLabel")
-        self.hallHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.reverbTab.addTab(self.hallTab, "")
         self.springTab = QWidget()
         self.springTab.setObjectName(u"springTab")
-        self.springLevelLabel = QLabel(self.springTab)
-        self.springLevelLabel.setObjectName(u"springLevelLabel")
-        self.springLevelLabel.setGeometry(QRect(240, 60, 49, 16))
-        self.springLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.springLevelDisplay = QLCDNumber(self.springTab)
-        self.springLevelDisplay.setObjectName(u"springLevelDisplay")
-        self.springLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
-        self.springLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.springPreDelayDisplay = QLCDNumber(self.springTab)
-        self.springPreDelayDisplay.setObjectName(u"springPreDelayDisplay")
-        self.springPreDelayDisplay.setGeometry(QRect(100, 80, 51, 23))
-        self.springPreDelayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.springPreDelayDial = QDial(self.springTab)
-        self.springPreDelayDial.setObjectName(u"springPreDelayDial")
-        self.springPreDelayDial.setGeometry(QRect(100, 0, 50, 64))
-        self.springPreDelayDial.setAutoFillBackground(False)
-        self.springPreDelayDial.setMaximum(100)
-        self.springPreDelayDial.setWrapping(False)
-        self.springPreDelayDial.setNotchesVisible(True)
-        self.springDecayDisplay = QLCDNumber(self.springTab)
-        self.springDecayDisplay.setObjectName(u"springDecayDisplay")
-        self.springDecayDisplay.setGeometry(QRect(30, 80, 51, 23))
-        self.springDecayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.springLevelDial = QDial(self.springTab)
-        self.springLevelDial.setObjectName(u"springLevelDial")
-        self.springLevelDial.setGeometry(QRect(240, 0, 50, 64))
-        self.springLevelDial.setAutoFillBackground(False)
-        self.springLevelDial.setMaximum(100)
-        self.springLevelDial.setWrapping(False)
-        self.springLevelDial.setNotchesVisible(True)
-        self.springDecayDial = QDial(self.springTab)
-        self.springDecayDial.setObjectName(u"springDecayDial")
-        self.springDecayDial.setGeometry(QRect(30, 0, 50, 64))
-        self.springDecayDial.setAutoFillBackground(False)
-        self.springDecayDial.setMaximum(100)
-        self.springDecayDial.setWrapping(False)
-        self.springDecayDial.setNotchesVisible(True)
-        self.springDecayLabel = QLabel(self.springTab)
-        self.springDecayLabel.setObjectName(u"springDecayLabel")
-        self.springDecayLabel.setGeometry(QRect(30, 60, 49, 16))
-        self.springDecayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.springPreDelayLabel = QLabel(self.springTab)
-        self.springPreDelayLabel.setObjectName(u"springPreDelayLabel")
-        self.springPreDelayLabel.setGeometry(QRect(88, 60, 71, 20))
-        self.springPreDelayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.springToneLabel = QLabel(self.springTab)
-        self.springToneLabel.setObjectName(u"springToneLabel")
-        self.springToneLabel.setGeometry(QRect(170, 60, 49, 16))
-        self.springToneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.springToneDisplay = QLCDNumber(self.springTab)
-        self.springToneDisplay.setObjectName(u"springToneDisplay")
-        self.springToneDisplay.setGeometry(QRect(170, 80, 51, 23))
-        self.springToneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.springToneDial = QDial(self.springTab)
-        self.springToneDial.setObjectName(u"springToneDial")
-        self.springToneDial.setGeometry(QRect(170, 0, 50, 64))
-        self.springToneDial.setAutoFillBackground(False)
-        self.springToneDial.setMaximum(100)
-        self.springToneDial.setWrapping(False)
-        self.springToneDial.setNotchesVisible(True)
-        self.springHelpLabel = QLabel(self.springTab)
-        self.springHelpLabel.setObjectName(u"springHelpLabel")
-        self.springHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.reverbTab.addTab(self.springTab, "")
         self.stadiumTab = QWidget()
         self.stadiumTab.setObjectName(u"stadiumTab")
-        self.stadiumDecayDisplay = QLCDNumber(self.stadiumTab)
-        self.stadiumDecayDisplay.setObjectName(u"stadiumDecayDisplay")
-        self.stadiumDecayDisplay.setGeometry(QRect(30, 80, 51, 23))
-        self.stadiumDecayDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.stadiumDecayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.stadiumToneLabel = QLabel(self.stadiumTab)
-        self.stadiumToneLabel.setObjectName(u"stadiumToneLabel")
-        self.stadiumToneLabel.setGeometry(QRect(170, 60, 49, 16))
-        self.stadiumToneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.stadiumLevelLabel = QLabel(self.stadiumTab)
-        self.stadiumLevelLabel.setObjectName(u"stadiumLevelLabel")
-        self.stadiumLevelLabel.setGeometry(QRect(240, 60, 49, 16))
-        self.stadiumLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.stadiumLevelDial = QDial(self.stadiumTab)
-        self.stadiumLevelDial.setObjectName(u"stadiumLevelDial")
-        self.stadiumLevelDial.setGeometry(QRect(240, 0, 50, 64))
-        self.stadiumLevelDial.setAutoFillBackground(False)
-        self.stadiumLevelDial.setMaximum(100)
-        self.stadiumLevelDial.setWrapping(False)
-        self.stadiumLevelDial.setNotchesVisible(True)
-        self.stadiumPreDelayLabel = QLabel(self.stadiumTab)
-        self.stadiumPreDelayLabel.setObjectName(u"stadiumPreDelayLabel")
-        self.stadiumPreDelayLabel.setGeometry(QRect(88, 60, 71, 20))
-        self.stadiumPreDelayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.stadiumPreDelayDial = QDial(self.stadiumTab)
-        self.stadiumPreDelayDial.setObjectName(u"stadiumPreDelayDial")
-        self.stadiumPreDelayDial.setGeometry(QRect(100, 0, 50, 64))
-        self.stadiumPreDelayDial.setAutoFillBackground(False)
-        self.stadiumPreDelayDial.setMaximum(100)
-        self.stadiumPreDelayDial.setWrapping(False)
-        self.stadiumPreDelayDial.setNotchesVisible(True)
-        self.stadiumLevelDisplay = QLCDNumber(self.stadiumTab)
-        self.stadiumLevelDisplay.setObjectName(u"stadiumLevelDisplay")
-        self.stadiumLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
-        self.stadiumLevelDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.stadiumLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.stadiumToneDisplay = QLCDNumber(self.stadiumTab)
-        self.stadiumToneDisplay.setObjectName(u"stadiumToneDisplay")
-        self.stadiumToneDisplay.setGeometry(QRect(170, 80, 51, 23))
-        self.stadiumToneDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.stadiumToneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.stadiumToneDial = QDial(self.stadiumTab)
-        self.stadiumToneDial.setObjectName(u"stadiumToneDial")
-        self.stadiumToneDial.setGeometry(QRect(170, 0, 50, 64))
-        self.stadiumToneDial.setAutoFillBackground(False)
-        self.stadiumToneDial.setMaximum(100)
-        self.stadiumToneDial.setWrapping(False)
-        self.stadiumToneDial.setNotchesVisible(True)
-        self.stadiumDecayDial = QDial(self.stadiumTab)
-        self.stadiumDecayDial.setObjectName(u"stadiumDecayDial")
-        self.stadiumDecayDial.setGeometry(QRect(30, 0, 50, 64))
-        self.stadiumDecayDial.setAutoFillBackground(False)
-        self.stadiumDecayDial.setMaximum(100)
-        self.stadiumDecayDial.setWrapping(False)
-        self.stadiumDecayDial.setNotchesVisible(True)
-        self.stadiumPreDelayDisplay = QLCDNumber(self.stadiumTab)
-        self.stadiumPreDelayDisplay.setObjectName(u"stadiumPreDelayDisplay")
-        self.stadiumPreDelayDisplay.setGeometry(QRect(100, 80, 51, 23))
-        self.stadiumPreDelayDisplay.setFrameShadow(QFrame.Shadow.Raised)
-        self.stadiumPreDelayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
-        self.stadiumDecayLabel = QLabel(self.stadiumTab)
-        self.stadiumDecayLabel.setObjectName(u"stadiumDecayLabel")
-        self.stadiumDecayLabel.setGeometry(QRect(30, 60, 49, 16))
-        self.stadiumDecayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.stadiumHelpLabel = QLabel(self.stadiumTab)
-        self.stadiumHelpLabel.setObjectName(u"stadiumHelpLabel")
-        self.stadiumHelpLabel.setGeometry(QRect(300, 10, 21, 21))
         self.reverbTab.addTab(self.stadiumTab, "")
         self.presetGroupBox = QGroupBox(self.centralwidget)
         self.presetGroupBox.setObjectName(u"presetGroupBox")
@@ -1397,9 +456,12 @@ class Ui_MainWindow(object):
         self.presetNameLabel.setAutoFillBackground(False)
         self.presetNameLabel.setFrameShape(QFrame.Shape.StyledPanel)
         self.presetNameLabel.setFrameShadow(QFrame.Shadow.Plain)
-        self.presetList = QListWidget(self.presetGroupBox)
+        self.presetList = QListView(self.presetGroupBox)
         self.presetList.setObjectName(u"presetList")
         self.presetList.setGeometry(QRect(10, 90, 171, 191))
+        self.presetList.setContextMenuPolicy(Qt.ContextMenuPolicy.ActionsContextMenu)
+        self.presetList.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.presetList.setUniformItemSizes(True)
         self.presetSearchBox = QLineEdit(self.presetGroupBox)
         self.presetSearchBox.setObjectName(u"presetSearchBox")
         self.presetSearchBox.setGeometry(QRect(10, 60, 171, 22))
@@ -1413,18 +475,50 @@ class Ui_MainWindow(object):
         self.menuFile.setObjectName(u"menuFile")
         self.menuLocal_Presets = QMenu(self.menubar)
         self.menuLocal_Presets.setObjectName(u"menuLocal_Presets")
+        self.menuSetlist = QMenu(self.menubar)
+        self.menuSetlist.setObjectName(u"menuSetlist")
+        self.menuAutomation = QMenu(self.menubar)
+        self.menuAutomation.setObjectName(u"menuAutomation")
+        self.menuTempo = QMenu(self.menubar)
+        self.menuTempo.setObjectName(u"menuTempo")
+        self.menuEdit = QMenu(self.menubar)
+        self.menuEdit.setObjectName(u"menuEdit")
         MainWindow.setMenuBar(self.menubar)
         self.statusbar = QStatusBar(MainWindow)
         self.statusbar.setObjectName(u"statusbar")
         MainWindow.setStatusBar(self.statusbar)
 
         self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuEdit.menuAction())
         self.menubar.addAction(self.menuLocal_Presets.menuAction())
+        self.menubar.addAction(self.menuSetlist.menuAction())
+        self.menubar.addAction(self.menuAutomation.menuAction())
+        self.menubar.addAction(self.menuTempo.menuAction())
         self.menuFile.addAction(self.actionRefresh_Amp_Settings)
         self.menuFile.addAction(self.actionTuner)
+        self.menuFile.addAction(self.actionConnect_Foot_Controller)
         self.menuFile.addAction(self.actionAbout)
         self.menuLocal_Presets.addAction(self.actionSave_to_File)
         self.menuLocal_Presets.addAction(self.actionLoad_from_File)
+        self.menuLocal_Presets.addSeparator()
+        self.menuLocal_Presets.addAction(self.actionExport_Bank)
+        self.menuLocal_Presets.addAction(self.actionImport_Bank)
+        self.menuSetlist.addAction(self.actionNext_Setlist_Preset)
+        self.menuSetlist.addAction(self.actionPrevious_Setlist_Preset)
+        self.menuSetlist.addSeparator()
+        self.menuSetlist.addAction(self.actionAdd_to_Setlist)
+        self.menuSetlist.addAction(self.actionLoad_Setlist)
+        self.menuSetlist.addAction(self.actionClear_Setlist)
+        self.menuAutomation.addAction(self.actionRecord_Automation)
+        self.menuAutomation.addAction(self.actionPlay_Automation)
+        self.menuAutomation.addAction(self.actionStop_Automation)
+        self.menuAutomation.addSeparator()
+        self.menuAutomation.addAction(self.actionSave_Automation)
+        self.menuAutomation.addAction(self.actionLoad_Automation)
+        self.menuTempo.addAction(self.actionTap_Tempo)
+        self.menuTempo.addAction(self.actionFollow_MIDI_Clock)
+        self.menuEdit.addAction(self.actionUndo)
+        self.menuEdit.addAction(self.actionRedo)
 
         self.retranslateUi(MainWindow)
 
@@ -1443,7 +537,41 @@ class Ui_MainWindow(object):
         self.actionTuner.setText(QCoreApplication.translate("MainWindow", u"Tuner", None))
         self.actionSave_to_File.setText(QCoreApplication.translate("MainWindow", u"Save to File", None))
         self.actionLoad_from_File.setText(QCoreApplication.translate("MainWindow", u"Load from File", None))
+        self.actionExport_Bank.setText(QCoreApplication.translate("MainWindow", u"Export Bank", None))
+        self.actionImport_Bank.setText(QCoreApplication.translate("MainWindow", u"Import Bank", None))
+        self.actionFind_Similar_Presets.setText(QCoreApplication.translate("MainWindow", u"Find Similar Presets", None))
+        self.actionMorph_to_Preset.setText(QCoreApplication.translate("MainWindow", u"Morph to Preset", None))
+        self.actionNext_Setlist_Preset.setText(QCoreApplication.translate("MainWindow", u"Next Preset", None))
+#if QT_CONFIG(shortcut)
+        self.actionNext_Setlist_Preset.setShortcut(QCoreApplication.translate("MainWindow", u"PgDown", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionPrevious_Setlist_Preset.setText(QCoreApplication.translate("MainWindow", u"Previous Preset", None))
+#if QT_CONFIG(shortcut)
+        self.actionPrevious_Setlist_Preset.setShortcut(QCoreApplication.translate("MainWindow", u"PgUp", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionAdd_to_Setlist.setText(QCoreApplication.translate("MainWindow", u"Add to Setlist", None))
+        self.actionLoad_Setlist.setText(QCoreApplication.translate("MainWindow", u"Load Setlist", None))
+        self.actionClear_Setlist.setText(QCoreApplication.translate("MainWindow", u"Clear Setlist", None))
+        self.actionConnect_Foot_Controller.setText(QCoreApplication.translate("MainWindow", u"Connect Foot Controller", None))
         self.actionRefresh_Amp_Settings.setText(QCoreApplication.translate("MainWindow", u"Refresh Amp Settings", None))
+        self.actionRecord_Automation.setText(QCoreApplication.translate("MainWindow", u"Record", None))
+        self.actionPlay_Automation.setText(QCoreApplication.translate("MainWindow", u"Play", None))
+        self.actionStop_Automation.setText(QCoreApplication.translate("MainWindow", u"Stop", None))
+        self.actionSave_Automation.setText(QCoreApplication.translate("MainWindow", u"Save Automation", None))
+        self.actionLoad_Automation.setText(QCoreApplication.translate("MainWindow", u"Load Automation", None))
+        self.actionTap_Tempo.setText(QCoreApplication.translate("MainWindow", u"Tap Tempo", None))
+#if QT_CONFIG(shortcut)
+        self.actionTap_Tempo.setShortcut(QCoreApplication.translate("MainWindow", u"T", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionFollow_MIDI_Clock.setText(QCoreApplication.translate("MainWindow", u"Follow MIDI Clock", None))
+        self.actionUndo.setText(QCoreApplication.translate("MainWindow", u"Undo", None))
+#if QT_CONFIG(shortcut)
+        self.actionUndo.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+Z", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionRedo.setText(QCoreApplication.translate("MainWindow", u"Redo", None))
+#if QT_CONFIG(shortcut)
+        self.actionRedo.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+Shift+Z", None))
+#endif // QT_CONFIG(shortcut)
         self.logoLabel.setText(QCoreApplication.translate("MainWindow", u"Marshall CODE Interface", None))
         self.authorLabel.setText(QCoreApplication.translate("MainWindow", u"AnonymousHacker1279", None))
         self.connectionStatusLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p><span style=\" color:#aa0000;\">Status: DISCONNECTED</span></p></body></html>", None))
@@ -1649,59 +777,9 @@ class Ui_MainWindow(object):
 #if QT_CONFIG(tooltip)
         self.preFXTab.setToolTip("")
 #endif // QT_CONFIG(tooltip)
-        self.compressorToneLabel.setText(QCoreApplication.translate("MainWindow", u"TONE", None))
-        self.compressorRatioLevel.setText(QCoreApplication.translate("MainWindow", u"RATIO", None))
-        self.compressorCompressionLabel.setText(QCoreApplication.translate("MainWindow", u"COMP", None))
-        self.compressorLevelLabel.setText(QCoreApplication.translate("MainWindow", u"LEVEL", None))
-#if QT_CONFIG(tooltip)
-        self.compressorHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Compress the peaks of your signal</span></p><p align=\"center\"><img src=\":/PreFX_Compressor/resources/pre-fx/compressor.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.compressorHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.preFXTab.setTabText(self.preFXTab.indexOf(self.compressorTab), QCoreApplication.translate("MainWindow", u"Compressor", None))
-        self.distortionDriveLabel.setText(QCoreApplication.translate("MainWindow", u"DRIVE", None))
-        self.distortionToneLabel.setText(QCoreApplication.translate("MainWindow", u"TONE", None))
-        self.distortionLabel.setText(QCoreApplication.translate("MainWindow", u"LEVEL", None))
-
-        __sortingEnabled3 = self.distortionModeList.isSortingEnabled()
-        self.distortionModeList.setSortingEnabled(False)
-        ___qlistwidgetitem27 = self.distortionModeList.item(0)
-        ___qlistwidgetitem27.setText(QCoreApplication.translate("MainWindow", u"GUV", None));
-        ___qlistwidgetitem28 = self.distortionModeList.item(1)
-        ___qlistwidgetitem28.setText(QCoreApplication.translate("MainWindow", u"ODR", None));
-        ___qlistwidgetitem29 = self.distortionModeList.item(2)
-        ___qlistwidgetitem29.setText(QCoreApplication.translate("MainWindow", u"DIST", None));
-        self.distortionModeList.setSortingEnabled(__sortingEnabled3)
-
-#if QT_CONFIG(tooltip)
-        self.distortionHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Guv'nor / Overdrive / Distortion</span></p><p align=\"center\"><img src=\":/PreFX_Distortion/resources/pre-fx/distortion.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.distortionHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.preFXTab.setTabText(self.preFXTab.indexOf(self.distortionTab), QCoreApplication.translate("MainWindow", u"Distortion", None))
-        self.autoWahFreqLabel.setText(QCoreApplication.translate("MainWindow", u"FREQ", None))
-        self.autoWahResLabel.setText(QCoreApplication.translate("MainWindow", u"RES", None))
-        self.autoWahSensitivityLabel.setText(QCoreApplication.translate("MainWindow", u"SENSITIVITY", None))
-
-        __sortingEnabled4 = self.autoWahModeList.isSortingEnabled()
-        self.autoWahModeList.setSortingEnabled(False)
-        ___qlistwidgetitem30 = self.autoWahModeList.item(0)
-        ___qlistwidgetitem30.setText(QCoreApplication.translate("MainWindow", u"ENV", None));
-        ___qlistwidgetitem31 = self.autoWahModeList.item(1)
-        ___qlistwidgetitem31.setText(QCoreApplication.translate("MainWindow", u"LFO", None));
-        self.autoWahModeList.setSortingEnabled(__sortingEnabled4)
-
-#if QT_CONFIG(tooltip)
-        self.autoWahHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">ENV (attack) / LFO (auto) modes</span></p><p align=\"center\"><img src=\":/PreFX_Auto_Wah/resources/pre-fx/auto_wah.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.autoWahHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.preFXTab.setTabText(self.preFXTab.indexOf(self.autoWahTab), QCoreApplication.translate("MainWindow", u"Auto Wah", None))
-        self.pitchShifterRegenLabel.setText(QCoreApplication.translate("MainWindow", u"REGEN", None))
-        self.pitchShifterMixLabel.setText(QCoreApplication.translate("MainWindow", u"MIX", None))
-        self.pitchShifterSemitoneLabel.setText(QCoreApplication.translate("MainWindow", u"SEMITONE", None))
-        self.pitchShifterFineLabel.setText(QCoreApplication.translate("MainWindow", u"FINE", None))
-#if QT_CONFIG(tooltip)
-        self.pitchShifterHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Chromatic harmonies up to +/- 1 octave</span></p><p align=\"center\"><img src=\":/PreFX_Pitch_Shifter/resources/pre-fx/pitch_shifter.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.pitchShifterHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.preFXTab.setTabText(self.preFXTab.indexOf(self.pitchShifterTab), QCoreApplication.translate("MainWindow", u"Pitch Shifter", None))
         self.modulationGroupBox.setTitle(QCoreApplication.translate("MainWindow", u"MODULATION", None))
 #if QT_CONFIG(tooltip)
@@ -1711,73 +789,9 @@ class Ui_MainWindow(object):
         self.modulationToggleButton.setWhatsThis("")
 #endif // QT_CONFIG(whatsthis)
         self.modulationToggleButton.setText(QCoreApplication.translate("MainWindow", u"TOGGLE", None))
-        self.chorusDepthLabel.setText(QCoreApplication.translate("MainWindow", u"DEPTH", None))
-        self.chorusSpeedLabel.setText(QCoreApplication.translate("MainWindow", u"SPEED", None))
-
-        __sortingEnabled5 = self.chorusModeList.isSortingEnabled()
-        self.chorusModeList.setSortingEnabled(False)
-        ___qlistwidgetitem32 = self.chorusModeList.item(0)
-        ___qlistwidgetitem32.setText(QCoreApplication.translate("MainWindow", u"CLS", None));
-        ___qlistwidgetitem33 = self.chorusModeList.item(1)
-        ___qlistwidgetitem33.setText(QCoreApplication.translate("MainWindow", u"VIB", None));
-        self.chorusModeList.setSortingEnabled(__sortingEnabled5)
-
-        self.chorusToneLabel.setText(QCoreApplication.translate("MainWindow", u"TONE", None))
-#if QT_CONFIG(tooltip)
-        self.chorusHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Chorus / Vibrato</span></p><p align=\"center\"><img src=\":/Modulation_Chorus/resources/modulation/chorus.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.chorusHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.modulationTab.setTabText(self.modulationTab.indexOf(self.chorusTab), QCoreApplication.translate("MainWindow", u"Chorus", None))
-        self.flangerRegenLabel.setText(QCoreApplication.translate("MainWindow", u"REGEN", None))
-        self.flangerSpeedLabel.setText(QCoreApplication.translate("MainWindow", u"SPEED", None))
-        self.flangerDepthLabel.setText(QCoreApplication.translate("MainWindow", u"DEPTH", None))
-
-        __sortingEnabled6 = self.flangerModeList.isSortingEnabled()
-        self.flangerModeList.setSortingEnabled(False)
-        ___qlistwidgetitem34 = self.flangerModeList.item(0)
-        ___qlistwidgetitem34.setText(QCoreApplication.translate("MainWindow", u"JET", None));
-        ___qlistwidgetitem35 = self.flangerModeList.item(1)
-        ___qlistwidgetitem35.setText(QCoreApplication.translate("MainWindow", u"MET", None));
-        self.flangerModeList.setSortingEnabled(__sortingEnabled6)
-
-#if QT_CONFIG(tooltip)
-        self.flangerHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Jet / Metal</span></p><p align=\"center\"><img src=\":/Modulation_Flanger/resources/modulation/flanger.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.flangerHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.modulationTab.setTabText(self.modulationTab.indexOf(self.flangerTab), QCoreApplication.translate("MainWindow", u"Flanger", None))
-        self.phaserDepthLabel.setText(QCoreApplication.translate("MainWindow", u"DEPTH", None))
-
-        __sortingEnabled7 = self.phaserModeList.isSortingEnabled()
-        self.phaserModeList.setSortingEnabled(False)
-        ___qlistwidgetitem36 = self.phaserModeList.item(0)
-        ___qlistwidgetitem36.setText(QCoreApplication.translate("MainWindow", u"CLS", None));
-        ___qlistwidgetitem37 = self.phaserModeList.item(1)
-        ___qlistwidgetitem37.setText(QCoreApplication.translate("MainWindow", u"VBE", None));
-        self.phaserModeList.setSortingEnabled(__sortingEnabled7)
-
-        self.phaserRegenLabel.setText(QCoreApplication.translate("MainWindow", u"REGEN", None))
-        self.phaserSpeedLabel.setText(QCoreApplication.translate("MainWindow", u"SPEED", None))
-#if QT_CONFIG(tooltip)
-        self.phaserHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Phaser / Vibe</span></p><p align=\"center\"><img src=\":/Modulation_Phaser/resources/modulation/phaser.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.phaserHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.modulationTab.setTabText(self.modulationTab.indexOf(self.phaserTab), QCoreApplication.translate("MainWindow", u"Phaser", None))
-        self.tremoloSkewLabel.setText(QCoreApplication.translate("MainWindow", u"SKEW", None))
-        self.tremoloSpeedLabel.setText(QCoreApplication.translate("MainWindow", u"SPEED", None))
-        self.tremoloDepthLabel.setText(QCoreApplication.translate("MainWindow", u"DEPTH", None))
-
-        __sortingEnabled8 = self.tremoloModeList.isSortingEnabled()
-        self.tremoloModeList.setSortingEnabled(False)
-        ___qlistwidgetitem38 = self.tremoloModeList.item(0)
-        ___qlistwidgetitem38.setText(QCoreApplication.translate("MainWindow", u"VLV", None));
-        ___qlistwidgetitem39 = self.tremoloModeList.item(1)
-        ___qlistwidgetitem39.setText(QCoreApplication.translate("MainWindow", u"SQR", None));
-        self.tremoloModeList.setSortingEnabled(__sortingEnabled8)
-
-#if QT_CONFIG(tooltip)
-        self.tremoloHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Valve / Square Wave</span></p><p align=\"center\"><img src=\":/Modulation_Tremolo/resources/modulation/tremolo.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.tremoloHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.modulationTab.setTabText(self.modulationTab.indexOf(self.tremoloTab), QCoreApplication.translate("MainWindow", u"Tremolo", None))
         self.delayGroupBox.setTitle(QCoreApplication.translate("MainWindow", u"DELAY", None))
 #if QT_CONFIG(tooltip)
@@ -1787,54 +801,9 @@ class Ui_MainWindow(object):
         self.delayToggleButton.setWhatsThis("")
 #endif // QT_CONFIG(whatsthis)
         self.delayToggleButton.setText(QCoreApplication.translate("MainWindow", u"TOGGLE", None))
-        self.studioTimeLabel.setText(QCoreApplication.translate("MainWindow", u"TIME", None))
-        self.studioFeedbackLabel.setText(QCoreApplication.translate("MainWindow", u"FEEDBACK", None))
-        self.studioFreqLabel.setText(QCoreApplication.translate("MainWindow", u"FREQ", None))
-        self.studioLevelLabel.setText(QCoreApplication.translate("MainWindow", u"LEVEL", None))
-#if QT_CONFIG(tooltip)
-        self.studioHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">High fidelity delay</span></p><p align=\"center\"><img src=\":/Delay_Studio/resources/delay/studio.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.studioHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.delayTab.setTabText(self.delayTab.indexOf(self.studioTab), QCoreApplication.translate("MainWindow", u"Studio", None))
-        self.vintageLevelLabel.setText(QCoreApplication.translate("MainWindow", u"LEVEL", None))
-        self.vintageAgeLabel.setText(QCoreApplication.translate("MainWindow", u"AGE", None))
-        self.vintageTimeLabel.setText(QCoreApplication.translate("MainWindow", u"TIME", None))
-        self.vintageFreqLabel.setText(QCoreApplication.translate("MainWindow", u"FREQ", None))
-#if QT_CONFIG(tooltip)
-        self.vintageHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Analog style delay</span></p><p align=\"center\"><img src=\":/Delay_Vintage/resources/delay/vintage.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.vintageHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.delayTab.setTabText(self.delayTab.indexOf(self.vintageTab), QCoreApplication.translate("MainWindow", u"Vintage", None))
-        self.multiLevelLabel.setText(QCoreApplication.translate("MainWindow", u"LEVEL", None))
-        self.multiTimeLabel.setText(QCoreApplication.translate("MainWindow", u"TIME", None))
-        self.multiFeedbackLabel.setText(QCoreApplication.translate("MainWindow", u"FEEDBACK", None))
-
-        __sortingEnabled9 = self.multiTapPatternList.isSortingEnabled()
-        self.multiTapPatternList.setSortingEnabled(False)
-        ___qlistwidgetitem40 = self.multiTapPatternList.item(0)
-        ___qlistwidgetitem40.setText(QCoreApplication.translate("MainWindow", u"1", None));
-        ___qlistwidgetitem41 = self.multiTapPatternList.item(1)
-        ___qlistwidgetitem41.setText(QCoreApplication.translate("MainWindow", u"2", None));
-        ___qlistwidgetitem42 = self.multiTapPatternList.item(2)
-        ___qlistwidgetitem42.setText(QCoreApplication.translate("MainWindow", u"3", None));
-        ___qlistwidgetitem43 = self.multiTapPatternList.item(3)
-        ___qlistwidgetitem43.setText(QCoreApplication.translate("MainWindow", u"4", None));
-        self.multiTapPatternList.setSortingEnabled(__sortingEnabled9)
-
-        self.multiTapPatternLabel.setText(QCoreApplication.translate("MainWindow", u"TAP PATTERN", None))
-#if QT_CONFIG(tooltip)
-        self.multiHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Adds a pattern of multiple repeats</span></p><p align=\"center\"><img src=\":/Delay_Multi/resources/delay/multi.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.multiHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.delayTab.setTabText(self.delayTab.indexOf(self.multiTab), QCoreApplication.translate("MainWindow", u"Multi", None))
-        self.reverseFreqLabel.setText(QCoreApplication.translate("MainWindow", u"FREQ", None))
-        self.reverseLevelLabel.setText(QCoreApplication.translate("MainWindow", u"LEVEL", None))
-        self.reverseTimeLabel.setText(QCoreApplication.translate("MainWindow", u"TIME", None))
-        self.reverseFeedbackLabel.setText(QCoreApplication.translate("MainWindow", u"FEEDBACK", None))
-#if QT_CONFIG(tooltip)
-        self.reverseHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">The delay sound is run in reverse</span></p><p align=\"center\"><img src=\":/Delay_Reverse/resources/delay/reverse.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.reverseHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.delayTab.setTabText(self.delayTab.indexOf(self.reverseTab), QCoreApplication.translate("MainWindow", u"Reverse", None))
         self.reverbGroupBox.setTitle(QCoreApplication.translate("MainWindow", u"REVERB", None))
 #if QT_CONFIG(tooltip)
@@ -1844,46 +813,18 @@ class Ui_MainWindow(object):
         self.reverbToggleButton.setWhatsThis("")
 #endif // QT_CONFIG(whatsthis)
         self.reverbToggleButton.setText(QCoreApplication.translate("MainWindow", u"TOGGLE", None))
-        self.roomDecayLabel.setText(QCoreApplication.translate("MainWindow", u"DECAY", None))
-        self.roomPreDelayLabel.setText(QCoreApplication.translate("MainWindow", u"PRE-DELAY", None))
-        self.roomToneLabel.setText(QCoreApplication.translate("MainWindow", u"TONE", None))
-        self.roomLevelLabel.setText(QCoreApplication.translate("MainWindow", u"LEVEL", None))
-#if QT_CONFIG(tooltip)
-        self.roomHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Acoustic reflections of small to larger rooms</span></p><p align=\"center\"><img src=\":/Reverb_Room/resources/reverb/room.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.roomHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.reverbTab.setTabText(self.reverbTab.indexOf(self.roomTab), QCoreApplication.translate("MainWindow", u"Room", None))
-        self.hallLevelLabel.setText(QCoreApplication.translate("MainWindow", u"LEVEL", None))
-        self.hallPreDelayLabel.setText(QCoreApplication.translate("MainWindow", u"PRE-DELAY", None))
-        self.hallDecayLabel.setText(QCoreApplication.translate("MainWindow", u"DECAY", None))
-        self.hallToneLabel.setText(QCoreApplication.translate("MainWindow", u"TONE", None))
-#if QT_CONFIG(tooltip)
-        self.hallHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Acoustic reflections of a hall-sized space</span></p><p align=\"center\"><img src=\":/Reverb_Hall/resources/reverb/hall.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.hallHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.reverbTab.setTabText(self.reverbTab.indexOf(self.hallTab), QCoreApplication.translate("MainWindow", u"Hall", None))
-        self.springLevelLabel.setText(QCoreApplication.translate("MainWindow", u"LEVEL", None))
-        self.springDecayLabel.setText(QCoreApplication.translate("MainWindow", u"DECAY", None))
-        self.springPreDelayLabel.setText(QCoreApplication.translate("MainWindow", u"PRE-DELAY", None))
-        self.springToneLabel.setText(QCoreApplication.translate("MainWindow", u"TONE", None))
-#if QT_CONFIG(tooltip)
-        self.springHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Vintage analog style reverb</span></p><p align=\"center\"><img src=\":/Reverb_Spring/resources/reverb/spring.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.springHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.reverbTab.setTabText(self.reverbTab.indexOf(self.springTab), QCoreApplication.translate("MainWindow", u"Spring", None))
-        self.stadiumToneLabel.setText(QCoreApplication.translate("MainWindow", u"TONE", None))
-        self.stadiumLevelLabel.setText(QCoreApplication.translate("MainWindow", u"LEVEL", None))
-        self.stadiumPreDelayLabel.setText(QCoreApplication.translate("MainWindow", u"PRE-DELAY", None))
-        self.stadiumDecayLabel.setText(QCoreApplication.translate("MainWindow", u"DECAY", None))
-#if QT_CONFIG(tooltip)
-        self.stadiumHelpLabel.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Acoustic reflections of a very large spcae</span></p><p align=\"center\"><img src=\":/Reverb_Stadium/resources/reverb/stadium.png\"/></p></body></html>", None))
-#endif // QT_CONFIG(tooltip)
-        self.stadiumHelpLabel.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
         self.reverbTab.setTabText(self.reverbTab.indexOf(self.stadiumTab), QCoreApplication.translate("MainWindow", u"Stadium", None))
         self.presetGroupBox.setTitle(QCoreApplication.translate("MainWindow", u"PRESET", None))
         self.presetNameLabel.setText(QCoreApplication.translate("MainWindow", u"PRESET NAME", None))
         self.presetSearchBox.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Search Presets", None))
         self.menuFile.setTitle(QCoreApplication.translate("MainWindow", u"File", None))
         self.menuLocal_Presets.setTitle(QCoreApplication.translate("MainWindow", u"Local Presets", None))
+        self.menuSetlist.setTitle(QCoreApplication.translate("MainWindow", u"Setlist", None))
+        self.menuAutomation.setTitle(QCoreApplication.translate("MainWindow", u"Automation", None))
+        self.menuTempo.setTitle(QCoreApplication.translate("MainWindow", u"Tempo", None))
+        self.menuEdit.setTitle(QCoreApplication.translate("MainWindow", u"Edit", None))
     # retranslateUi
 
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'multi_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QLCDNumber, QLabel,
+    QListWidget, QListWidgetItem, QSizePolicy, QWidget)
+
+class Ui_MultiTab(object):
+    def setupUi(self, multiTab):
+        if not multiTab.objectName():
+            multiTab.setObjectName(u"multiTab")
+        multiTab.resize(327, 113)
+        self.multiLevelLabel = QLabel(multiTab)
+        self.multiLevelLabel.setObjectName(u"multiLevelLabel")
+        self.multiLevelLabel.setGeometry(QRect(240, 60, 49, 16))
+        self.multiLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.multiLevelDisplay = QLCDNumber(multiTab)
+        self.multiLevelDisplay.setObjectName(u"multiLevelDisplay")
+        self.multiLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
+        self.multiLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.multiFeedbackDisplay = QLCDNumber(multiTab)
+        self.multiFeedbackDisplay.setObjectName(u"multiFeedbackDisplay")
+        self.multiFeedbackDisplay.setGeometry(QRect(100, 80, 51, 23))
+        self.multiFeedbackDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.multiFeedbackDial = QDial(multiTab)
+        self.multiFeedbackDial.setObjectName(u"multiFeedbackDial")
+        self.multiFeedbackDial.setGeometry(QRect(100, 0, 50, 64))
+        self.multiFeedbackDial.setAutoFillBackground(False)
+        self.multiFeedbackDial.setMaximum(100)
+        self.multiFeedbackDial.setWrapping(False)
+        self.multiFeedbackDial.setNotchesVisible(True)
+        self.multiTimeDisplay = QLCDNumber(multiTab)
+        self.multiTimeDisplay.setObjectName(u"multiTimeDisplay")
+        self.multiTimeDisplay.setGeometry(QRect(30, 80, 51, 23))
+        self.multiTimeDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.multiLevelDial = QDial(multiTab)
+        self.multiLevelDial.setObjectName(u"multiLevelDial")
+        self.multiLevelDial.setGeometry(QRect(240, 0, 50, 64))
+        self.multiLevelDial.setAutoFillBackground(False)
+        self.multiLevelDial.setMaximum(100)
+        self.multiLevelDial.setWrapping(False)
+        self.multiLevelDial.setNotchesVisible(True)
+        self.multiTimeDial = QDial(multiTab)
+        self.multiTimeDial.setObjectName(u"multiTimeDial")
+        self.multiTimeDial.setGeometry(QRect(30, 0, 50, 64))
+        self.multiTimeDial.setAutoFillBackground(False)
+        self.multiTimeDial.setMaximum(4000)
+        self.multiTimeDial.setWrapping(False)
+        self.multiTimeDial.setNotchesVisible(True)
+        self.multiTimeLabel = QLabel(multiTab)
+        self.multiTimeLabel.setObjectName(u"multiTimeLabel")
+        self.multiTimeLabel.setGeometry(QRect(30, 60, 49, 16))
+        self.multiTimeLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.multiFeedbackLabel = QLabel(multiTab)
+        self.multiFeedbackLabel.setObjectName(u"multiFeedbackLabel")
+        self.multiFeedbackLabel.setGeometry(QRect(88, 60, 71, 20))
+        self.multiFeedbackLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.multiTapPatternList = QListWidget(multiTab)
+        font = QFont()
+        font.setPointSize(7)
+        __qlistwidgetitem = QListWidgetItem(self.multiTapPatternList)
+        __qlistwidgetitem.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem.setFont(font);
+        __qlistwidgetitem1 = QListWidgetItem(self.multiTapPatternList)
+        __qlistwidgetitem1.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem1.setFont(font);
+        __qlistwidgetitem2 = QListWidgetItem(self.multiTapPatternList)
+        __qlistwidgetitem2.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem2.setFont(font);
+        __qlistwidgetitem3 = QListWidgetItem(self.multiTapPatternList)
+        __qlistwidgetitem3.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem3.setFont(font);
+        self.multiTapPatternList.setObjectName(u"multiTapPatternList")
+        self.multiTapPatternList.setGeometry(QRect(170, 10, 51, 61))
+        self.multiTapPatternLabel = QLabel(multiTab)
+        self.multiTapPatternLabel.setObjectName(u"multiTapPatternLabel")
+        self.multiTapPatternLabel.setGeometry(QRect(160, 80, 71, 20))
+        self.multiTapPatternLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.multiHelpLabel = QLabel(multiTab)
+        self.multiHelpLabel.setObjectName(u"multiHelpLabel")
+        self.multiHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(multiTab)
+
+        QMetaObject.connectSlotsByName(multiTab)
+    # setupUi
+
+    def retranslateUi(self, multiTab):
+        self.multiLevelLabel.setText(QCoreApplication.translate("MultiTab", u"LEVEL", None))
+        self.multiTimeLabel.setText(QCoreApplication.translate("MultiTab", u"TIME", None))
+        self.multiFeedbackLabel.setText(QCoreApplication.translate("MultiTab", u"FEEDBACK", None))
+
+        __sortingEnabled = self.multiTapPatternList.isSortingEnabled()
+        self.multiTapPatternList.setSortingEnabled(False)
+        ___qlistwidgetitem = self.multiTapPatternList.item(0)
+        ___qlistwidgetitem.setText(QCoreApplication.translate("MultiTab", u"1", None));
+        ___qlistwidgetitem1 = self.multiTapPatternList.item(1)
+        ___qlistwidgetitem1.setText(QCoreApplication.translate("MultiTab", u"2", None));
+        ___qlistwidgetitem2 = self.multiTapPatternList.item(2)
+        ___qlistwidgetitem2.setText(QCoreApplication.translate("MultiTab", u"3", None));
+        ___qlistwidgetitem3 = self.multiTapPatternList.item(3)
+        ___qlistwidgetitem3.setText(QCoreApplication.translate("MultiTab", u"4", None));
+        self.multiTapPatternList.setSortingEnabled(__sortingEnabled)
+
+        self.multiTapPatternLabel.setText(QCoreApplication.translate("MultiTab", u"TAP PATTERN", None))
+#if QT_CONFIG(tooltip)
+        self.multiHelpLabel.setToolTip(QCoreApplication.translate("MultiTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Adds a pattern of multiple repeats</span></p><p align=\"center\"><img src=\":/Delay_Multi/resources/delay/multi.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.multiHelpLabel.setText(QCoreApplication.translate("MultiTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'phaser_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QLCDNumber, QLabel,
+    QListWidget, QListWidgetItem, QSizePolicy, QWidget)
+
+class Ui_PhaserTab(object):
+    def setupUi(self, phaserTab):
+        if not phaserTab.objectName():
+            phaserTab.setObjectName(u"phaserTab")
+        phaserTab.resize(327, 113)
+        self.phaserDepthDial = QDial(phaserTab)
+        self.phaserDepthDial.setObjectName(u"phaserDepthDial")
+        self.phaserDepthDial.setGeometry(QRect(180, 0, 50, 64))
+        self.phaserDepthDial.setAutoFillBackground(False)
+        self.phaserDepthDial.setMaximum(100)
+        self.phaserDepthDial.setWrapping(False)
+        self.phaserDepthDial.setNotchesVisible(True)
+        self.phaserSpeedDial = QDial(phaserTab)
+        self.phaserSpeedDial.setObjectName(u"phaserSpeedDial")
+        self.phaserSpeedDial.setGeometry(QRect(110, 0, 50, 64))
+        self.phaserSpeedDial.setAutoFillBackground(False)
+        self.phaserSpeedDial.setMaximum(100)
+        self.phaserSpeedDial.setWrapping(False)
+        self.phaserSpeedDial.setNotchesVisible(True)
+        self.phaserDepthLabel = QLabel(phaserTab)
+        self.phaserDepthLabel.setObjectName(u"phaserDepthLabel")
+        self.phaserDepthLabel.setGeometry(QRect(170, 60, 71, 20))
+        self.phaserDepthLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.phaserRegenDial = QDial(phaserTab)
+        self.phaserRegenDial.setObjectName(u"phaserRegenDial")
+        self.phaserRegenDial.setGeometry(QRect(250, 0, 50, 64))
+        self.phaserRegenDial.setAutoFillBackground(False)
+        self.phaserRegenDial.setMaximum(100)
+        self.phaserRegenDial.setWrapping(False)
+        self.phaserRegenDial.setNotchesVisible(True)
+        self.phaserDepthDisplay = QLCDNumber(phaserTab)
+        self.phaserDepthDisplay.setObjectName(u"phaserDepthDisplay")
+        self.phaserDepthDisplay.setGeometry(QRect(180, 80, 51, 23))
+        self.phaserDepthDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.phaserModeList = QListWidget(phaserTab)
+        font = QFont()
+        font.setPointSize(12)
+        __qlistwidgetitem = QListWidgetItem(self.phaserModeList)
+        __qlistwidgetitem.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem.setFont(font);
+        __qlistwidgetitem1 = QListWidgetItem(self.phaserModeList)
+        __qlistwidgetitem1.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem1.setFont(font);
+        self.phaserModeList.setObjectName(u"phaserModeList")
+        self.phaserModeList.setGeometry(QRect(20, 30, 51, 51))
+        self.phaserModeList.setUniformItemSizes(False)
+        self.phaserModeList.setSelectionRectVisible(False)
+        self.phaserRegenLabel = QLabel(phaserTab)
+        self.phaserRegenLabel.setObjectName(u"phaserRegenLabel")
+        self.phaserRegenLabel.setGeometry(QRect(250, 60, 49, 16))
+        self.phaserRegenLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.phaserSpeedLabel = QLabel(phaserTab)
+        self.phaserSpeedLabel.setObjectName(u"phaserSpeedLabel")
+        self.phaserSpeedLabel.setGeometry(QRect(110, 60, 49, 16))
+        self.phaserSpeedLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.phaserSpeedDisplay = QLCDNumber(phaserTab)
+        self.phaserSpeedDisplay.setObjectName(u"phaserSpeedDisplay")
+        self.phaserSpeedDisplay.setGeometry(QRect(110, 80, 51, 23))
+        self.phaserSpeedDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.phaserRegenDisplay = QLCDNumber(phaserTab)
+        self.phaserRegenDisplay.setObjectName(u"phaserRegenDisplay")
+        self.phaserRegenDisplay.setGeometry(QRect(250, 80, 51, 23))
+        self.phaserRegenDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.phaserHelpLabel = QLabel(phaserTab)
+        self.phaserHelpLabel.setObjectName(u"phaserHelpLabel")
+        self.phaserHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(phaserTab)
+
+        QMetaObject.connectSlotsByName(phaserTab)
+    # setupUi
+
+    def retranslateUi(self, phaserTab):
+        self.phaserDepthLabel.setText(QCoreApplication.translate("PhaserTab", u"DEPTH", None))
+
+        __sortingEnabled = self.phaserModeList.isSortingEnabled()
+        self.phaserModeList.setSortingEnabled(False)
+        ___qlistwidgetitem = self.phaserModeList.item(0)
+        ___qlistwidgetitem.setText(QCoreApplication.translate("PhaserTab", u"CLS", None));
+        ___qlistwidgetitem1 = self.phaserModeList.item(1)
+        ___qlistwidgetitem1.setText(QCoreApplication.translate("PhaserTab", u"VBE", None));
+        self.phaserModeList.setSortingEnabled(__sortingEnabled)
+
+        self.phaserRegenLabel.setText(QCoreApplication.translate("PhaserTab", u"REGEN", None))
+        self.phaserSpeedLabel.setText(QCoreApplication.translate("PhaserTab", u"SPEED", None))
+#if QT_CONFIG(tooltip)
+        self.phaserHelpLabel.setToolTip(QCoreApplication.translate("PhaserTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Phaser / Vibe</span></p><p align=\"center\"><img src=\":/Modulation_Phaser/resources/modulation/phaser.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.phaserHelpLabel.setText(QCoreApplication.translate("PhaserTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'pitch_shifter_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QFrame, QLCDNumber,
+    QLabel, QSizePolicy, QWidget)
+
+class Ui_PitchShifterTab(object):
+    def setupUi(self, pitchShifterTab):
+        if not pitchShifterTab.objectName():
+            pitchShifterTab.setObjectName(u"pitchShifterTab")
+        pitchShifterTab.resize(327, 113)
+        self.pitchShifterSemitoneDisplay = QLCDNumber(pitchShifterTab)
+        self.pitchShifterSemitoneDisplay.setObjectName(u"pitchShifterSemitoneDisplay")
+        self.pitchShifterSemitoneDisplay.setGeometry(QRect(30, 80, 51, 23))
+        self.pitchShifterSemitoneDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.pitchShifterSemitoneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.pitchShifterRegenLabel = QLabel(pitchShifterTab)
+        self.pitchShifterRegenLabel.setObjectName(u"pitchShifterRegenLabel")
+        self.pitchShifterRegenLabel.setGeometry(QRect(170, 60, 49, 16))
+        self.pitchShifterRegenLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.pitchShifterMixLabel = QLabel(pitchShifterTab)
+        self.pitchShifterMixLabel.setObjectName(u"pitchShifterMixLabel")
+        self.pitchShifterMixLabel.setGeometry(QRect(240, 60, 49, 16))
+        self.pitchShifterMixLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.pitchShifterMixDial = QDial(pitchShifterTab)
+        self.pitchShifterMixDial.setObjectName(u"pitchShifterMixDial")
+        self.pitchShifterMixDial.setGeometry(QRect(240, 0, 50, 64))
+        self.pitchShifterMixDial.setAutoFillBackground(False)
+        self.pitchShifterMixDial.setMaximum(100)
+        self.pitchShifterMixDial.setWrapping(False)
+        self.pitchShifterMixDial.setNotchesVisible(True)
+        self.pitchShifterSemitoneLabel = QLabel(pitchShifterTab)
+        self.pitchShifterSemitoneLabel.setObjectName(u"pitchShifterSemitoneLabel")
+        self.pitchShifterSemitoneLabel.setGeometry(QRect(18, 60, 71, 20))
+        self.pitchShifterSemitoneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.pitchShifterFineLabel = QLabel(pitchShifterTab)
+        self.pitchShifterFineLabel.setObjectName(u"pitchShifterFineLabel")
+        self.pitchShifterFineLabel.setGeometry(QRect(100, 60, 49, 16))
+        self.pitchShifterFineLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.pitchShifterFineDial = QDial(pitchShifterTab)
+        self.pitchShifterFineDial.setObjectName(u"pitchShifterFineDial")
+        self.pitchShifterFineDial.setGeometry(QRect(100, 0, 50, 64))
+        self.pitchShifterFineDial.setAutoFillBackground(False)
+        self.pitchShifterFineDial.setMaximum(100)
+        self.pitchShifterFineDial.setWrapping(False)
+        self.pitchShifterFineDial.setNotchesVisible(True)
+        self.pitchShifterMixDisplay = QLCDNumber(pitchShifterTab)
+        self.pitchShifterMixDisplay.setObjectName(u"pitchShifterMixDisplay")
+        self.pitchShifterMixDisplay.setGeometry(QRect(240, 80, 51, 23))
+        self.pitchShifterMixDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.pitchShifterMixDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.pitchShifterRegenDisplay = QLCDNumber(pitchShifterTab)
+        self.pitchShifterRegenDisplay.setObjectName(u"pitchShifterRegenDisplay")
+        self.pitchShifterRegenDisplay.setGeometry(QRect(170, 80, 51, 23))
+        self.pitchShifterRegenDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.pitchShifterRegenDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.pitchShifterRegenDial = QDial(pitchShifterTab)
+        self.pitchShifterRegenDial.setObjectName(u"pitchShifterRegenDial")
+        self.pitchShifterRegenDial.setGeometry(QRect(170, 0, 50, 64))
+        self.pitchShifterRegenDial.setAutoFillBackground(False)
+        self.pitchShifterRegenDial.setMaximum(100)
+        self.pitchShifterRegenDial.setWrapping(False)
+        self.pitchShifterRegenDial.setNotchesVisible(True)
+        self.pitchShifterSemitoneDial = QDial(pitchShifterTab)
+        self.pitchShifterSemitoneDial.setObjectName(u"pitchShifterSemitoneDial")
+        self.pitchShifterSemitoneDial.setGeometry(QRect(30, 0, 50, 64))
+        self.pitchShifterSemitoneDial.setAutoFillBackground(False)
+        self.pitchShifterSemitoneDial.setMinimum(-12)
+        self.pitchShifterSemitoneDial.setMaximum(12)
+        self.pitchShifterSemitoneDial.setWrapping(False)
+        self.pitchShifterSemitoneDial.setNotchesVisible(True)
+        self.pitchShifterFineDisplay = QLCDNumber(pitchShifterTab)
+        self.pitchShifterFineDisplay.setObjectName(u"pitchShifterFineDisplay")
+        self.pitchShifterFineDisplay.setGeometry(QRect(100, 80, 51, 23))
+        self.pitchShifterFineDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.pitchShifterFineDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.pitchShifterHelpLabel = QLabel(pitchShifterTab)
+        self.pitchShifterHelpLabel.setObjectName(u"pitchShifterHelpLabel")
+        self.pitchShifterHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(pitchShifterTab)
+
+        QMetaObject.connectSlotsByName(pitchShifterTab)
+    # setupUi
+
+    def retranslateUi(self, pitchShifterTab):
+        self.pitchShifterRegenLabel.setText(QCoreApplication.translate("PitchShifterTab", u"REGEN", None))
+        self.pitchShifterMixLabel.setText(QCoreApplication.translate("PitchShifterTab", u"MIX", None))
+        self.pitchShifterSemitoneLabel.setText(QCoreApplication.translate("PitchShifterTab", u"SEMITONE", None))
+        self.pitchShifterFineLabel.setText(QCoreApplication.translate("PitchShifterTab", u"FINE", None))
+#if QT_CONFIG(tooltip)
+        self.pitchShifterHelpLabel.setToolTip(QCoreApplication.translate("PitchShifterTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Chromatic harmonies up to +/- 1 octave</span></p><p align=\"center\"><img src=\":/PreFX_Pitch_Shifter/resources/pre-fx/pitch_shifter.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.pitchShifterHelpLabel.setText(QCoreApplication.translate("PitchShifterTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'reverse_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QFrame, QLCDNumber,
+    QLabel, QSizePolicy, QWidget)
+
+class Ui_ReverseTab(object):
+    def setupUi(self, reverseTab):
+        if not reverseTab.objectName():
+            reverseTab.setObjectName(u"reverseTab")
+        reverseTab.resize(327, 113)
+        self.reverseTimeDisplay = QLCDNumber(reverseTab)
+        self.reverseTimeDisplay.setObjectName(u"reverseTimeDisplay")
+        self.reverseTimeDisplay.setGeometry(QRect(30, 80, 51, 23))
+        self.reverseTimeDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.reverseTimeDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.reverseFreqLabel = QLabel(reverseTab)
+        self.reverseFreqLabel.setObjectName(u"reverseFreqLabel")
+        self.reverseFreqLabel.setGeometry(QRect(170, 60, 49, 16))
+        self.reverseFreqLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.reverseLevelLabel = QLabel(reverseTab)
+        self.reverseLevelLabel.setObjectName(u"reverseLevelLabel")
+        self.reverseLevelLabel.setGeometry(QRect(240, 60, 49, 16))
+        self.reverseLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.reverseLevelDial = QDial(reverseTab)
+        self.reverseLevelDial.setObjectName(u"reverseLevelDial")
+        self.reverseLevelDial.setGeometry(QRect(240, 0, 50, 64))
+        self.reverseLevelDial.setAutoFillBackground(False)
+        self.reverseLevelDial.setMaximum(100)
+        self.reverseLevelDial.setWrapping(False)
+        self.reverseLevelDial.setNotchesVisible(True)
+        self.reverseTimeLabel = QLabel(reverseTab)
+        self.reverseTimeLabel.setObjectName(u"reverseTimeLabel")
+        self.reverseTimeLabel.setGeometry(QRect(30, 60, 49, 16))
+        self.reverseTimeLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.reverseFeedbackLabel = QLabel(reverseTab)
+        self.reverseFeedbackLabel.setObjectName(u"reverseFeedbackLabel")
+        self.reverseFeedbackLabel.setGeometry(QRect(88, 60, 71, 20))
+        self.reverseFeedbackLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.reverseFeedbackDial = QDial(reverseTab)
+        self.reverseFeedbackDial.setObjectName(u"reverseFeedbackDial")
+        self.reverseFeedbackDial.setGeometry(QRect(100, 0, 50, 64))
+        self.reverseFeedbackDial.setAutoFillBackground(False)
+        self.reverseFeedbackDial.setMaximum(100)
+        self.reverseFeedbackDial.setWrapping(False)
+        self.reverseFeedbackDial.setNotchesVisible(True)
+        self.reverseLevelDisplay = QLCDNumber(reverseTab)
+        self.reverseLevelDisplay.setObjectName(u"reverseLevelDisplay")
+        self.reverseLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
+        self.reverseLevelDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.reverseLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.reverseFreqDisplay = QLCDNumber(reverseTab)
+        self.reverseFreqDisplay.setObjectName(u"reverseFreqDisplay")
+        self.reverseFreqDisplay.setGeometry(QRect(170, 80, 51, 23))
+        self.reverseFreqDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.reverseFreqDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.reverseFreqDial = QDial(reverseTab)
+        self.reverseFreqDial.setObjectName(u"reverseFreqDial")
+        self.reverseFreqDial.setGeometry(QRect(170, 0, 50, 64))
+        self.reverseFreqDial.setAutoFillBackground(False)
+        self.reverseFreqDial.setMaximum(100)
+        self.reverseFreqDial.setWrapping(False)
+        self.reverseFreqDial.setNotchesVisible(True)
+        self.reverseTimeDial = QDial(reverseTab)
+        self.reverseTimeDial.setObjectName(u"reverseTimeDial")
+        self.reverseTimeDial.setGeometry(QRect(30, 0, 50, 64))
+        self.reverseTimeDial.setAutoFillBackground(False)
+        self.reverseTimeDial.setMaximum(4000)
+        self.reverseTimeDial.setWrapping(False)
+        self.reverseTimeDial.setNotchesVisible(True)
+        self.reverseFeedbackDisplay = QLCDNumber(reverseTab)
+        self.reverseFeedbackDisplay.setObjectName(u"reverseFeedbackDisplay")
+        self.reverseFeedbackDisplay.setGeometry(QRect(100, 80, 51, 23))
+        self.reverseFeedbackDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.reverseFeedbackDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.reverseHelpLabel = QLabel(reverseTab)
+        self.reverseHelpLabel.setObjectName(u"reverseHelpLabel")
+        self.reverseHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(reverseTab)
+
+        QMetaObject.connectSlotsByName(reverseTab)
+    # setupUi
+
+    def retranslateUi(self, reverseTab):
+        self.reverseFreqLabel.setText(QCoreApplication.translate("ReverseTab", u"FREQ", None))
+        self.reverseLevelLabel.setText(QCoreApplication.translate("ReverseTab", u"LEVEL", None))
+        self.reverseTimeLabel.setText(QCoreApplication.translate("ReverseTab", u"TIME", None))
+        self.reverseFeedbackLabel.setText(QCoreApplication.translate("ReverseTab", u"FEEDBACK", None))
+#if QT_CONFIG(tooltip)
+        self.reverseHelpLabel.setToolTip(QCoreApplication.translate("ReverseTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">The delay sound is run in reverse</span></p><p align=\"center\"><img src=\":/Delay_Reverse/resources/delay/reverse.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.reverseHelpLabel.setText(QCoreApplication.translate("ReverseTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
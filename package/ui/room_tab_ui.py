@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'room_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QLCDNumber, QLabel,
+    QSizePolicy, QWidget)
+
+class Ui_RoomTab(object):
+    def setupUi(self, roomTab):
+        if not roomTab.objectName():
+            roomTab.setObjectName(u"roomTab")
+        roomTab.resize(327, 113)
+        self.roomDecayDial = QDial(roomTab)
+        self.roomDecayDial.setObjectName(u"roomDecayDial")
+        self.roomDecayDial.setGeometry(QRect(30, 0, 50, 64))
+        self.roomDecayDial.setAutoFillBackground(False)
+        self.roomDecayDial.setMaximum(100)
+        self.roomDecayDial.setWrapping(False)
+        self.roomDecayDial.setNotchesVisible(True)
+        self.roomDecayDisplay = QLCDNumber(roomTab)
+        self.roomDecayDisplay.setObjectName(u"roomDecayDisplay")
+        self.roomDecayDisplay.setGeometry(QRect(30, 80, 51, 23))
+        self.roomDecayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.roomDecayLabel = QLabel(roomTab)
+        self.roomDecayLabel.setObjectName(u"roomDecayLabel")
+        self.roomDecayLabel.setGeometry(QRect(30, 60, 49, 16))
+        self.roomDecayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.roomPreDelayDisplay = QLCDNumber(roomTab)
+        self.roomPreDelayDisplay.setObjectName(u"roomPreDelayDisplay")
+        self.roomPreDelayDisplay.setGeometry(QRect(100, 80, 51, 23))
+        self.roomPreDelayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.roomPreDelayDial = QDial(roomTab)
+        self.roomPreDelayDial.setObjectName(u"roomPreDelayDial")
+        self.roomPreDelayDial.setGeometry(QRect(100, 0, 50, 64))
+        self.roomPreDelayDial.setAutoFillBackground(False)
+        self.roomPreDelayDial.setMaximum(100)
+        self.roomPreDelayDial.setWrapping(False)
+        self.roomPreDelayDial.setNotchesVisible(True)
+        self.roomPreDelayLabel = QLabel(roomTab)
+        self.roomPreDelayLabel.setObjectName(u"roomPreDelayLabel")
+        self.roomPreDelayLabel.setGeometry(QRect(88, 60, 71, 20))
+        self.roomPreDelayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.roomToneLabel = QLabel(roomTab)
+        self.roomToneLabel.setObjectName(u"roomToneLabel")
+        self.roomToneLabel.setGeometry(QRect(170, 60, 49, 16))
+        self.roomToneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.roomToneDial = QDial(roomTab)
+        self.roomToneDial.setObjectName(u"roomToneDial")
+        self.roomToneDial.setGeometry(QRect(170, 0, 50, 64))
+        self.roomToneDial.setAutoFillBackground(False)
+        self.roomToneDial.setMaximum(100)
+        self.roomToneDial.setWrapping(False)
+        self.roomToneDial.setNotchesVisible(True)
+        self.roomToneDisplay = QLCDNumber(roomTab)
+        self.roomToneDisplay.setObjectName(u"roomToneDisplay")
+        self.roomToneDisplay.setGeometry(QRect(170, 80, 51, 23))
+        self.roomToneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.roomLevelLabel = QLabel(roomTab)
+        self.roomLevelLabel.setObjectName(u"roomLevelLabel")
+        self.roomLevelLabel.setGeometry(QRect(240, 60, 49, 16))
+        self.roomLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.roomLevelDisplay = QLCDNumber(roomTab)
+        self.roomLevelDisplay.setObjectName(u"roomLevelDisplay")
+        self.roomLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
+        self.roomLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.roomLevelDial = QDial(roomTab)
+        self.roomLevelDial.setObjectName(u"roomLevelDial")
+        self.roomLevelDial.setGeometry(QRect(240, 0, 50, 64))
+        self.roomLevelDial.setAutoFillBackground(False)
+        self.roomLevelDial.setMaximum(100)
+        self.roomLevelDial.setWrapping(False)
+        self.roomLevelDial.setNotchesVisible(True)
+        self.roomHelpLabel = QLabel(roomTab)
+        self.roomHelpLabel.setObjectName(u"roomHelpLabel")
+        self.roomHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(roomTab)
+
+        QMetaObject.connectSlotsByName(roomTab)
+    # setupUi
+
+    def retranslateUi(self, roomTab):
+        self.roomDecayLabel.setText(QCoreApplication.translate("RoomTab", u"DECAY", None))
+        self.roomPreDelayLabel.setText(QCoreApplication.translate("RoomTab", u"PRE-DELAY", None))
+        self.roomToneLabel.setText(QCoreApplication.translate("RoomTab", u"TONE", None))
+        self.roomLevelLabel.setText(QCoreApplication.translate("RoomTab", u"LEVEL", None))
+#if QT_CONFIG(tooltip)
+        self.roomHelpLabel.setToolTip(QCoreApplication.translate("RoomTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Acoustic reflections of small to larger rooms</span></p><p align=\"center\"><img src=\":/Reverb_Room/resources/reverb/room.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.roomHelpLabel.setText(QCoreApplication.translate("RoomTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
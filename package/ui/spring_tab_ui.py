@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'spring_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QLCDNumber, QLabel,
+    QSizePolicy, QWidget)
+
+class Ui_SpringTab(object):
+    def setupUi(self, springTab):
+        if not springTab.objectName():
+            springTab.setObjectName(u"springTab")
+        springTab.resize(327, 113)
+        self.springLevelLabel = QLabel(springTab)
+        self.springLevelLabel.setObjectName(u"springLevelLabel")
+        self.springLevelLabel.setGeometry(QRect(240, 60, 49, 16))
+        self.springLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.springLevelDisplay = QLCDNumber(springTab)
+        self.springLevelDisplay.setObjectName(u"springLevelDisplay")
+        self.springLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
+        self.springLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.springPreDelayDisplay = QLCDNumber(springTab)
+        self.springPreDelayDisplay.setObjectName(u"springPreDelayDisplay")
+        self.springPreDelayDisplay.setGeometry(QRect(100, 80, 51, 23))
+        self.springPreDelayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.springPreDelayDial = QDial(springTab)
+        self.springPreDelayDial.setObjectName(u"springPreDelayDial")
+        self.springPreDelayDial.setGeometry(QRect(100, 0, 50, 64))
+        self.springPreDelayDial.setAutoFillBackground(False)
+        self.springPreDelayDial.setMaximum(100)
+        self.springPreDelayDial.setWrapping(False)
+        self.springPreDelayDial.setNotchesVisible(True)
+        self.springDecayDisplay = QLCDNumber(springTab)
+        self.springDecayDisplay.setObjectName(u"springDecayDisplay")
+        self.springDecayDisplay.setGeometry(QRect(30, 80, 51, 23))
+        self.springDecayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.springLevelDial = QDial(springTab)
+        self.springLevelDial.setObjectName(u"springLevelDial")
+        self.springLevelDial.setGeometry(QRect(240, 0, 50, 64))
+        self.springLevelDial.setAutoFillBackground(False)
+        self.springLevelDial.setMaximum(100)
+        self.springLevelDial.setWrapping(False)
+        self.springLevelDial.setNotchesVisible(True)
+        self.springDecayDial = QDial(springTab)
+        self.springDecayDial.setObjectName(u"springDecayDial")
+        self.springDecayDial.setGeometry(QRect(30, 0, 50, 64))
+        self.springDecayDial.setAutoFillBackground(False)
+        self.springDecayDial.setMaximum(100)
+        self.springDecayDial.setWrapping(False)
+        self.springDecayDial.setNotchesVisible(True)
+        self.springDecayLabel = QLabel(springTab)
+        self.springDecayLabel.setObjectName(u"springDecayLabel")
+        self.springDecayLabel.setGeometry(QRect(30, 60, 49, 16))
+        self.springDecayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.springPreDelayLabel = QLabel(springTab)
+        self.springPreDelayLabel.setObjectName(u"springPreDelayLabel")
+        self.springPreDelayLabel.setGeometry(QRect(88, 60, 71, 20))
+        self.springPreDelayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.springToneLabel = QLabel(springTab)
+        self.springToneLabel.setObjectName(u"springToneLabel")
+        self.springToneLabel.setGeometry(QRect(170, 60, 49, 16))
+        self.springToneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.springToneDisplay = QLCDNumber(springTab)
+        self.springToneDisplay.setObjectName(u"springToneDisplay")
+        self.springToneDisplay.setGeometry(QRect(170, 80, 51, 23))
+        self.springToneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.springToneDial = QDial(springTab)
+        self.springToneDial.setObjectName(u"springToneDial")
+        self.springToneDial.setGeometry(QRect(170, 0, 50, 64))
+        self.springToneDial.setAutoFillBackground(False)
+        self.springToneDial.setMaximum(100)
+        self.springToneDial.setWrapping(False)
+        self.springToneDial.setNotchesVisible(True)
+        self.springHelpLabel = QLabel(springTab)
+        self.springHelpLabel.setObjectName(u"springHelpLabel")
+        self.springHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(springTab)
+
+        QMetaObject.connectSlotsByName(springTab)
+    # setupUi
+
+    def retranslateUi(self, springTab):
+        self.springLevelLabel.setText(QCoreApplication.translate("SpringTab", u"LEVEL", None))
+        self.springDecayLabel.setText(QCoreApplication.translate("SpringTab", u"DECAY", None))
+        self.springPreDelayLabel.setText(QCoreApplication.translate("SpringTab", u"PRE-DELAY", None))
+        self.springToneLabel.setText(QCoreApplication.translate("SpringTab", u"TONE", None))
+#if QT_CONFIG(tooltip)
+        self.springHelpLabel.setToolTip(QCoreApplication.translate("SpringTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Vintage analog style reverb</span></p><p align=\"center\"><img src=\":/Reverb_Spring/resources/reverb/spring.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.springHelpLabel.setText(QCoreApplication.translate("SpringTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
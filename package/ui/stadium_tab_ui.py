@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'stadium_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QFrame, QLCDNumber,
+    QLabel, QSizePolicy, QWidget)
+
+class Ui_StadiumTab(object):
+    def setupUi(self, stadiumTab):
+        if not stadiumTab.objectName():
+            stadiumTab.setObjectName(u"stadiumTab")
+        stadiumTab.resize(327, 113)
+        self.stadiumDecayDisplay = QLCDNumber(stadiumTab)
+        self.stadiumDecayDisplay.setObjectName(u"stadiumDecayDisplay")
+        self.stadiumDecayDisplay.setGeometry(QRect(30, 80, 51, 23))
+        self.stadiumDecayDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.stadiumDecayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.stadiumToneLabel = QLabel(stadiumTab)
+        self.stadiumToneLabel.setObjectName(u"stadiumToneLabel")
+        self.stadiumToneLabel.setGeometry(QRect(170, 60, 49, 16))
+        self.stadiumToneLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.stadiumLevelLabel = QLabel(stadiumTab)
+        self.stadiumLevelLabel.setObjectName(u"stadiumLevelLabel")
+        self.stadiumLevelLabel.setGeometry(QRect(240, 60, 49, 16))
+        self.stadiumLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.stadiumLevelDial = QDial(stadiumTab)
+        self.stadiumLevelDial.setObjectName(u"stadiumLevelDial")
+        self.stadiumLevelDial.setGeometry(QRect(240, 0, 50, 64))
+        self.stadiumLevelDial.setAutoFillBackground(False)
+        self.stadiumLevelDial.setMaximum(100)
+        self.stadiumLevelDial.setWrapping(False)
+        self.stadiumLevelDial.setNotchesVisible(True)
+        self.stadiumPreDelayLabel = QLabel(stadiumTab)
+        self.stadiumPreDelayLabel.setObjectName(u"stadiumPreDelayLabel")
+        self.stadiumPreDelayLabel.setGeometry(QRect(88, 60, 71, 20))
+        self.stadiumPreDelayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.stadiumPreDelayDial = QDial(stadiumTab)
+        self.stadiumPreDelayDial.setObjectName(u"stadiumPreDelayDial")
+        self.stadiumPreDelayDial.setGeometry(QRect(100, 0, 50, 64))
+        self.stadiumPreDelayDial.setAutoFillBackground(False)
+        self.stadiumPreDelayDial.setMaximum(100)
+        self.stadiumPreDelayDial.setWrapping(False)
+        self.stadiumPreDelayDial.setNotchesVisible(True)
+        self.stadiumLevelDisplay = QLCDNumber(stadiumTab)
+        self.stadiumLevelDisplay.setObjectName(u"stadiumLevelDisplay")
+        self.stadiumLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
+        self.stadiumLevelDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.stadiumLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.stadiumToneDisplay = QLCDNumber(stadiumTab)
+        self.stadiumToneDisplay.setObjectName(u"stadiumToneDisplay")
+        self.stadiumToneDisplay.setGeometry(QRect(170, 80, 51, 23))
+        self.stadiumToneDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.stadiumToneDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.stadiumToneDial = QDial(stadiumTab)
+        self.stadiumToneDial.setObjectName(u"stadiumToneDial")
+        self.stadiumToneDial.setGeometry(QRect(170, 0, 50, 64))
+        self.stadiumToneDial.setAutoFillBackground(False)
+        self.stadiumToneDial.setMaximum(100)
+        self.stadiumToneDial.setWrapping(False)
+        self.stadiumToneDial.setNotchesVisible(True)
+        self.stadiumDecayDial = QDial(stadiumTab)
+        self.stadiumDecayDial.setObjectName(u"stadiumDecayDial")
+        self.stadiumDecayDial.setGeometry(QRect(30, 0, 50, 64))
+        self.stadiumDecayDial.setAutoFillBackground(False)
+        self.stadiumDecayDial.setMaximum(100)
+        self.stadiumDecayDial.setWrapping(False)
+        self.stadiumDecayDial.setNotchesVisible(True)
+        self.stadiumPreDelayDisplay = QLCDNumber(stadiumTab)
+        self.stadiumPreDelayDisplay.setObjectName(u"stadiumPreDelayDisplay")
+        self.stadiumPreDelayDisplay.setGeometry(QRect(100, 80, 51, 23))
+        self.stadiumPreDelayDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.stadiumPreDelayDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.stadiumDecayLabel = QLabel(stadiumTab)
+        self.stadiumDecayLabel.setObjectName(u"stadiumDecayLabel")
+        self.stadiumDecayLabel.setGeometry(QRect(30, 60, 49, 16))
+        self.stadiumDecayLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.stadiumHelpLabel = QLabel(stadiumTab)
+        self.stadiumHelpLabel.setObjectName(u"stadiumHelpLabel")
+        self.stadiumHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(stadiumTab)
+
+        QMetaObject.connectSlotsByName(stadiumTab)
+    # setupUi
+
+    def retranslateUi(self, stadiumTab):
+        self.stadiumToneLabel.setText(QCoreApplication.translate("StadiumTab", u"TONE", None))
+        self.stadiumLevelLabel.setText(QCoreApplication.translate("StadiumTab", u"LEVEL", None))
+        self.stadiumPreDelayLabel.setText(QCoreApplication.translate("StadiumTab", u"PRE-DELAY", None))
+        self.stadiumDecayLabel.setText(QCoreApplication.translate("StadiumTab", u"DECAY", None))
+#if QT_CONFIG(tooltip)
+        self.stadiumHelpLabel.setToolTip(QCoreApplication.translate("StadiumTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Acoustic reflections of a very large spcae</span></p><p align=\"center\"><img src=\":/Reverb_Stadium/resources/reverb/stadium.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.stadiumHelpLabel.setText(QCoreApplication.translate("StadiumTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'studio_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QLCDNumber, QLabel,
+    QSizePolicy, QWidget)
+
+class Ui_StudioTab(object):
+    def setupUi(self, studioTab):
+        if not studioTab.objectName():
+            studioTab.setObjectName(u"studioTab")
+        studioTab.resize(327, 113)
+        self.studioTimeDial = QDial(studioTab)
+        self.studioTimeDial.setObjectName(u"studioTimeDial")
+        self.studioTimeDial.setGeometry(QRect(30, 0, 50, 64))
+        self.studioTimeDial.setAutoFillBackground(False)
+        self.studioTimeDial.setMaximum(4000)
+        self.studioTimeDial.setWrapping(False)
+        self.studioTimeDial.setNotchesVisible(True)
+        self.studioTimeDisplay = QLCDNumber(studioTab)
+        self.studioTimeDisplay.setObjectName(u"studioTimeDisplay")
+        self.studioTimeDisplay.setGeometry(QRect(30, 80, 51, 23))
+        self.studioTimeDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.studioTimeLabel = QLabel(studioTab)
+        self.studioTimeLabel.setObjectName(u"studioTimeLabel")
+        self.studioTimeLabel.setGeometry(QRect(30, 60, 49, 16))
+        self.studioTimeLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.studioFeedbackDisplay = QLCDNumber(studioTab)
+        self.studioFeedbackDisplay.setObjectName(u"studioFeedbackDisplay")
+        self.studioFeedbackDisplay.setGeometry(QRect(100, 80, 51, 23))
+        self.studioFeedbackDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.studioFeedbackDial = QDial(studioTab)
+        self.studioFeedbackDial.setObjectName(u"studioFeedbackDial")
+        self.studioFeedbackDial.setGeometry(QRect(100, 0, 50, 64))
+        self.studioFeedbackDial.setAutoFillBackground(False)
+        self.studioFeedbackDial.setMaximum(100)
+        self.studioFeedbackDial.setWrapping(False)
+        self.studioFeedbackDial.setNotchesVisible(True)
+        self.studioFeedbackLabel = QLabel(studioTab)
+        self.studioFeedbackLabel.setObjectName(u"studioFeedbackLabel")
+        self.studioFeedbackLabel.setGeometry(QRect(88, 60, 71, 20))
+        self.studioFeedbackLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.studioFreqLabel = QLabel(studioTab)
+        self.studioFreqLabel.setObjectName(u"studioFreqLabel")
+        self.studioFreqLabel.setGeometry(QRect(170, 60, 49, 16))
+        self.studioFreqLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.studioFreqDial = QDial(studioTab)
+        self.studioFreqDial.setObjectName(u"studioFreqDial")
+        self.studioFreqDial.setGeometry(QRect(170, 0, 50, 64))
+        self.studioFreqDial.setAutoFillBackground(False)
+        self.studioFreqDial.setMaximum(100)
+        self.studioFreqDial.setWrapping(False)
+        self.studioFreqDial.setNotchesVisible(True)
+        self.studioFreqDisplay = QLCDNumber(studioTab)
+        self.studioFreqDisplay.setObjectName(u"studioFreqDisplay")
+        self.studioFreqDisplay.setGeometry(QRect(170, 80, 51, 23))
+        self.studioFreqDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.studioLevelLabel = QLabel(studioTab)
+        self.studioLevelLabel.setObjectName(u"studioLevelLabel")
+        self.studioLevelLabel.setGeometry(QRect(240, 60, 49, 16))
+        self.studioLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.studioLevelDisplay = QLCDNumber(studioTab)
+        self.studioLevelDisplay.setObjectName(u"studioLevelDisplay")
+        self.studioLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
+        self.studioLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.studioLevelDial = QDial(studioTab)
+        self.studioLevelDial.setObjectName(u"studioLevelDial")
+        self.studioLevelDial.setGeometry(QRect(240, 0, 50, 64))
+        self.studioLevelDial.setAutoFillBackground(False)
+        self.studioLevelDial.setMaximum(100)
+        self.studioLevelDial.setWrapping(False)
+        self.studioLevelDial.setNotchesVisible(True)
+        self.studioHelpLabel = QLabel(studioTab)
+        self.studioHelpLabel.setObjectName(u"studioHelpLabel")
+        self.studioHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(studioTab)
+
+        QMetaObject.connectSlotsByName(studioTab)
+    # setupUi
+
+    def retranslateUi(self, studioTab):
+        self.studioTimeLabel.setText(QCoreApplication.translate("StudioTab", u"TIME", None))
+        self.studioFeedbackLabel.setText(QCoreApplication.translate("StudioTab", u"FEEDBACK", None))
+        self.studioFreqLabel.setText(QCoreApplication.translate("StudioTab", u"FREQ", None))
+        self.studioLevelLabel.setText(QCoreApplication.translate("StudioTab", u"LEVEL", None))
+#if QT_CONFIG(tooltip)
+        self.studioHelpLabel.setToolTip(QCoreApplication.translate("StudioTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">High fidelity delay</span></p><p align=\"center\"><img src=\":/Delay_Studio/resources/delay/studio.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.studioHelpLabel.setText(QCoreApplication.translate("StudioTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
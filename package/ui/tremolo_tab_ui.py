@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'tremolo_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QFrame, QLCDNumber,
+    QLabel, QListWidget, QListWidgetItem, QSizePolicy,
+    QWidget)
+
+class Ui_TremoloTab(object):
+    def setupUi(self, tremoloTab):
+        if not tremoloTab.objectName():
+            tremoloTab.setObjectName(u"tremoloTab")
+        tremoloTab.resize(327, 113)
+        self.tremoloSkewLabel = QLabel(tremoloTab)
+        self.tremoloSkewLabel.setObjectName(u"tremoloSkewLabel")
+        self.tremoloSkewLabel.setGeometry(QRect(250, 60, 49, 16))
+        self.tremoloSkewLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.tremoloSpeedDial = QDial(tremoloTab)
+        self.tremoloSpeedDial.setObjectName(u"tremoloSpeedDial")
+        self.tremoloSpeedDial.setGeometry(QRect(110, 0, 50, 64))
+        self.tremoloSpeedDial.setAutoFillBackground(False)
+        self.tremoloSpeedDial.setMaximum(100)
+        self.tremoloSpeedDial.setWrapping(False)
+        self.tremoloSpeedDial.setNotchesVisible(True)
+        self.tremoloSpeedLabel = QLabel(tremoloTab)
+        self.tremoloSpeedLabel.setObjectName(u"tremoloSpeedLabel")
+        self.tremoloSpeedLabel.setGeometry(QRect(110, 60, 49, 16))
+        self.tremoloSpeedLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.tremoloSkewDial = QDial(tremoloTab)
+        self.tremoloSkewDial.setObjectName(u"tremoloSkewDial")
+        self.tremoloSkewDial.setGeometry(QRect(250, 0, 50, 64))
+        self.tremoloSkewDial.setAutoFillBackground(False)
+        self.tremoloSkewDial.setMinimum(-50)
+        self.tremoloSkewDial.setMaximum(50)
+        self.tremoloSkewDial.setWrapping(False)
+        self.tremoloSkewDial.setNotchesVisible(True)
+        self.tremoloSkewDisplay = QLCDNumber(tremoloTab)
+        self.tremoloSkewDisplay.setObjectName(u"tremoloSkewDisplay")
+        self.tremoloSkewDisplay.setGeometry(QRect(250, 80, 51, 23))
+        self.tremoloSkewDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.tremoloSkewDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.tremoloSpeedDisplay = QLCDNumber(tremoloTab)
+        self.tremoloSpeedDisplay.setObjectName(u"tremoloSpeedDisplay")
+        self.tremoloSpeedDisplay.setGeometry(QRect(110, 80, 51, 23))
+        self.tremoloSpeedDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.tremoloSpeedDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.tremoloDepthLabel = QLabel(tremoloTab)
+        self.tremoloDepthLabel.setObjectName(u"tremoloDepthLabel")
+        self.tremoloDepthLabel.setGeometry(QRect(170, 60, 71, 20))
+        self.tremoloDepthLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.tremoloDepthDisplay = QLCDNumber(tremoloTab)
+        self.tremoloDepthDisplay.setObjectName(u"tremoloDepthDisplay")
+        self.tremoloDepthDisplay.setGeometry(QRect(180, 80, 51, 23))
+        self.tremoloDepthDisplay.setFrameShadow(QFrame.Shadow.Raised)
+        self.tremoloDepthDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.tremoloModeList = QListWidget(tremoloTab)
+        font = QFont()
+        font.setPointSize(12)
+        __qlistwidgetitem = QListWidgetItem(self.tremoloModeList)
+        __qlistwidgetitem.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem.setFont(font);
+        __qlistwidgetitem1 = QListWidgetItem(self.tremoloModeList)
+        __qlistwidgetitem1.setTextAlignment(Qt.AlignCenter);
+        __qlistwidgetitem1.setFont(font);
+        self.tremoloModeList.setObjectName(u"tremoloModeList")
+        self.tremoloModeList.setGeometry(QRect(20, 30, 51, 51))
+        self.tremoloModeList.setUniformItemSizes(False)
+        self.tremoloModeList.setSelectionRectVisible(False)
+        self.tremoloDepthDial = QDial(tremoloTab)
+        self.tremoloDepthDial.setObjectName(u"tremoloDepthDial")
+        self.tremoloDepthDial.setGeometry(QRect(180, 0, 50, 64))
+        self.tremoloDepthDial.setAutoFillBackground(False)
+        self.tremoloDepthDial.setMaximum(100)
+        self.tremoloDepthDial.setWrapping(False)
+        self.tremoloDepthDial.setNotchesVisible(True)
+        self.tremoloHelpLabel = QLabel(tremoloTab)
+        self.tremoloHelpLabel.setObjectName(u"tremoloHelpLabel")
+        self.tremoloHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(tremoloTab)
+
+        QMetaObject.connectSlotsByName(tremoloTab)
+    # setupUi
+
+    def retranslateUi(self, tremoloTab):
+        self.tremoloSkewLabel.setText(QCoreApplication.translate("TremoloTab", u"SKEW", None))
+        self.tremoloSpeedLabel.setText(QCoreApplication.translate("TremoloTab", u"SPEED", None))
+        self.tremoloDepthLabel.setText(QCoreApplication.translate("TremoloTab", u"DEPTH", None))
+
+        __sortingEnabled = self.tremoloModeList.isSortingEnabled()
+        self.tremoloModeList.setSortingEnabled(False)
+        ___qlistwidgetitem = self.tremoloModeList.item(0)
+        ___qlistwidgetitem.setText(QCoreApplication.translate("TremoloTab", u"VLV", None));
+        ___qlistwidgetitem1 = self.tremoloModeList.item(1)
+        ___qlistwidgetitem1.setText(QCoreApplication.translate("TremoloTab", u"SQR", None));
+        self.tremoloModeList.setSortingEnabled(__sortingEnabled)
+
+#if QT_CONFIG(tooltip)
+        self.tremoloHelpLabel.setToolTip(QCoreApplication.translate("TremoloTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Valve / Square Wave</span></p><p align=\"center\"><img src=\":/Modulation_Tremolo/resources/modulation/tremolo.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.tremoloHelpLabel.setText(QCoreApplication.translate("TremoloTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+
@@ -17,13 +17,14 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QApplication, QDialog, QGraphicsView, QLabel,
     QSizePolicy, QWidget)
-import package.ui.resources_rc
+
+from package.tuner_history import TunerHistoryWidget
 
 class Ui_Dialog(object):
     def setupUi(self, Dialog):
         if not Dialog.objectName():
             Dialog.setObjectName(u"Dialog")
-        Dialog.resize(500, 400)
+        Dialog.resize(500, 480)
         icon = QIcon()
         icon.addFile(u":/code50amp/resources/code50.png", QSize(), QIcon.Mode.Normal, QIcon.State.On)
         Dialog.setWindowIcon(icon)
@@ -40,6 +41,9 @@ class Ui_Dialog(object):
         self.tunerGraphicsView = QGraphicsView(Dialog)
         self.tunerGraphicsView.setObjectName(u"tunerGraphicsView")
         self.tunerGraphicsView.setGeometry(QRect(0, 125, 500, 250))
+        self.tunerHistoryWidget = TunerHistoryWidget(Dialog)
+        self.tunerHistoryWidget.setObjectName(u"tunerHistoryWidget")
+        self.tunerHistoryWidget.setGeometry(QRect(0, 380, 500, 90))
 
         self.retranslateUi(Dialog)
 
@@ -49,5 +53,8 @@ class Ui_Dialog(object):
     def retranslateUi(self, Dialog):
         Dialog.setWindowTitle(QCoreApplication.translate("Dialog", u"Tuner", None))
         self.tunerLabel.setText(QCoreApplication.translate("Dialog", u"E", None))
+#if QT_CONFIG(tooltip)
+        self.tunerHistoryWidget.setToolTip(QCoreApplication.translate("Dialog", u"Tuning accuracy over the last few seconds", None))
+#endif // QT_CONFIG(tooltip)
     # retranslateUi
 
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'vintage_tab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDial, QLCDNumber, QLabel,
+    QSizePolicy, QWidget)
+
+class Ui_VintageTab(object):
+    def setupUi(self, vintageTab):
+        if not vintageTab.objectName():
+            vintageTab.setObjectName(u"vintageTab")
+        vintageTab.resize(327, 113)
+        self.vintageLevelLabel = QLabel(vintageTab)
+        self.vintageLevelLabel.setObjectName(u"vintageLevelLabel")
+        self.vintageLevelLabel.setGeometry(QRect(240, 60, 49, 16))
+        self.vintageLevelLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.vintageAgeDisplay = QLCDNumber(vintageTab)
+        self.vintageAgeDisplay.setObjectName(u"vintageAgeDisplay")
+        self.vintageAgeDisplay.setGeometry(QRect(100, 80, 51, 23))
+        self.vintageAgeDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.vintageTimeDisplay = QLCDNumber(vintageTab)
+        self.vintageTimeDisplay.setObjectName(u"vintageTimeDisplay")
+        self.vintageTimeDisplay.setGeometry(QRect(30, 80, 51, 23))
+        self.vintageTimeDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.vintageAgeLabel = QLabel(vintageTab)
+        self.vintageAgeLabel.setObjectName(u"vintageAgeLabel")
+        self.vintageAgeLabel.setGeometry(QRect(88, 60, 71, 20))
+        self.vintageAgeLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.vintageFreqDial = QDial(vintageTab)
+        self.vintageFreqDial.setObjectName(u"vintageFreqDial")
+        self.vintageFreqDial.setGeometry(QRect(170, 0, 50, 64))
+        self.vintageFreqDial.setAutoFillBackground(False)
+        self.vintageFreqDial.setMaximum(100)
+        self.vintageFreqDial.setWrapping(False)
+        self.vintageFreqDial.setNotchesVisible(True)
+        self.vintageTimeLabel = QLabel(vintageTab)
+        self.vintageTimeLabel.setObjectName(u"vintageTimeLabel")
+        self.vintageTimeLabel.setGeometry(QRect(30, 60, 49, 16))
+        self.vintageTimeLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.vintageLevelDisplay = QLCDNumber(vintageTab)
+        self.vintageLevelDisplay.setObjectName(u"vintageLevelDisplay")
+        self.vintageLevelDisplay.setGeometry(QRect(240, 80, 51, 23))
+        self.vintageLevelDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.vintageLevelDial = QDial(vintageTab)
+        self.vintageLevelDial.setObjectName(u"vintageLevelDial")
+        self.vintageLevelDial.setGeometry(QRect(240, 0, 50, 64))
+        self.vintageLevelDial.setAutoFillBackground(False)
+        self.vintageLevelDial.setMaximum(100)
+        self.vintageLevelDial.setWrapping(False)
+        self.vintageLevelDial.setNotchesVisible(True)
+        self.vintageFreqLabel = QLabel(vintageTab)
+        self.vintageFreqLabel.setObjectName(u"vintageFreqLabel")
+        self.vintageFreqLabel.setGeometry(QRect(170, 60, 49, 16))
+        self.vintageFreqLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.vintageTimeDial = QDial(vintageTab)
+        self.vintageTimeDial.setObjectName(u"vintageTimeDial")
+        self.vintageTimeDial.setGeometry(QRect(30, 0, 50, 64))
+        self.vintageTimeDial.setAutoFillBackground(False)
+        self.vintageTimeDial.setMaximum(4000)
+        self.vintageTimeDial.setWrapping(False)
+        self.vintageTimeDial.setNotchesVisible(True)
+        self.vintageFreqDisplay = QLCDNumber(vintageTab)
+        self.vintageFreqDisplay.setObjectName(u"vintageFreqDisplay")
+        self.vintageFreqDisplay.setGeometry(QRect(170, 80, 51, 23))
+        self.vintageFreqDisplay.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+        self.vintageAgeDial = QDial(vintageTab)
+        self.vintageAgeDial.setObjectName(u"vintageAgeDial")
+        self.vintageAgeDial.setGeometry(QRect(100, 0, 50, 64))
+        self.vintageAgeDial.setAutoFillBackground(False)
+        self.vintageAgeDial.setMaximum(100)
+        self.vintageAgeDial.setWrapping(False)
+        self.vintageAgeDial.setNotchesVisible(True)
+        self.vintageHelpLabel = QLabel(vintageTab)
+        self.vintageHelpLabel.setObjectName(u"vintageHelpLabel")
+        self.vintageHelpLabel.setGeometry(QRect(300, 10, 21, 21))
+
+        self.retranslateUi(vintageTab)
+
+        QMetaObject.connectSlotsByName(vintageTab)
+    # setupUi
+
+    def retranslateUi(self, vintageTab):
+        self.vintageLevelLabel.setText(QCoreApplication.translate("VintageTab", u"LEVEL", None))
+        self.vintageAgeLabel.setText(QCoreApplication.translate("VintageTab", u"AGE", None))
+        self.vintageTimeLabel.setText(QCoreApplication.translate("VintageTab", u"TIME", None))
+        self.vintageFreqLabel.setText(QCoreApplication.translate("VintageTab", u"FREQ", None))
+#if QT_CONFIG(tooltip)
+        self.vintageHelpLabel.setToolTip(QCoreApplication.translate("VintageTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:14pt;\">Analog style delay</span></p><p align=\"center\"><img src=\":/Delay_Vintage/resources/delay/vintage.png\"/></p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.vintageHelpLabel.setText(QCoreApplication.translate("VintageTab", u"<html><head/><body><p align=\"center\"><span style=\" font-size:11pt; font-weight:700;\">?</span></p></body></html>", None))
+        pass
+    # retranslateUi
+